@@ -0,0 +1 @@
+"""HTTP API (Flask) - nginx가 /futsal/api/ 경로를 이 서버로 프록시"""
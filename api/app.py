@@ -0,0 +1,70 @@
+"""API 서버 (Flask)
+
+실행: python -m api.app
+(앱 실행 시 자동 시작되며, 포트가 이미 사용 중이면 새 프로세스는 바로 종료됩니다)
+"""
+import sys
+import logging
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from flask import Flask, jsonify
+
+from config.settings import upload_api_config
+from api.uploads import uploads_bp
+from services.cache_warmup import cache_warmup
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def create_app() -> Flask:
+    """Flask 앱 생성"""
+    app = Flask(__name__)
+
+    # 요청 1회 본문 크기 상한 (조각 크기 제한 - 전체 파일 크기는 업로드 생성 시 검증)
+    app.config['MAX_CONTENT_LENGTH'] = upload_api_config.MAX_CHUNK_SIZE
+
+    app.register_blueprint(uploads_bp, url_prefix=upload_api_config.URL_PREFIX)
+
+    @app.route(f"{upload_api_config.URL_PREFIX}/health")
+    def health():
+        # 앱 프로세스의 캐시 예열 상태 (상태 파일 기준 - API 응답 자체는 예열과 무관하게 가능)
+        warmup = cache_warmup.read_state()
+        return jsonify({
+            'status': 'ok',
+            'cache_ready': warmup['ready'],
+            'cache_warmup': {key: warmup.get(key) for key in ('status', 'started_at', 'finished_at', 'failed')}
+        })
+
+    return app
+
+
+def start_api_process() -> Optional[subprocess.Popen]:
+    """API 서버를 별도 프로세스로 실행"""
+    if not upload_api_config.AUTOSTART:
+        return None
+
+    try:
+        return subprocess.Popen(
+            [sys.executable, '-m', 'api.app'],
+            cwd=str(PROJECT_ROOT),
+            start_new_session=True
+        )
+    except OSError as e:
+        logger.error(f"Failed to start upload API: {e}")
+        return None
+
+
+def main():
+    """CLI 진입점"""
+    from database.migrations import init_complete_db
+
+    init_complete_db()
+    create_app().run(host=upload_api_config.HOST, port=upload_api_config.PORT, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
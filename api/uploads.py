@@ -0,0 +1,127 @@
+"""이어올리기 업로드 엔드포인트 (tus 1.0 핵심 흐름: 생성 / 조각 전송 / 상태 확인)
+
+POST  /uploads          Upload-Ticket, Upload-Length, Upload-Metadata(filename) → 201 + Location
+PATCH /uploads/<id>     Upload-Offset + application/offset+octet-stream 본문 → 204 + Upload-Offset
+HEAD  /uploads/<id>     → 200 + Upload-Offset, Upload-Length
+
+X-Upload-Status: uploading / finalizing(다른 요청이 등록 중) / completed(X-Video-Id 포함)
+"""
+import base64
+import binascii
+from typing import Dict, Any, Optional
+
+from flask import Blueprint, Response, request, url_for
+
+from services.resumable_upload_service import resumable_upload_service
+
+TUS_VERSION = '1.0.0'
+
+# 서비스 오류 종류 → HTTP 상태 코드
+STATUS_CODES = {
+    'not_found': 404,
+    'expired': 410,
+    'conflict': 409,
+    'duplicate': 422,  # 이미 등록된 동영상 - 409(오프셋 불일치)와 구분해 클라이언트가 메시지를 표시
+    'invalid': 400,
+    'server': 500,
+}
+
+uploads_bp = Blueprint('uploads', __name__)
+
+
+def _parse_metadata(header: str) -> Dict[str, str]:
+    """Upload-Metadata 헤더 파싱 ("key base64value,key2 base64value2")"""
+    metadata = {}
+    for pair in filter(None, (item.strip() for item in header.split(','))):
+        key, _, encoded = pair.partition(' ')
+        try:
+            metadata[key] = base64.b64decode(encoded).decode('utf-8') if encoded else ''
+        except (binascii.Error, UnicodeDecodeError):
+            continue
+    return metadata
+
+
+def _parse_int_header(name: str) -> Optional[int]:
+    """정수 헤더 값 (없거나 잘못된 값이면 None)"""
+    value = request.headers.get(name, '')
+    return int(value) if value.isdigit() else None
+
+
+def _upload_response(result: Dict[str, Any], status: int) -> Response:
+    """업로드 상태를 헤더에 담은 응답"""
+    response = Response(status=status)
+    response.headers['Tus-Resumable'] = TUS_VERSION
+    response.headers['Cache-Control'] = 'no-store'
+
+    upload = result['upload']
+    if upload:
+        response.headers['Upload-Offset'] = str(upload['upload_offset'])
+        if upload['upload_length'] is not None:
+            response.headers['Upload-Length'] = str(upload['upload_length'])
+        response.headers['X-Upload-Status'] = upload['status']
+        if upload['video_id']:
+            response.headers['X-Video-Id'] = str(upload['video_id'])
+
+    if not result['success']:
+        response.set_data(result['message'])
+        response.mimetype = 'text/plain'
+    return response
+
+
+def _error_response(result: Dict[str, Any]) -> Response:
+    return _upload_response(result, STATUS_CODES.get(result['reason'], 400))
+
+
+def _bad_request(message: str) -> Response:
+    return _upload_response({'success': False, 'message': message, 'upload': None}, 400)
+
+
+@uploads_bp.route('/uploads', methods=['POST'])
+def create_upload():
+    """업로드 생성"""
+    upload_id = request.headers.get('Upload-Ticket', '')
+    upload_length = _parse_int_header('Upload-Length')
+    filename = _parse_metadata(request.headers.get('Upload-Metadata', '')).get('filename')
+
+    if not upload_id or upload_length is None or not filename:
+        return _bad_request('Upload-Ticket, Upload-Length, Upload-Metadata(filename) 헤더가 필요합니다.')
+
+    result = resumable_upload_service.create_upload(upload_id, filename, upload_length)
+    if not result['success']:
+        return _error_response(result)
+
+    response = _upload_response(result, 201)
+    response.headers['Location'] = url_for('uploads.upload_status', upload_id=upload_id)
+    return response
+
+
+@uploads_bp.route('/uploads/<upload_id>', methods=['HEAD'])
+def upload_status(upload_id: str):
+    """업로드 진행 위치 확인"""
+    result = resumable_upload_service.get_status(upload_id)
+    if not result['success']:
+        # HEAD 응답에는 본문을 싣지 않음
+        response = _error_response(result)
+        response.set_data(b'')
+        return response
+    return _upload_response(result, 200)
+
+
+@uploads_bp.route('/uploads/<upload_id>', methods=['PATCH'])
+def append_chunk(upload_id: str):
+    """조각 전송"""
+    if request.mimetype != 'application/offset+octet-stream':
+        return _upload_response(
+            {'success': False, 'message': 'Content-Type: application/offset+octet-stream 이 필요합니다.',
+             'upload': None},
+            415
+        )
+
+    offset = _parse_int_header('Upload-Offset')
+    if offset is None:
+        return _bad_request('Upload-Offset 헤더가 필요합니다.')
+
+    result = resumable_upload_service.append_chunk(upload_id, offset, request.stream, request.content_length)
+    if not result['success']:
+        return _error_response(result)
+    return _upload_response(result, 204)
@@ -9,29 +9,15 @@ import logging
 # 설정 import
 from config.settings import ui_config
 
-# 페이지 import
-from ui.pages import (
-    dashboard_page,
-    schedule_page,
-    players_page,
-    statistics_page,
-    attendance_page,
-    news_page,
-    gallery_page,
-    finance_page,
-    admin_settings,
-    video_upload,
-    video_gallery,
-    news_management,
-    video_logs,
-    team_builder
-)
+# 페이지 레지스트리 (페이지 모듈은 처음 열 때 import)
+from ui.pages.registry import render_page
 
 # 인증 컴포넌트 import
 from ui.components.auth import render_admin_dropdown
 from utils.auth_utils import is_admin_logged_in
 
 # 데이터베이스 초기화
+# (워커/API/캐시 예열 모듈은 아래 st.cache_resource 함수 안에서 import - 스크립트 실행마다 불러오지 않음)
 from database.migrations import init_complete_db
 
 # 페이지 설정
@@ -512,7 +498,7 @@ def initialize_session_state():
     if 'current_page' not in st.session_state:
         st.session_state['current_page'] = "dashboard"
 
-    # 만료된 세션 파일 정리 (성능상 가끔씩만 실행)
+    # 만료된 관리자 세션 정리 (성능상 가끔씩만 실행)
     import random
     if random.randint(1, 100) <= 5:  # 5% 확률로 실행
         from utils.session_utils import cleanup_expired_sessions
@@ -541,6 +527,7 @@ def get_available_pages():
         "📰 소식 관리": "news_management",
         "📊 비디오 로그": "video_logs",
         "⚙️ 관리자 설정": "admin_settings",
+        "🩺 시스템 진단": "diagnostics",
     }
 
     if is_admin_logged_in():
@@ -596,6 +583,7 @@ def get_page_display_name(page_name):
         "video_upload": "동영상 업로드",
         "video_logs": "비디오 로그",
         "admin_settings": "관리자 설정",
+        "diagnostics": "시스템 진단",
     }
     return page_names.get(page_name, page_name)
 
@@ -619,35 +607,7 @@ def render_main_content():
     normalized_page = page_mapping.get(current_page, current_page)
 
     try:
-        if normalized_page == "dashboard":
-            dashboard_page.render()
-        elif normalized_page == "statistics":
-            statistics_page.render()
-        elif normalized_page == "attendance":
-            attendance_page.render()
-        elif normalized_page == "news":
-            news_page.render()
-        elif normalized_page == "gallery":
-            gallery_page.render()
-        elif normalized_page == "video_gallery":
-            video_gallery.render_video_gallery_page()
-        elif normalized_page == "schedule":
-            schedule_page.render()
-        elif normalized_page == "players":
-            players_page.render()
-        elif normalized_page == "finance":
-            finance_page.render()
-        elif normalized_page == "news_management":
-            news_management.news_management_page.render()
-        elif normalized_page == "video_upload":
-            video_upload.render_video_upload_page()
-        elif normalized_page == "video_logs":
-            video_logs.render_video_logs_page()
-        elif normalized_page == "admin_settings":
-            admin_settings.render()
-        elif normalized_page == "team_builder":
-            team_builder.render()
-        else:
+        if not render_page(normalized_page):
             st.error(f"알 수 없는 페이지: {current_page}")
             logger.warning(f"Unknown page requested: {current_page}")
 
@@ -689,12 +649,40 @@ def check_database():
             st.error(f"데이터베이스 초기화 실패: {e}")
             logger.error(f"Database initialization failed: {e}")
 
+@st.cache_resource
+def start_video_worker():
+    """동영상 트랜스코딩 워커 실행 (서버 프로세스당 1회)"""
+    from services.video_worker import start_worker_process
+    return start_worker_process()
+
+@st.cache_resource
+def start_upload_api():
+    """이어올리기 업로드 API 서버 실행 (서버 프로세스당 1회)"""
+    from api.app import start_api_process
+    return start_api_process()
+
+@st.cache_resource
+def start_cache_warmup():
+    """대시보드/공개 페이지 캐시 예열 (서버 프로세스당 1회, 백그라운드 스레드)"""
+    from services.cache_warmup import cache_warmup
+    from ui.utils.cached_services import get_warmup_tasks
+    return cache_warmup.start(get_warmup_tasks())
+
 def main():
     """메인 애플리케이션"""
 
     # 데이터베이스 초기화 (최초 1회만)
     check_database()
 
+    # 캐시 예열 (첫 요청을 기다리게 하지 않음)
+    start_cache_warmup()
+
+    # 동영상 변환 백그라운드 워커 실행
+    start_video_worker()
+
+    # 대용량 이어올리기 API 서버 실행
+    start_upload_api()
+
     # 세션 상태 초기화
     initialize_session_state()
 
@@ -9,6 +9,20 @@ class DatabaseConfig:
     DB_PATH: str = "team_platform.db"
     BACKUP_PATH: str = "backups/"
 
+    # 커넥션 풀 설정
+    POOL_MAX_SIZE: int = 8  # 동시에 열어둘 수 있는 최대 연결 수
+    POOL_TIMEOUT: float = 10.0  # 풀이 가득 찼을 때 대기할 최대 시간 (초)
+    POOL_MAX_IDLE_SECONDS: float = 300.0  # 유휴 연결 자동 종료 시간 (초)
+    POOL_HEALTH_CHECK_INTERVAL: float = 30.0  # 유휴 후 재사용 시 헬스체크 주기 (초)
+
+    # 연결 생성 시 적용할 PRAGMA 프로파일
+    JOURNAL_MODE: str = "WAL"  # 읽기와 쓰기가 서로 막지 않도록 WAL 사용
+    SYNCHRONOUS: str = "NORMAL"  # WAL 모드에서 안전하면서 fsync 횟수 감소
+    BUSY_TIMEOUT_MS: int = 5000  # 잠금 충돌 시 바로 실패하지 않고 대기할 시간 (ms)
+    CACHE_SIZE_KB: int = 16384  # 연결별 페이지 캐시 크기 (KB)
+    MMAP_SIZE: int = 128 * 1024 * 1024  # 메모리 매핑 I/O 크기 (bytes, 0이면 비활성화)
+    TEMP_STORE: str = "MEMORY"  # 임시 테이블/인덱스 저장 위치 (DEFAULT, FILE, MEMORY)
+
 @dataclass
 class AppConfig:
     """앱 전반 설정"""
@@ -50,6 +64,95 @@ class AppConfig:
         # 로깅 설정
         logging.basicConfig(level=getattr(logging, self.LOG_LEVEL))
 
+@dataclass
+class VideoWorkerConfig:
+    """동영상 트랜스코딩 워커 설정"""
+    CPU_BUDGET: int = 0  # 워커가 사용할 코어 수 (0이면 CPU 코어 수)
+    MAX_CONCURRENT_JOBS: int = 0  # 동시에 실행할 ffmpeg 작업 수 (0이면 코어 예산의 절반)
+    FFMPEG_THREADS: int = 0  # 작업당 ffmpeg 스레드 수 (0이면 코어 예산 / 동시 작업 수)
+    POLL_INTERVAL: float = 2.0  # 대기열 조회 주기 (초)
+    PROGRESS_INTERVAL: float = 2.0  # 진행률 DB 기록 최소 간격 (초)
+    STALL_WARNING_SECONDS: int = 60  # 진행률 갱신이 이 시간 이상 없으면 멈춤 의심 표시
+    MAX_ATTEMPTS: int = 3  # 실패 시 최대 시도 횟수
+    RETRY_BASE_DELAY: int = 30  # 재시도 대기 시간 기준값 (초, 시도마다 2배)
+    RETRY_MAX_DELAY: int = 900  # 재시도 대기 시간 상한 (초)
+    LOCK_FILE: str = "uploads/.video_worker.lock"  # 워커 단일 실행 보장용 잠금 파일
+    AUTOSTART: bool = True  # 앱 실행 시 워커 프로세스 자동 시작
+
+    def __post_init__(self):
+        if self.CPU_BUDGET <= 0:
+            self.CPU_BUDGET = int(os.getenv("VIDEO_WORKER_CPUS", "0")) or os.cpu_count() or 1
+
+        if self.MAX_CONCURRENT_JOBS <= 0:
+            self.MAX_CONCURRENT_JOBS = int(os.getenv("VIDEO_WORKER_JOBS", "0")) or max(1, self.CPU_BUDGET // 2)
+
+        if self.FFMPEG_THREADS <= 0:
+            self.FFMPEG_THREADS = max(1, self.CPU_BUDGET // self.MAX_CONCURRENT_JOBS)
+
+        self.AUTOSTART = os.getenv("VIDEO_WORKER_AUTOSTART", "1") != "0"
+
+@dataclass
+class ImageDerivativeConfig:
+    """갤러리 사진 파생 이미지(썸네일/중간 크기/WebP) 설정"""
+    THUMB_WIDTH: int = 640  # 갤러리 그리드/대시보드용 (2열 그리드 고해상도 화면 기준)
+    MEDIUM_WIDTH: int = 1600  # 크게 보기용
+    JPEG_QUALITY: int = 82
+    WEBP_QUALITY: int = 80
+    WORKERS: int = 0  # 파생 이미지 생성 스레드 수 (0이면 CPU 코어 수, 최대 4)
+
+    def __post_init__(self):
+        if self.WORKERS <= 0:
+            self.WORKERS = int(os.getenv("IMAGE_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+
+@dataclass
+class UploadApiConfig:
+    """이어올리기(재개 가능한 분할 업로드) API 설정"""
+    HOST: str = "0.0.0.0"
+    PORT: int = 8502  # nginx가 /futsal/api/ 를 이 포트로 프록시
+    URL_PREFIX: str = "/futsal/api"
+    MAX_CHUNK_SIZE: int = 64 * 1024 * 1024  # PATCH 요청 1회 최대 크기 (bytes)
+    CLIENT_CHUNK_SIZE: int = 8 * 1024 * 1024  # 브라우저가 한 번에 보내는 크기 (bytes)
+    TICKET_TTL_HOURS: int = 24  # 업로드 티켓/미완료 업로드 유효 시간 (마지막 전송 기준)
+    FINALIZE_STALE_MINUTES: int = 30  # 완료 처리(해시/등록)가 이 시간 넘게 끝나지 않으면 중단된 것으로 보고 다시 처리
+    AUTOSTART: bool = True  # 앱 실행 시 API 서버 프로세스 자동 시작
+
+    def __post_init__(self):
+        self.PORT = int(os.getenv("UPLOAD_API_PORT", str(self.PORT)))
+        self.AUTOSTART = os.getenv("UPLOAD_API_AUTOSTART", "1") != "0"
+
+@dataclass
+class AuthConfig:
+    """관리자 로그인(비밀번호 검증) 설정"""
+    VERIFY_WORKERS: int = 0  # bcrypt 검증 스레드 수 (0이면 CPU 코어 수의 절반, 최대 2)
+    VERIFY_QUEUE_SIZE: int = 8  # 동시에 대기/실행할 수 있는 검증 요청 수 (초과 시 바로 거절)
+    VERIFY_TIMEOUT: float = 10.0  # 검증 결과 대기 시간 (초)
+    MAX_FAILED_ATTEMPTS: int = 5  # 사용자별 허용 실패 횟수 (ATTEMPT_WINDOW_SECONDS 안에서)
+    ATTEMPT_WINDOW_SECONDS: int = 300
+    LOCKOUT_SECONDS: int = 300  # 실패 횟수 초과 시 검증을 건너뛰는 시간
+    CACHE_TTL_SECONDS: int = 300  # 최근 검증 성공 결과 메모리 캐시 유지 시간
+    CACHE_MAX_ENTRIES: int = 256
+
+    def __post_init__(self):
+        if self.VERIFY_WORKERS <= 0:
+            self.VERIFY_WORKERS = int(os.getenv("AUTH_VERIFY_WORKERS", "0")) or max(1, min(2, (os.cpu_count() or 1) // 2))
+
+@dataclass
+class SharedCacheConfig:
+    """프로세스 간 공유 캐시 설정 (집계 결과를 디스크 SQLite 파일에 저장)"""
+    PATH: str = "cache/shared_cache.db"
+    MAX_ENTRIES: int = 512  # 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    MAX_BYTES: int = 32 * 1024 * 1024  # 저장된 값 전체 크기 상한
+    DEFAULT_TTL_SECONDS: int = 86400  # 테이블 버전이 같아도 이 시간이 지나면 다시 계산
+    TOUCH_INTERVAL_SECONDS: int = 60  # 조회 시 마지막 사용 시각 갱신 최소 간격 (매 조회마다 쓰지 않도록)
+    ENABLED: bool = True
+    WARMUP_STATE_PATH: str = "cache/warmup_state.json"  # 시작 시 캐시 예열 상태 (API 헬스체크에서도 조회)
+    WARMUP_ENABLED: bool = True
+
+    def __post_init__(self):
+        self.PATH = os.getenv("SHARED_CACHE_PATH", self.PATH)
+        self.ENABLED = os.getenv("SHARED_CACHE_ENABLED", "1") != "0"
+        self.WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "1") != "0"
+
 @dataclass
 class UIConfig:
     """UI 관련 설정"""
@@ -65,4 +168,9 @@ class UIConfig:
 # 설정 인스턴스 생성
 db_config = DatabaseConfig()
 app_config = AppConfig()
-ui_config = UIConfig()
\ No newline at end of file
+ui_config = UIConfig()
+video_worker_config = VideoWorkerConfig()
+upload_api_config = UploadApiConfig()
+image_derivative_config = ImageDerivativeConfig()
+auth_config = AuthConfig()
+shared_cache_config = SharedCacheConfig()
\ No newline at end of file
@@ -1,34 +1,310 @@
 """데이터베이스 연결 관리"""
 import sqlite3
 import logging
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Generator, List, Optional, Any
+from typing import Generator, List, Optional, Any, Dict, Deque, Tuple, Callable
 from config.settings import db_config
 
 logger = logging.getLogger(__name__)
 
+# PRAGMA 값은 파라미터 바인딩이 불가능하므로 허용 목록으로만 구성
+_JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+_SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+_TEMP_STORES = ('DEFAULT', 'FILE', 'MEMORY')
+
+
+def _choice(value: str, allowed: tuple, name: str) -> str:
+    """허용 목록에 있는 PRAGMA 값만 반환"""
+    normalized = str(value).upper()
+    if normalized not in allowed:
+        raise ValueError(f"Invalid {name}: {value} (allowed: {', '.join(allowed)})")
+    return normalized
+
+
+def build_pragma_profile() -> Dict[str, Any]:
+    """DatabaseConfig 기반 연결 초기화 PRAGMA 프로파일"""
+    return {
+        'journal_mode': _choice(db_config.JOURNAL_MODE, _JOURNAL_MODES, 'JOURNAL_MODE'),
+        'synchronous': _choice(db_config.SYNCHRONOUS, _SYNCHRONOUS_LEVELS, 'SYNCHRONOUS'),
+        'busy_timeout': int(db_config.BUSY_TIMEOUT_MS),
+        'cache_size': -abs(int(db_config.CACHE_SIZE_KB)),  # 음수 = KB 단위
+        'mmap_size': int(db_config.MMAP_SIZE),
+        'temp_store': _choice(db_config.TEMP_STORE, _TEMP_STORES, 'TEMP_STORE'),
+    }
+
+
+def apply_pragmas(conn: sqlite3.Connection, profile: Dict[str, Any]) -> None:
+    """연결에 PRAGMA 프로파일 적용"""
+    # busy_timeout을 먼저 적용해야 journal_mode 변경 시 잠금 충돌도 대기함
+    for name in ('busy_timeout', 'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store'):
+        value = profile[name]
+        row = conn.execute(f"PRAGMA {name} = {value}").fetchone()
+
+        # journal_mode는 실제 적용된 모드를 반환 (예: 메모리 DB는 WAL 불가)
+        if name == 'journal_mode' and row and str(row[0]).upper() != value:
+            logger.warning(f"journal_mode={value} requested but SQLite kept {row[0]}")
+
+
+class ConnectionPool:
+    """스레드 인지형 SQLite 커넥션 풀
+
+    - 최대 연결 수(max_size)를 넘으면 timeout 동안 반납을 기다림
+    - 같은 스레드 안에서 중첩 호출 시 이미 대여한 연결을 재사용
+    - 오래 쉬었던 연결은 재사용 전에 헬스체크(SELECT 1)
+    - max_idle_seconds 이상 유휴 상태인 연결은 자동 종료
+    """
+
+    def __init__(self, db_path: str, max_size: int, timeout: float,
+                 max_idle_seconds: float, health_check_interval: float,
+                 initializer: Optional[Callable[[sqlite3.Connection], None]] = None,
+                 connect_timeout: float = 5.0):
+        self.db_path = db_path
+        self.initializer = initializer
+        self.connect_timeout = connect_timeout
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_interval = health_check_interval
+
+        # (연결, 마지막 반납 시각) - 오른쪽이 가장 최근에 반납된 연결 (LIFO 재사용)
+        self._idle: Deque[Tuple[sqlite3.Connection, float]] = deque()
+        self._cond = threading.Condition()
+        self._total = 0  # 열려 있는 연결 수 (사용 중 + 유휴)
+        self._local = threading.local()
+        self._stats = {
+            'created': 0,
+            'reused': 0,
+            'closed': 0,
+            'evicted_idle': 0,
+            'health_check_failures': 0,
+            'waits': 0,
+            'timeouts': 0,
+        }
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """새 SQLite 연결 생성"""
+        # 스레드 간 반납/재사용을 위해 check_same_thread 해제 (동시 사용은 풀이 막음)
+        conn = sqlite3.connect(self.db_path, timeout=self.connect_timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+
+        if self.initializer:
+            try:
+                self.initializer(conn)
+            except sqlite3.Error:
+                conn.close()
+                raise
+
+        return conn
+
+    def _close_quietly(self, conn: sqlite3.Connection) -> None:
+        """연결 종료 (오류 무시)"""
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Error closing pooled connection: {e}")
+
+    def _evict_idle_locked(self, now: float) -> None:
+        """유휴 시간이 초과된 연결 정리 (락 보유 상태에서 호출)"""
+        while self._idle and now - self._idle[0][1] > self.max_idle_seconds:
+            conn, _ = self._idle.popleft()
+            self._close_quietly(conn)
+            self._total -= 1
+            self._stats['evicted_idle'] += 1
+            self._stats['closed'] += 1
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        """연결 헬스체크"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Pooled connection failed health check: {e}")
+            return False
+
+    def _acquire(self) -> sqlite3.Connection:
+        """풀에서 연결 대여"""
+        deadline = time.monotonic() + self.timeout
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._evict_idle_locked(now)
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    self._stats['reused'] += 1
+                    break
+
+                if self._total < self.max_size:
+                    self._total += 1
+                    conn, last_used = None, now
+                    break
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise sqlite3.OperationalError(
+                        f"Connection pool exhausted ({self.max_size} connections in use)"
+                    )
+
+                self._stats['waits'] += 1
+                self._cond.wait(remaining)
+
+        if conn is None:
+            return self._open_reserved()
+
+        # 오래 쉬었던 연결은 재사용 전에 확인
+        if time.monotonic() - last_used > self.health_check_interval and not self._is_healthy(conn):
+            self._close_quietly(conn)
+            with self._cond:
+                self._stats['health_check_failures'] += 1
+                self._stats['closed'] += 1
+            return self._open_reserved()
+
+        return conn
+
+    def _open_reserved(self) -> sqlite3.Connection:
+        """예약된 슬롯에 새 연결 생성 (실패 시 슬롯 반환)"""
+        try:
+            conn = self._create_connection()
+        except sqlite3.Error:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._stats['created'] += 1
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """연결 반납"""
+        try:
+            # 커밋되지 않은 트랜잭션이 다음 사용자에게 넘어가지 않도록 정리
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+            self._close_quietly(conn)
+            with self._cond:
+                self._total -= 1
+                self._stats['closed'] += 1
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """연결 대여 컨텍스트 매니저 (같은 스레드의 중첩 호출은 동일 연결 공유)"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._release(conn)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계 조회"""
+        with self._cond:
+            stats = dict(self._stats)
+            idle = len(self._idle)
+            stats.update({
+                'max_size': self.max_size,
+                'open': self._total,
+                'idle': idle,
+                'in_use': self._total - idle,
+            })
+        return stats
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 종료 (사용 중인 연결은 반납 시 풀로 돌아옴)"""
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close_quietly(conn)
+                self._total -= 1
+                self._stats['closed'] += 1
+            self._cond.notify_all()
+
+
 class DatabaseManager:
     """데이터베이스 연결 및 쿼리 실행 관리"""
 
+    # PRAGMA 조회 결과(정수)를 설정값 표기로 변환
+    _SYNCHRONOUS_NAMES = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+    _TEMP_STORE_NAMES = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+
     def __init__(self, db_path: str = None):
         self.db_path = db_path or db_config.DB_PATH
+        self.pragma_profile = build_pragma_profile()
+        self._pool: Optional[ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """커넥션 풀 (최초 사용 시 생성)"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self.db_path,
+                        max_size=db_config.POOL_MAX_SIZE,
+                        timeout=db_config.POOL_TIMEOUT,
+                        max_idle_seconds=db_config.POOL_MAX_IDLE_SECONDS,
+                        health_check_interval=db_config.POOL_HEALTH_CHECK_INTERVAL,
+                        initializer=self._initialize_connection,
+                        connect_timeout=self.pragma_profile['busy_timeout'] / 1000,
+                    )
+        return self._pool
+
+    def _initialize_connection(self, conn: sqlite3.Connection) -> None:
+        """새 연결에 PRAGMA 프로파일 적용"""
+        apply_pragmas(conn, self.pragma_profile)
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """안전한 데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        except sqlite3.Error as e:
-            logger.error(f"Database error: {e}")
-            if conn:
+        """안전한 데이터베이스 연결 컨텍스트 매니저 (커넥션 풀 사용)"""
+        with self.pool.connection() as conn:
+            try:
+                yield conn
+            except sqlite3.Error as e:
+                logger.error(f"Database error: {e}")
                 conn.rollback()
-            raise
-        finally:
-            if conn:
-                conn.close()
+                raise
+
+    @contextmanager
+    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (BEGIN IMMEDIATE)
+
+        블록 안에서는 conn.execute()를 사용합니다.
+        execute_query()는 같은 연결을 공유하면서 즉시 커밋하므로 섞어 쓰지 않습니다.
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
     def execute_query(self, query: str, params: tuple = None, fetch_all: bool = True) -> Optional[Any]:
         """안전한 쿼리 실행"""
@@ -56,5 +332,41 @@ class DatabaseManager:
             logger.error(f"Query execution error: {e}")
             return None
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계 조회"""
+        return self.pool.get_stats()
+
+    def get_pragma_report(self) -> List[Dict[str, Any]]:
+        """설정된 PRAGMA와 실제 연결에 적용된 값 비교
+
+        Returns:
+            [{'pragma': 이름, 'configured': 설정값, 'active': 실제값, 'applied': 일치 여부}, ...]
+        """
+        report = []
+        with self.get_connection() as conn:
+            for name, configured in self.pragma_profile.items():
+                row = conn.execute(f"PRAGMA {name}").fetchone()
+                active = row[0] if row else None
+
+                if name == 'synchronous':
+                    active = self._SYNCHRONOUS_NAMES.get(active, active)
+                elif name == 'temp_store':
+                    active = self._TEMP_STORE_NAMES.get(active, active)
+                elif name == 'journal_mode' and active is not None:
+                    active = str(active).upper()
+
+                report.append({
+                    'pragma': name,
+                    'configured': configured,
+                    'active': active,
+                    'applied': active == configured,
+                })
+        return report
+
+    def close_all_connections(self) -> None:
+        """풀의 유휴 연결 모두 종료"""
+        if self._pool is not None:
+            self._pool.close_all()
+
 # 전역 데이터베이스 매니저 인스턴스
-db_manager = DatabaseManager()
\ No newline at end of file
+db_manager = DatabaseManager()
@@ -1,249 +1,587 @@
-"""데이터베이스 마이그레이션 및 초기화"""
+"""데이터베이스 마이그레이션 및 초기화
+
+스키마 변경은 MIGRATIONS 목록에 (버전, 설명, 함수) 형태로 순서대로 추가합니다.
+적용된 버전은 schema_version 테이블과 PRAGMA user_version에 기록되며,
+user_version이 최신이면 프로세스당 한 번의 PRAGMA 조회만으로 초기화를 건너뜁니다.
+"""
 import sqlite3
 import logging
+import threading
 from contextlib import contextmanager
+from typing import Callable, List, Tuple
 from config.settings import db_config
+from database.connection import apply_pragmas, build_pragma_profile
 
 logger = logging.getLogger(__name__)
 
+# 이 프로세스에서 마이그레이션이 끝난 DB 경로
+_migrated_db_paths = set()
+_migration_lock = threading.Lock()
+
 @contextmanager
 def get_db_connection():
-    """안전한 데이터베이스 연결 컨텍스트 매니저"""
+    """안전한 데이터베이스 연결 컨텍스트 매니저 (트랜잭션은 직접 관리)"""
     conn = None
     try:
-        conn = sqlite3.connect(db_config.DB_PATH)
+        conn = sqlite3.connect(db_config.DB_PATH, isolation_level=None)
         conn.row_factory = sqlite3.Row
+        apply_pragmas(conn, build_pragma_profile())
         yield conn
     except sqlite3.Error as e:
         logger.error(f"Database error: {e}")
-        if conn:
+        if conn and conn.in_transaction:
             conn.rollback()
         raise
     finally:
         if conn:
             conn.close()
 
-def init_complete_db():
-    """완전한 데이터베이스 초기화"""
-    with get_db_connection() as conn:
-        cur = conn.cursor()
-
-        # 플레이어 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS players(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                position TEXT,
-                phone TEXT,
-                email TEXT,
-                active INTEGER DEFAULT 1,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-
-        # 필드 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS fields(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                address TEXT,
-                cost INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-
-        # 경기 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS matches(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                field_id INTEGER NOT NULL,
-                match_date TEXT NOT NULL,
-                match_time TEXT NOT NULL,
-                opponent TEXT DEFAULT '',
-                result TEXT DEFAULT '',
-                attendance_lock_minutes INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(field_id) REFERENCES fields(id)
-            );
-        """)
-
-        # 기존 테이블에 attendance_lock_minutes 컬럼 추가 (마이그레이션)
-        try:
-            cur.execute("ALTER TABLE matches ADD COLUMN attendance_lock_minutes INTEGER NOT NULL DEFAULT 0")
-            logger.info("Added attendance_lock_minutes column to matches table")
-        except sqlite3.OperationalError as e:
-            # 컬럼이 이미 존재하는 경우 무시
-            if "duplicate column" in str(e).lower():
-                logger.info("attendance_lock_minutes column already exists")
-            else:
-                raise
+def _column_exists(cur, table: str, column: str) -> bool:
+    """테이블에 컬럼이 있는지 확인"""
+    cur.execute(f"PRAGMA table_info({table})")
+    return any(row['name'] == column for row in cur.fetchall())
+
+def _migration_001_base_tables(cur):
+    """기본 테이블 및 인덱스 생성"""
+    # 플레이어 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS players(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            position TEXT,
+            phone TEXT,
+            email TEXT,
+            active INTEGER DEFAULT 1,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    # 필드 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS fields(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            address TEXT,
+            cost INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
 
-        # 경기별 참석 정원 컬럼 추가 (마이그레이션)
+    # 경기 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS matches(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            field_id INTEGER NOT NULL,
+            match_date TEXT NOT NULL,
+            match_time TEXT NOT NULL,
+            opponent TEXT DEFAULT '',
+            result TEXT DEFAULT '',
+            attendance_lock_minutes INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(field_id) REFERENCES fields(id)
+        );
+    """)
+
+    # 출석 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS attendance(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            match_id INTEGER NOT NULL,
+            player_id INTEGER NOT NULL,
+            status TEXT CHECK(status IN ('present','absent','pending')) DEFAULT 'absent',
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            FOREIGN KEY(player_id) REFERENCES players(id),
+            UNIQUE(match_id, player_id)
+        );
+    """)
+
+    # 선수 통계 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS player_stats(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            player_id INTEGER NOT NULL,
+            match_id INTEGER NOT NULL,
+            goals INTEGER DEFAULT 0,
+            assists INTEGER DEFAULT 0,
+            saves INTEGER DEFAULT 0,
+            yellow_cards INTEGER DEFAULT 0,
+            red_cards INTEGER DEFAULT 0,
+            mvp INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(player_id) REFERENCES players(id),
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            UNIQUE(player_id, match_id)
+        );
+    """)
+
+    # 팀 소식/공지 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS news(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            author TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            pinned INTEGER DEFAULT 0,
+            category TEXT DEFAULT 'general'
+        );
+    """)
+
+    # 사진 갤러리 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS gallery(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            file_path TEXT NOT NULL,
+            upload_date TEXT DEFAULT CURRENT_TIMESTAMP,
+            match_id INTEGER DEFAULT NULL,
+            FOREIGN KEY(match_id) REFERENCES matches(id)
+        );
+    """)
+
+    # 팀 재정 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS finances(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            description TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            type TEXT CHECK(type IN ('income','expense')) NOT NULL,
+            category TEXT DEFAULT 'match',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    # 관리자 테이블
+    create_admins_table(cur)
+
+    # 동영상 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS videos(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            original_filename TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            duration INTEGER DEFAULT NULL,
+            status TEXT CHECK(status IN ('pending','processing','completed','failed')) DEFAULT 'pending',
+            hls_path TEXT DEFAULT NULL,
+            thumbnail_path TEXT DEFAULT NULL,
+            match_id INTEGER DEFAULT NULL,
+            uploaded_by INTEGER DEFAULT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            processed_at TEXT DEFAULT NULL,
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            FOREIGN KEY(uploaded_by) REFERENCES admins(id)
+        );
+    """)
+
+    # 비디오 재생 로그 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS video_logs(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            video_id INTEGER NOT NULL,
+            level TEXT CHECK(level IN ('info','warn','error')) DEFAULT 'info',
+            event_type TEXT NOT NULL,
+            message TEXT NOT NULL,
+            details TEXT DEFAULT NULL,
+            user_agent TEXT DEFAULT NULL,
+            ip_address TEXT DEFAULT NULL,
+            timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+            url TEXT DEFAULT NULL,
+            FOREIGN KEY(video_id) REFERENCES videos(id)
+        );
+    """)
+
+    # 비디오 로그 인덱스 (빠른 조회를 위해)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_video_logs_video_id
+        ON video_logs(video_id);
+    """)
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_video_logs_timestamp
+        ON video_logs(timestamp DESC);
+    """)
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_video_logs_level
+        ON video_logs(level);
+    """)
+
+    # 출석 인덱스 (참석자 수 카운트 최적화)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_attendance_match_status
+        ON attendance(match_id, status);
+    """)
+
+    # 팀 구성 테이블
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS team_distributions(
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            match_id INTEGER NOT NULL,
+            team_data TEXT NOT NULL,
+            created_by INTEGER,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            FOREIGN KEY(created_by) REFERENCES admins(id),
+            UNIQUE(match_id)
+        );
+    """)
+
+def _migration_002_match_lock_minutes(cur):
+    """matches.attendance_lock_minutes 컬럼 추가"""
+    if not _column_exists(cur, 'matches', 'attendance_lock_minutes'):
+        cur.execute("ALTER TABLE matches ADD COLUMN attendance_lock_minutes INTEGER NOT NULL DEFAULT 0")
+        logger.info("Added attendance_lock_minutes column to matches table")
+
+def _migration_003_match_capacity(cur):
+    """matches.attendance_capacity 컬럼 추가"""
+    if not _column_exists(cur, 'matches', 'attendance_capacity'):
+        cur.execute("ALTER TABLE matches ADD COLUMN attendance_capacity INTEGER DEFAULT NULL")
+        logger.info("Added attendance_capacity column to matches table")
+
+def _migration_004_sample_data(cur):
+    """초기 샘플 데이터 삽입"""
+    create_sample_data(cur)
+
+def _migration_005_match_date_indexes(cur):
+    """경기 날짜/구장 조회용 인덱스"""
+    # 월별/다음/최근 경기 쿼리의 WHERE + ORDER BY (match_date, match_time)를 한 인덱스로 처리
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_matches_date_time
+        ON matches(match_date, match_time)
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_matches_field_id
+        ON matches(field_id)
+    """)
+
+def _migration_006_video_job_queue(cur):
+    """videos 테이블을 트랜스코딩 작업 대기열로 사용하기 위한 컬럼/인덱스"""
+    columns = [
+        ("original_path", "TEXT DEFAULT NULL"),
+        ("attempts", "INTEGER NOT NULL DEFAULT 0"),
+        ("next_attempt_at", "TEXT DEFAULT NULL"),
+        ("locked_at", "TEXT DEFAULT NULL"),
+        ("last_error", "TEXT DEFAULT NULL"),
+    ]
+    for column, definition in columns:
+        if not _column_exists(cur, 'videos', column):
+            cur.execute(f"ALTER TABLE videos ADD COLUMN {column} {definition}")
+            logger.info(f"Added {column} column to videos table")
+
+    # 워커의 다음 작업 조회 (status = 'pending' AND next_attempt_at <= now)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_videos_status_next_attempt
+        ON videos(status, next_attempt_at)
+    """)
+
+def _migration_007_video_progress(cur):
+    """videos 트랜스코딩 진행률 컬럼 추가"""
+    columns = [
+        ("progress_stage", "TEXT DEFAULT NULL"),
+        ("progress_percent", "REAL DEFAULT NULL"),
+        ("progress_speed", "REAL DEFAULT NULL"),
+        ("progress_eta_seconds", "INTEGER DEFAULT NULL"),
+        ("progress_updated_at", "TEXT DEFAULT NULL"),
+    ]
+    for column, definition in columns:
+        if not _column_exists(cur, 'videos', column):
+            cur.execute(f"ALTER TABLE videos ADD COLUMN {column} {definition}")
+            logger.info(f"Added {column} column to videos table")
+
+def _migration_008_video_media_info(cur):
+    """videos 해상도/화면비/fps/코덱 컬럼 추가 (갤러리에서 썸네일을 열지 않도록)"""
+    columns = [
+        ("width", "INTEGER DEFAULT NULL"),
+        ("height", "INTEGER DEFAULT NULL"),
+        ("aspect_ratio", "REAL DEFAULT NULL"),
+        ("fps", "REAL DEFAULT NULL"),
+        ("codec", "TEXT DEFAULT NULL"),
+    ]
+    for column, definition in columns:
+        if not _column_exists(cur, 'videos', column):
+            cur.execute(f"ALTER TABLE videos ADD COLUMN {column} {definition}")
+            logger.info(f"Added {column} column to videos table")
+
+def _migration_009_video_gallery_indexes(cur):
+    """동영상 갤러리 키셋 페이지네이션/경기 필터용 인덱스"""
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_videos_status_created
+        ON videos(status, created_at DESC, id DESC)
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_videos_match_status
+        ON videos(match_id, status)
+    """)
+
+def _migration_010_video_preview_vtt(cur):
+    """videos 탐색 미리보기(스프라이트 시트 WebVTT) 경로 컬럼 추가"""
+    if not _column_exists(cur, 'videos', 'preview_vtt_path'):
+        cur.execute("ALTER TABLE videos ADD COLUMN preview_vtt_path TEXT DEFAULT NULL")
+        logger.info("Added preview_vtt_path column to videos table")
+
+def _migration_011_video_uploads(cur):
+    """이어올리기 업로드 세션 테이블 (관리자 페이지에서 발급한 티켓 → 분할 전송 → 동영상 등록)"""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS video_uploads(
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            match_id INTEGER DEFAULT NULL,
+            uploaded_by INTEGER DEFAULT NULL,
+            original_filename TEXT DEFAULT NULL,
+            upload_length INTEGER DEFAULT NULL,
+            upload_offset INTEGER NOT NULL DEFAULT 0,
+            status TEXT CHECK(status IN ('ticket','uploading','completed','expired')) DEFAULT 'ticket',
+            video_id INTEGER DEFAULT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            expires_at TEXT NOT NULL,
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            FOREIGN KEY(uploaded_by) REFERENCES admins(id),
+            FOREIGN KEY(video_id) REFERENCES videos(id)
+        );
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_video_uploads_status_expires
+        ON video_uploads(status, expires_at)
+    """)
+
+def _migration_012_media_blobs(cur):
+    """콘텐츠 해시(SHA-256) 인덱스 - 같은 내용의 사진/동영상 중복 저장·변환 방지, 참조 카운트로 공유 파일 관리"""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS media_blobs(
+            sha256 TEXT PRIMARY KEY,
+            kind TEXT CHECK(kind IN ('photo','video')) NOT NULL,
+            file_path TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            owner_video_id INTEGER DEFAULT NULL,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    for table in ('videos', 'gallery'):
+        if not _column_exists(cur, table, 'content_sha256'):
+            cur.execute(f"ALTER TABLE {table} ADD COLUMN content_sha256 TEXT DEFAULT NULL")
+            logger.info(f"Added content_sha256 column to {table} table")
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_videos_content_sha256
+        ON videos(content_sha256)
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_gallery_content_sha256
+        ON gallery(content_sha256)
+    """)
+
+def _migration_013_gallery_paging(cur):
+    """갤러리 키셋 페이지네이션/경기 필터 인덱스 및 파일 존재 여부 캐시 컬럼"""
+    if not _column_exists(cur, 'gallery', 'file_exists'):
+        cur.execute("ALTER TABLE gallery ADD COLUMN file_exists INTEGER NOT NULL DEFAULT 1")
+        logger.info("Added file_exists column to gallery table")
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_gallery_upload_date
+        ON gallery(upload_date DESC, id DESC)
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_gallery_match_upload_date
+        ON gallery(match_id, upload_date DESC, id DESC)
+    """)
+
+def _migration_014_admin_sessions(cur):
+    """관리자 세션 테이블 (/tmp JSON 파일 대신 - 세션 ID PK 조회, 만료 인덱스로 정리)"""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS admin_sessions(
+            session_id TEXT PRIMARY KEY,
+            admin_id INTEGER NOT NULL,
+            admin_username TEXT NOT NULL,
+            admin_name TEXT NOT NULL,
+            admin_role TEXT DEFAULT 'admin',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            expires_at TEXT NOT NULL,
+            FOREIGN KEY(admin_id) REFERENCES admins(id)
+        );
+    """)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_admin_sessions_expires
+        ON admin_sessions(expires_at)
+    """)
+
+# 공유 캐시가 의존하는 테이블 (변경 시 트리거로 table_versions 버전 증가)
+VERSIONED_TABLES = ('players', 'player_stats', 'matches', 'attendance', 'fields', 'finances', 'news')
+
+
+def _migration_015_table_versions(cur):
+    """테이블 버전 테이블 및 변경 트리거 (프로세스 간 공유 캐시 검증용)"""
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS table_versions(
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;
+    """)
+
+    for table in VERSIONED_TABLES:
+        cur.execute(
+            "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES (?, 0)", (table,)
+        )
+        # 트리거 본문은 바인딩 불가 - 코드에 정의된 테이블 이름만 사용
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cur.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';
+                END
+            """)
+
+def _migration_016_video_upload_finalizing(cur):
+    """video_uploads.status에 'finalizing' 추가 (완료 처리 선점 - CHECK 제약 변경은 테이블 재생성)"""
+    cur.execute("""
+        CREATE TABLE video_uploads_new(
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT '',
+            match_id INTEGER DEFAULT NULL,
+            uploaded_by INTEGER DEFAULT NULL,
+            original_filename TEXT DEFAULT NULL,
+            upload_length INTEGER DEFAULT NULL,
+            upload_offset INTEGER NOT NULL DEFAULT 0,
+            status TEXT CHECK(status IN ('ticket','uploading','finalizing','completed','expired')) DEFAULT 'ticket',
+            video_id INTEGER DEFAULT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            expires_at TEXT NOT NULL,
+            FOREIGN KEY(match_id) REFERENCES matches(id),
+            FOREIGN KEY(uploaded_by) REFERENCES admins(id),
+            FOREIGN KEY(video_id) REFERENCES videos(id)
+        );
+    """)
+    cur.execute("""
+        INSERT INTO video_uploads_new (
+            id, title, description, match_id, uploaded_by, original_filename, upload_length,
+            upload_offset, status, video_id, created_at, updated_at, expires_at
+        )
+        SELECT id, title, description, match_id, uploaded_by, original_filename, upload_length,
+               upload_offset, status, video_id, created_at, updated_at, expires_at
+        FROM video_uploads
+    """)
+    cur.execute("DROP TABLE video_uploads")
+    cur.execute("ALTER TABLE video_uploads_new RENAME TO video_uploads")
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_video_uploads_status_expires
+        ON video_uploads(status, expires_at)
+    """)
+
+def _migration_017_video_queue_backfill(cur):
+    """마이그레이션 6 이전에 pending이던 동영상을 대기열에 등록 (next_attempt_at이 NULL이면 워커가 가져가지 않음)"""
+    # original_path는 비워 둠 - 워커가 video_id + 원본 확장자 경로로 찾음
+    cur.execute("""
+        UPDATE videos
+        SET next_attempt_at = CURRENT_TIMESTAMP
+        WHERE status = 'pending' AND next_attempt_at IS NULL
+    """)
+    if cur.rowcount > 0:
+        logger.info(f"Queued {cur.rowcount} pending videos created before the job queue")
+
+# (버전, 설명, 적용 함수) - 버전은 1부터 빈틈 없이 증가, 적용된 항목은 수정하지 말 것
+MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (1, "기본 테이블 및 인덱스 생성", _migration_001_base_tables),
+    (2, "matches.attendance_lock_minutes 컬럼 추가", _migration_002_match_lock_minutes),
+    (3, "matches.attendance_capacity 컬럼 추가", _migration_003_match_capacity),
+    (4, "초기 샘플 데이터 삽입", _migration_004_sample_data),
+    (5, "matches 날짜/구장 인덱스 추가", _migration_005_match_date_indexes),
+    (6, "videos 트랜스코딩 작업 대기열 컬럼 추가", _migration_006_video_job_queue),
+    (7, "videos 트랜스코딩 진행률 컬럼 추가", _migration_007_video_progress),
+    (8, "videos 해상도/화면비/fps/코덱 컬럼 추가", _migration_008_video_media_info),
+    (9, "videos 갤러리 조회 인덱스 추가", _migration_009_video_gallery_indexes),
+    (10, "videos.preview_vtt_path 컬럼 추가", _migration_010_video_preview_vtt),
+    (11, "video_uploads 이어올리기 테이블 추가", _migration_011_video_uploads),
+    (12, "media_blobs 콘텐츠 해시 테이블 추가", _migration_012_media_blobs),
+    (13, "gallery 페이지네이션 인덱스 및 file_exists 컬럼 추가", _migration_013_gallery_paging),
+    (14, "admin_sessions 관리자 세션 테이블 추가", _migration_014_admin_sessions),
+    (15, "table_versions 테이블 및 변경 트리거 추가", _migration_015_table_versions),
+    (16, "video_uploads 완료 처리 중(finalizing) 상태 추가", _migration_016_video_upload_finalizing),
+    (17, "작업 대기열 도입 전 pending 동영상 대기열 등록", _migration_017_video_queue_backfill),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn) -> int:
+    """현재 DB 스키마 버전 (PRAGMA user_version)"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def run_migrations(conn) -> int:
+    """미적용 마이그레이션을 순서대로 적용
+
+    Returns:
+        적용된 마이그레이션 개수
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version(
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    applied = 0
+    for version, description, migrate in MIGRATIONS:
+        # 다른 프로세스와 동시에 실행되지 않도록 쓰기 잠금을 잡은 뒤 버전 재확인
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            cur.execute("ALTER TABLE matches ADD COLUMN attendance_capacity INTEGER DEFAULT NULL")
-            logger.info("Added attendance_capacity column to matches table")
-        except sqlite3.OperationalError as e:
-            # 컬럼이 이미 존재하는 경우 무시
-            if "duplicate column" in str(e).lower():
-                logger.info("attendance_capacity column already exists")
+            if get_schema_version(conn) >= version:
+                conn.execute("COMMIT")
+                continue
+
+            cur = conn.cursor()
+            migrate(cur)
+            cur.execute(
+                "INSERT OR REPLACE INTO schema_version (version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            # PRAGMA 값은 바인딩 불가 - 코드에 정의된 정수 버전만 사용
+            cur.execute(f"PRAGMA user_version = {int(version)}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            logger.error(f"Migration {version} ({description}) failed", exc_info=True)
+            raise
+
+        applied += 1
+        logger.info(f"Applied migration {version}: {description}")
+
+    return applied
+
+def init_complete_db():
+    """데이터베이스 초기화 (프로세스당 1회, 최신 버전이면 즉시 반환)"""
+    db_path = db_config.DB_PATH
+    if db_path in _migrated_db_paths:
+        return
+
+    with _migration_lock:
+        if db_path in _migrated_db_paths:
+            return
+
+        with get_db_connection() as conn:
+            current_version = get_schema_version(conn)
+            if current_version >= LATEST_SCHEMA_VERSION:
+                logger.info(f"Database schema is up to date (version {current_version})")
             else:
-                raise
-
-        # 출석 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS attendance(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                match_id INTEGER NOT NULL,
-                player_id INTEGER NOT NULL,
-                status TEXT CHECK(status IN ('present','absent','pending')) DEFAULT 'absent',
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(match_id) REFERENCES matches(id),
-                FOREIGN KEY(player_id) REFERENCES players(id),
-                UNIQUE(match_id, player_id)
-            );
-        """)
-
-        # 선수 통계 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS player_stats(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                player_id INTEGER NOT NULL,
-                match_id INTEGER NOT NULL,
-                goals INTEGER DEFAULT 0,
-                assists INTEGER DEFAULT 0,
-                saves INTEGER DEFAULT 0,
-                yellow_cards INTEGER DEFAULT 0,
-                red_cards INTEGER DEFAULT 0,
-                mvp INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(player_id) REFERENCES players(id),
-                FOREIGN KEY(match_id) REFERENCES matches(id),
-                UNIQUE(player_id, match_id)
-            );
-        """)
-
-        # 팀 소식/공지 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS news(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                author TEXT NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                pinned INTEGER DEFAULT 0,
-                category TEXT DEFAULT 'general'
-            );
-        """)
-
-        # 사진 갤러리 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS gallery(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT DEFAULT '',
-                file_path TEXT NOT NULL,
-                upload_date TEXT DEFAULT CURRENT_TIMESTAMP,
-                match_id INTEGER DEFAULT NULL,
-                FOREIGN KEY(match_id) REFERENCES matches(id)
-            );
-        """)
-
-        # 팀 재정 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS finances(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                description TEXT NOT NULL,
-                amount INTEGER NOT NULL,
-                type TEXT CHECK(type IN ('income','expense')) NOT NULL,
-                category TEXT DEFAULT 'match',
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-
-        # 관리자 테이블
-        create_admins_table(cur)
-
-        # 동영상 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS videos(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT DEFAULT '',
-                original_filename TEXT NOT NULL,
-                file_size INTEGER NOT NULL,
-                duration INTEGER DEFAULT NULL,
-                status TEXT CHECK(status IN ('pending','processing','completed','failed')) DEFAULT 'pending',
-                hls_path TEXT DEFAULT NULL,
-                thumbnail_path TEXT DEFAULT NULL,
-                match_id INTEGER DEFAULT NULL,
-                uploaded_by INTEGER DEFAULT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                processed_at TEXT DEFAULT NULL,
-                FOREIGN KEY(match_id) REFERENCES matches(id),
-                FOREIGN KEY(uploaded_by) REFERENCES admins(id)
-            );
-        """)
-
-        # 비디오 재생 로그 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS video_logs(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                video_id INTEGER NOT NULL,
-                level TEXT CHECK(level IN ('info','warn','error')) DEFAULT 'info',
-                event_type TEXT NOT NULL,
-                message TEXT NOT NULL,
-                details TEXT DEFAULT NULL,
-                user_agent TEXT DEFAULT NULL,
-                ip_address TEXT DEFAULT NULL,
-                timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
-                url TEXT DEFAULT NULL,
-                FOREIGN KEY(video_id) REFERENCES videos(id)
-            );
-        """)
-
-        # 비디오 로그 인덱스 (빠른 조회를 위해)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_video_logs_video_id
-            ON video_logs(video_id);
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_video_logs_timestamp
-            ON video_logs(timestamp DESC);
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_video_logs_level
-            ON video_logs(level);
-        """)
-
-        # 출석 인덱스 (참석자 수 카운트 최적화)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_attendance_match_status
-            ON attendance(match_id, status);
-        """)
-
-        # 팀 구성 테이블
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS team_distributions(
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                match_id INTEGER NOT NULL,
-                team_data TEXT NOT NULL,
-                created_by INTEGER,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(match_id) REFERENCES matches(id),
-                FOREIGN KEY(created_by) REFERENCES admins(id),
-                UNIQUE(match_id)
-            );
-        """)
-
-        # 초기 샘플 데이터 삽입
-        create_sample_data(cur)
-
-        conn.commit()
+                applied = run_migrations(conn)
+                logger.info(
+                    f"Database migrated from version {current_version} to "
+                    f"{get_schema_version(conn)} ({applied} migrations)"
+                )
+
+        _migrated_db_paths.add(db_path)
 
 def create_admins_table(cur):
     """관리자 테이블 생성 및 기본 관리자 데이터 삽입"""
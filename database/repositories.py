@@ -1,13 +1,97 @@
 """데이터 액세스 계층 - Repository 패턴"""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 import json
+import re
 from database.connection import db_manager
 from database.models import Match, Player, Field, PlayerStats, News, FinanceRecord, Gallery, Attendance, Admin, Video, TeamDistribution
 
 class MatchRepository:
     """경기 데이터 액세스"""
 
+    # 대시보드/달력에서 자주 호출되는 쿼리 - match_date에 함수를 씌우지 않아야 인덱스를 탄다
+    # (실행 계획 점검: find_full_scans)
+    MONTH_RANGE_QUERY = """
+        SELECT m.*, f.name as field_name
+        FROM matches m
+        JOIN fields f ON f.id = m.field_id
+        WHERE m.match_date >= ? AND m.match_date < ?
+        ORDER BY m.match_date, m.match_time
+    """
+
+    DATE_RANGE_QUERY = """
+        SELECT m.*, f.name as field_name, f.address as field_address
+        FROM matches m
+        LEFT JOIN fields f ON m.field_id = f.id
+        WHERE m.match_date BETWEEN ? AND ?
+        ORDER BY m.match_date, m.match_time
+    """
+
+    NEXT_MATCH_QUERY = """
+        SELECT m.*, f.name as field_name
+        FROM matches m
+        JOIN fields f ON f.id = m.field_id
+        WHERE m.match_date >= date('now')
+        ORDER BY m.match_date, m.match_time
+        LIMIT 1
+    """
+
+    MONTHLY_COUNT_QUERY = """
+        SELECT COUNT(*) as count FROM matches
+        WHERE match_date >= date('now', 'start of month')
+        AND match_date < date('now', 'start of month', '+1 month')
+    """
+
+    RECENT_MATCHES_QUERY = """
+        SELECT m.*, f.name as field_name
+        FROM matches m
+        JOIN fields f ON f.id = m.field_id
+        WHERE m.match_date <= date('now')
+        ORDER BY m.match_date DESC, m.match_time DESC
+        LIMIT ?
+    """
+
+    @staticmethod
+    def _month_bounds(year: int, month: int) -> Tuple[str, str]:
+        """해당 월의 [월초, 다음 달 월초) 날짜 문자열"""
+        month_start = date(year, month, 1)
+        if month == 12:
+            next_month_start = date(year + 1, 1, 1)
+        else:
+            next_month_start = date(year, month + 1, 1)
+        return str(month_start), str(next_month_start)
+
+    def explain_hot_queries(self) -> Dict[str, List[str]]:
+        """자주 호출되는 경기 쿼리의 실행 계획 (EXPLAIN QUERY PLAN detail 목록)"""
+        today = date.today()
+        month_start, next_month_start = self._month_bounds(today.year, today.month)
+        hot_queries = {
+            'get_for_month': (self.MONTH_RANGE_QUERY, (month_start, next_month_start)),
+            'get_in_date_range': (self.DATE_RANGE_QUERY, (month_start, next_month_start)),
+            'get_next_match': (self.NEXT_MATCH_QUERY, None),
+            'get_monthly_count': (self.MONTHLY_COUNT_QUERY, None),
+            'get_recent_matches': (self.RECENT_MATCHES_QUERY, (5,)),
+        }
+
+        plans = {}
+        for name, (query, params) in hot_queries.items():
+            results = db_manager.execute_query(f"EXPLAIN QUERY PLAN {query}", params)
+            plans[name] = [row['detail'] for row in results] if results else []
+        return plans
+
+    def find_full_scans(self) -> Dict[str, List[str]]:
+        """matches 테이블을 인덱스 없이 전체 스캔하는 핫 쿼리 (비어 있으면 정상)"""
+        full_scans = {}
+        for name, details in self.explain_hot_queries().items():
+            # "SCAN m" / "SCAN matches" 는 전체 스캔, "SEARCH ... USING INDEX" 는 정상
+            scans = [
+                detail for detail in details
+                if re.match(r"SCAN (m|matches)\b", detail) and "USING" not in detail
+            ]
+            if scans:
+                full_scans[name] = scans
+        return full_scans
+
     def create(self, match: Match) -> bool:
         """경기 생성"""
         query = """
@@ -33,49 +117,24 @@ class MatchRepository:
 
     def get_for_month(self, year: int, month: int) -> List[Dict[str, Any]]:
         """특정 월의 경기 목록"""
-        query = """
-            SELECT m.*, f.name as field_name
-            FROM matches m
-            JOIN fields f ON f.id = m.field_id
-            WHERE strftime('%Y', m.match_date) = ?
-            AND strftime('%m', m.match_date) = ?
-            ORDER BY m.match_date, m.match_time
-        """
-        results = db_manager.execute_query(query, (str(year), f"{month:02d}"))
+        # match_date에 함수를 씌우지 않는 반열린 구간 [월초, 다음 달 월초) - idx_matches_date_time 사용
+        month_start, next_month_start = self._month_bounds(year, month)
+        results = db_manager.execute_query(self.MONTH_RANGE_QUERY, (month_start, next_month_start))
         return [dict(row) for row in results] if results else []
 
     def get_in_date_range(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         """날짜 범위로 경기 조회 - 달력 전체 범위 로드용"""
-        query = """
-            SELECT m.*, f.name as field_name, f.address as field_address
-            FROM matches m
-            LEFT JOIN fields f ON m.field_id = f.id
-            WHERE m.match_date BETWEEN ? AND ?
-            ORDER BY m.match_date, m.match_time
-        """
-        results = db_manager.execute_query(query, (str(start_date), str(end_date)))
+        results = db_manager.execute_query(self.DATE_RANGE_QUERY, (str(start_date), str(end_date)))
         return [dict(row) for row in results] if results else []
 
     def get_next_match(self) -> Optional[Dict[str, Any]]:
         """다음 경기 조회"""
-        query = """
-            SELECT m.*, f.name as field_name
-            FROM matches m
-            JOIN fields f ON f.id = m.field_id
-            WHERE m.match_date >= date('now')
-            ORDER BY m.match_date, m.match_time
-            LIMIT 1
-        """
-        result = db_manager.execute_query(query, fetch_all=False)
+        result = db_manager.execute_query(self.NEXT_MATCH_QUERY, fetch_all=False)
         return dict(result) if result else None
 
     def get_monthly_count(self) -> int:
         """이번 달 경기 수"""
-        query = """
-            SELECT COUNT(*) as count FROM matches
-            WHERE strftime('%Y-%m', match_date) = strftime('%Y-%m', 'now')
-        """
-        result = db_manager.execute_query(query, fetch_all=False)
+        result = db_manager.execute_query(self.MONTHLY_COUNT_QUERY, fetch_all=False)
         return result['count'] if result else 0
 
     def get_all(self) -> List[Dict[str, Any]]:
@@ -95,15 +154,7 @@ class MatchRepository:
 
     def get_recent_matches(self, limit: int = 5) -> List[Dict[str, Any]]:
         """최근 경기"""
-        query = """
-            SELECT m.*, f.name as field_name
-            FROM matches m
-            JOIN fields f ON f.id = m.field_id
-            WHERE m.match_date <= date('now')
-            ORDER BY m.match_date DESC, m.match_time DESC
-            LIMIT ?
-        """
-        results = db_manager.execute_query(query, (limit,))
+        results = db_manager.execute_query(self.RECENT_MATCHES_QUERY, (limit,))
         return [dict(row) for row in results] if results else []
 
     def get_latest_match(self) -> Optional[Dict[str, Any]]:
@@ -409,21 +460,99 @@ class NewsRepository:
 class GalleryRepository:
     """갤러리 데이터 액세스"""
 
-    def create(self, title: str, description: str, file_path: str, match_id: Optional[int] = None) -> bool:
+    def create(self, title: str, description: str, file_path: str, match_id: Optional[int] = None,
+               content_sha256: Optional[str] = None) -> bool:
         """갤러리 사진 추가"""
         query = """
-            INSERT INTO gallery (title, description, file_path, match_id)
-            VALUES (?, ?, ?, ?)
+            INSERT INTO gallery (title, description, file_path, match_id, content_sha256)
+            VALUES (?, ?, ?, ?, ?)
         """
-        result = db_manager.execute_query(query, (title, description, file_path, match_id))
+        result = db_manager.execute_query(query, (title, description, file_path, match_id, content_sha256))
         return result is not None and result > 0
 
+    def get_by_content_hash(self, content_sha256: str) -> Optional[Dict[str, Any]]:
+        """같은 내용의 갤러리 사진 조회"""
+        query = "SELECT * FROM gallery WHERE content_sha256 = ? LIMIT 1"
+        result = db_manager.execute_query(query, (content_sha256,), fetch_all=False)
+        return dict(result) if result else None
+
+    def count_by_file_path(self, file_path: str) -> int:
+        """같은 파일을 사용하는 사진 수"""
+        query = "SELECT COUNT(*) as count FROM gallery WHERE file_path = ?"
+        result = db_manager.execute_query(query, (file_path,), fetch_all=False)
+        return result['count'] if result else 0
+
     def get_all(self) -> List[Dict[str, Any]]:
         """갤러리 사진 조회"""
         query = "SELECT * FROM gallery ORDER BY upload_date DESC"
         results = db_manager.execute_query(query)
         return [dict(row) for row in results] if results else []
 
+    def _build_filters(self, match_id: Optional[int], search: Optional[str]) -> Tuple[str, list]:
+        """갤러리 필터 조건 (경기, 제목/설명 검색)"""
+        conditions = []
+        params = []
+
+        if match_id is not None:
+            conditions.append("match_id = ?")
+            params.append(match_id)
+
+        if search:
+            # LIKE 와일드카드 문자는 그대로 검색되도록 이스케이프
+            pattern = '%' + re.sub(r'([\\%_])', r'\\\1', search) + '%'
+            conditions.append("(title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern])
+
+        return (" WHERE " + " AND ".join(conditions)) if conditions else "", params
+
+    def get_page(self, limit: int, after: Optional[Tuple[str, int]] = None, match_id: Optional[int] = None,
+                 search: Optional[str] = None) -> List[Dict[str, Any]]:
+        """갤러리 사진 한 페이지 (최신순)
+
+        Args:
+            limit: 최대 개수 (1~1000)
+            after: 키셋 페이지네이션 커서 - 이전 페이지 마지막 항목의 (upload_date, id)
+            match_id: 특정 경기 사진만
+            search: 제목/설명 검색어
+        """
+        where, params = self._build_filters(match_id, search)
+
+        if after:
+            # (upload_date, id) 기준 키셋 - OFFSET 없이 인덱스 순서대로 이어서 조회
+            where += (" AND " if where else " WHERE ") + "(upload_date < ? OR (upload_date = ? AND id < ?))"
+            params.extend([after[0], after[0], after[1]])
+
+        limit = max(1, min(int(limit), 1000))  # 1~1000 범위로 제한
+        query = f"SELECT * FROM gallery{where} ORDER BY upload_date DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        results = db_manager.execute_query(query, tuple(params))
+        return [dict(row) for row in results] if results else []
+
+    def count(self, match_id: Optional[int] = None, search: Optional[str] = None) -> int:
+        """갤러리 사진 수 (필터 기준)"""
+        where, params = self._build_filters(match_id, search)
+        result = db_manager.execute_query(f"SELECT COUNT(*) as count FROM gallery{where}", tuple(params),
+                                          fetch_all=False)
+        return result['count'] if result else 0
+
+    def get_stats(self, month_prefix: str) -> Dict[str, int]:
+        """갤러리 통계 (전체 / 이번 달 업로드 / 경기 연관 사진 수)"""
+        query = """
+            SELECT COUNT(*) as total,
+                   COALESCE(SUM(upload_date LIKE ?), 0) as this_month,
+                   COALESCE(SUM(match_id IS NOT NULL), 0) as match_linked
+            FROM gallery
+        """
+        result = db_manager.execute_query(query, (f"{month_prefix}%",), fetch_all=False)
+        return dict(result) if result else {'total': 0, 'this_month': 0, 'match_linked': 0}
+
+    def set_file_exists(self, gallery_id: int, file_exists: bool) -> bool:
+        """파일 존재 여부 캐시 갱신 (목록 표시 때 매번 파일시스템을 확인하지 않도록)"""
+        query = "UPDATE gallery SET file_exists = ? WHERE id = ?"
+        result = db_manager.execute_query(query, (1 if file_exists else 0, gallery_id))
+        return result is not None and result > 0
+
     def delete(self, gallery_id: int) -> bool:
         """갤러리 사진 삭제"""
         query = "DELETE FROM gallery WHERE id = ?"
@@ -522,6 +651,24 @@ class FinanceRepository:
 class AttendanceRepository:
     """출석 데이터 액세스"""
 
+    # 출석 변경 가능 조건 (matches m 기준, 파라미터: 현재 KST 시각 'YYYY-MM-DD HH:MM:SS')
+    # -1: 즉시 마감, 0: 제한 없음, N: 경기 시작 N분 전 마감 (시간 정보가 잘못된 경기는 잠그지 않음)
+    UNLOCKED_CONDITION = """
+        (m.attendance_lock_minutes IS NULL OR m.attendance_lock_minutes = 0
+         OR (m.attendance_lock_minutes != -1
+             AND IFNULL(? >= datetime(m.match_date || ' ' || m.match_time,
+                                      printf('-%d minutes', MAX(m.attendance_lock_minutes, 0))), 0) = 0))
+    """
+
+    # 정원 조건 (attendance 행 기준, 파라미터: 변경할 상태, 정원 초과 허용 여부)
+    # 참석이 아닌 상태로 변경하거나 이미 참석인 선수는 정원과 무관
+    CAPACITY_CONDITION = """
+        (? != 'present' OR attendance.status = 'present' OR ?
+         OR m.attendance_capacity IS NULL OR m.attendance_capacity <= 0
+         OR (SELECT COUNT(*) FROM attendance p
+             WHERE p.match_id = m.id AND p.status = 'present') < m.attendance_capacity)
+    """
+
     def create_for_match(self, match_id: int) -> bool:
         """경기에 대한 모든 선수의 출석 상태 생성 (기본값: pending)"""
         # 먼저 활성 선수 수 확인
@@ -564,6 +711,122 @@ class AttendanceRepository:
         result = db_manager.execute_query(query, (status, match_id, player_id))
         return result is not None and result > 0
 
+    def update_status_checked(self, match_id: int, player_id: int, status: str, now: str,
+                              allow_over_capacity: bool = False) -> Dict[str, Any]:
+        """마감/정원 조건을 UPDATE 조건절에서 확인하며 출석 상태 변경
+
+        조건 확인과 변경이 한 문장이므로 마지막 자리를 두 명이 동시에 차지할 수 없습니다.
+
+        Returns:
+            Dict: {'updated', 'reason'(None/'not_found'/'locked'/'full'), 'present_count', 'capacity'}
+        """
+        query = f"""
+            UPDATE attendance
+            SET status = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE match_id = ? AND player_id = ?
+              AND EXISTS (
+                  SELECT 1 FROM matches m
+                  WHERE m.id = attendance.match_id
+                    AND {self.UNLOCKED_CONDITION}
+                    AND {self.CAPACITY_CONDITION}
+              )
+        """
+        with db_manager.transaction() as conn:
+            cur = conn.execute(query, (status, match_id, player_id, now, status, int(allow_over_capacity)))
+            updated = cur.rowcount > 0
+
+            state = self._get_update_state(conn, match_id, player_id, now)
+
+        result = {
+            'updated': updated,
+            'reason': None,
+            'present_count': state['present_count'] if state else 0,
+            'capacity': state['capacity'] if state else None
+        }
+        if not updated:
+            if not state or state['current_status'] is None:
+                result['reason'] = 'not_found'
+            elif state['locked']:
+                result['reason'] = 'locked'
+            else:
+                result['reason'] = 'full'
+        return result
+
+    def update_statuses_bulk(self, match_id: int, updates: Dict[int, str], now: str,
+                             allow_over_capacity: bool = False) -> Dict[str, Any]:
+        """여러 선수의 출석 상태를 한 트랜잭션에서 변경 (마감/정원은 한 번만 확인)
+
+        참석 인원이 줄어드는 변경을 먼저 반영한 뒤 참석 변경을 요청 순서대로 정원까지 받습니다.
+
+        Returns:
+            Dict: {'outcomes': {player_id: 'updated'/'unchanged'/'not_found'/'locked'/'full'},
+                   'present_count', 'capacity'}
+        """
+        outcomes = {}
+        with db_manager.transaction() as conn:
+            state = self._get_update_state(conn, match_id, None, now)
+            if not state:
+                return {'outcomes': {player_id: 'not_found' for player_id in updates},
+                        'present_count': 0, 'capacity': None}
+
+            if state['locked']:
+                return {'outcomes': {player_id: 'locked' for player_id in updates},
+                        'present_count': state['present_count'], 'capacity': state['capacity']}
+
+            placeholders = ','.join('?' for _ in updates)
+            rows = conn.execute(
+                f"SELECT player_id, status FROM attendance WHERE match_id = ? AND player_id IN ({placeholders})",
+                (match_id, *updates)
+            ).fetchall() if updates else []
+            current = {row['player_id']: row['status'] for row in rows}
+
+            capacity = state['capacity']
+            present_count = state['present_count']
+            accepted = []
+
+            # 참석 인원이 줄어드는 변경 먼저 (빈 자리를 같은 요청의 참석 변경이 사용할 수 있도록)
+            for player_id, status in sorted(updates.items(), key=lambda item: item[1] == 'present'):
+                if player_id not in current:
+                    outcomes[player_id] = 'not_found'
+                elif current[player_id] == status:
+                    outcomes[player_id] = 'unchanged'
+                elif (status == 'present' and not allow_over_capacity
+                      and capacity is not None and capacity > 0 and present_count >= capacity):
+                    outcomes[player_id] = 'full'
+                else:
+                    if status == 'present':
+                        present_count += 1
+                    elif current[player_id] == 'present':
+                        present_count -= 1
+                    outcomes[player_id] = 'updated'
+                    accepted.append((status, match_id, player_id))
+
+            if accepted:
+                conn.executemany("""
+                    UPDATE attendance
+                    SET status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE match_id = ? AND player_id = ?
+                """, accepted)
+
+        return {
+            'outcomes': {player_id: outcomes[player_id] for player_id in updates},
+            'present_count': present_count,
+            'capacity': capacity
+        }
+
+    def _get_update_state(self, conn, match_id: int, player_id: Optional[int], now: str) -> Optional[Dict[str, Any]]:
+        """변경 직후 경기 상태 (참석 인원, 정원, 마감 여부, 선수 현재 상태) - 같은 트랜잭션에서 조회"""
+        query = f"""
+            SELECT m.attendance_capacity AS capacity,
+                   NOT {self.UNLOCKED_CONDITION} AS locked,
+                   (SELECT a.status FROM attendance a WHERE a.match_id = m.id AND a.player_id = ?) AS current_status,
+                   (SELECT COUNT(*) FROM attendance p WHERE p.match_id = m.id AND p.status = 'present') AS present_count
+            FROM matches m
+            WHERE m.id = ?
+        """
+        row = conn.execute(query, (now, player_id, match_id)).fetchone()
+        return dict(row) if row else None
+
     def get_by_match(self, match_id: int) -> List[Dict[str, Any]]:
         """특정 경기의 모든 선수 출석 현황"""
         query = """
@@ -690,6 +953,44 @@ class AdminRepository:
         result = db_manager.execute_query(query, (admin_id,))
         return result is not None and result > 0
 
+class AdminSessionRepository:
+    """관리자 세션 데이터 액세스"""
+
+    def create(self, session_id: str, admin: Dict[str, Any], ttl_hours: int) -> bool:
+        """세션 저장 (같은 세션 ID면 갱신)"""
+        query = """
+            INSERT OR REPLACE INTO admin_sessions
+                (session_id, admin_id, admin_username, admin_name, admin_role, expires_at)
+            VALUES (?, ?, ?, ?, ?, datetime('now', ?))
+        """
+        result = db_manager.execute_query(
+            query,
+            (session_id, admin['id'], admin['username'], admin['name'], admin.get('role', 'admin'),
+             f'+{ttl_hours} hours')
+        )
+        return result is not None
+
+    def get_valid(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 세션 조회 (PK 조회)"""
+        query = """
+            SELECT * FROM admin_sessions
+            WHERE session_id = ? AND expires_at > CURRENT_TIMESTAMP
+        """
+        result = db_manager.execute_query(query, (session_id,), fetch_all=False)
+        return dict(result) if result else None
+
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제"""
+        query = "DELETE FROM admin_sessions WHERE session_id = ?"
+        result = db_manager.execute_query(query, (session_id,))
+        return result is not None and result > 0
+
+    def delete_expired(self) -> int:
+        """만료된 세션 삭제 (만료 인덱스 범위만 탐색)"""
+        query = "DELETE FROM admin_sessions WHERE expires_at <= CURRENT_TIMESTAMP"
+        result = db_manager.execute_query(query)
+        return result or 0
+
 class VideoRepository:
     """동영상 데이터 액세스"""
 
@@ -740,6 +1041,168 @@ class VideoRepository:
         # rowcount가 0이어도 성공으로 간주 (이미 같은 값일 수 있음)
         return result is not None
 
+    def enqueue_processing(self, video_id: int, original_path: str) -> bool:
+        """트랜스코딩 대기열에 등록 (워커가 next_attempt_at 순서로 처리)"""
+        query = """
+            UPDATE videos
+            SET status = 'pending', original_path = ?, attempts = 0,
+                next_attempt_at = CURRENT_TIMESTAMP, locked_at = NULL, last_error = NULL
+            WHERE id = ?
+        """
+        result = db_manager.execute_query(query, (original_path, video_id))
+        return result is not None and result > 0
+
+    def claim_next_job(self) -> Optional[Dict[str, Any]]:
+        """처리할 다음 작업을 processing으로 바꾸고 반환 (없으면 None)"""
+        with db_manager.transaction() as conn:
+            row = conn.execute("""
+                SELECT id, original_filename, original_path, attempts
+                FROM videos
+                -- next_attempt_at이 NULL이면 원본 저장 중(대기열 등록 전)이므로 제외
+                WHERE status = 'pending' AND next_attempt_at <= CURRENT_TIMESTAMP
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+            """).fetchone()
+            if not row:
+                return None
+
+            conn.execute("""
+                UPDATE videos
+                SET status = 'processing', attempts = attempts + 1, locked_at = CURRENT_TIMESTAMP,
+                    progress_stage = NULL, progress_percent = NULL, progress_speed = NULL,
+                    progress_eta_seconds = NULL, progress_updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (row['id'],))
+
+        job = dict(row)
+        job['attempts'] += 1
+        return job
+
+    def update_media_info(self, video_id: int, width: Optional[int], height: Optional[int],
+                          fps: Optional[float] = None, codec: Optional[str] = None) -> bool:
+        """원본 해상도/화면비(가로/세로)/fps/코덱 저장"""
+        aspect_ratio = round(width / height, 4) if width and height else None
+        query = """
+            UPDATE videos
+            SET width = ?, height = ?, aspect_ratio = ?, fps = ?, codec = ?
+            WHERE id = ?
+        """
+        result = db_manager.execute_query(query, (width, height, aspect_ratio, fps, codec, video_id))
+        return result is not None and result > 0
+
+    def set_content_hash(self, video_id: int, content_sha256: str) -> bool:
+        """원본 파일 SHA-256 저장"""
+        query = "UPDATE videos SET content_sha256 = ? WHERE id = ?"
+        result = db_manager.execute_query(query, (content_sha256, video_id))
+        return result is not None and result > 0
+
+    def get_by_content_hash(self, content_sha256: str) -> Optional[Dict[str, Any]]:
+        """같은 내용의 동영상 조회 (변환 완료된 동영상 우선)"""
+        query = """
+            SELECT id, title, status
+            FROM videos
+            WHERE content_sha256 = ?
+            ORDER BY status = 'completed' DESC, id
+            LIMIT 1
+        """
+        result = db_manager.execute_query(query, (content_sha256,), fetch_all=False)
+        return dict(result) if result else None
+
+    def create_duplicate(self, source_video_id: int, title: str, description: str, original_filename: str,
+                         match_id: Optional[int], uploaded_by: Optional[int]) -> Optional[int]:
+        """변환 완료된 동영상의 HLS/썸네일을 공유하는 동영상 생성 (공유 파일 참조 수 증가)"""
+        with db_manager.transaction() as conn:
+            cur = conn.execute("""
+                INSERT INTO videos (title, description, original_filename, file_size, duration, status,
+                                    hls_path, thumbnail_path, match_id, uploaded_by, processed_at,
+                                    width, height, aspect_ratio, fps, codec, preview_vtt_path, content_sha256)
+                SELECT ?, ?, ?, file_size, duration, 'completed',
+                       hls_path, thumbnail_path, ?, ?, CURRENT_TIMESTAMP,
+                       width, height, aspect_ratio, fps, codec, preview_vtt_path, content_sha256
+                FROM videos
+                WHERE id = ? AND status = 'completed' AND content_sha256 IS NOT NULL
+            """, (title, description, original_filename, match_id, uploaded_by, source_video_id))
+            if cur.rowcount == 0:
+                return None
+
+            video_id = cur.lastrowid
+            conn.execute("""
+                UPDATE media_blobs
+                SET ref_count = ref_count + 1
+                WHERE sha256 = (SELECT content_sha256 FROM videos WHERE id = ?)
+            """, (video_id,))
+
+        return video_id
+
+    def update_preview_vtt_path(self, video_id: int, preview_vtt_path: Optional[str]) -> bool:
+        """탐색 미리보기 스프라이트 WebVTT 경로 저장"""
+        query = "UPDATE videos SET preview_vtt_path = ? WHERE id = ?"
+        result = db_manager.execute_query(query, (preview_vtt_path, video_id))
+        return result is not None and result > 0
+
+    def get_missing_media_info(self) -> List[Dict[str, Any]]:
+        """해상도 정보가 없는 완료 동영상 (백필 대상)"""
+        query = """
+            SELECT id, original_filename, original_path, hls_path, thumbnail_path
+            FROM videos
+            WHERE status = 'completed' AND (width IS NULL OR height IS NULL)
+            ORDER BY id
+        """
+        results = db_manager.execute_query(query)
+        return [dict(row) for row in results] if results else []
+
+    def update_progress(self, video_id: int, stage: str, percent: Optional[float] = None,
+                        speed: Optional[float] = None, eta_seconds: Optional[int] = None) -> bool:
+        """트랜스코딩 진행률 기록 (processing 상태일 때만)"""
+        query = """
+            UPDATE videos
+            SET progress_stage = ?, progress_percent = ?, progress_speed = ?,
+                progress_eta_seconds = ?, progress_updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'processing'
+        """
+        result = db_manager.execute_query(query, (stage, percent, speed, eta_seconds, video_id))
+        return result is not None and result > 0
+
+    def fail_job(self, video_id: int, error: str, retry_delay: Optional[int] = None) -> bool:
+        """작업 실패 기록 - retry_delay가 있으면 그 시간(초) 뒤 재시도, 없으면 failed"""
+        if retry_delay is None:
+            query = """
+                UPDATE videos
+                SET status = 'failed', locked_at = NULL, next_attempt_at = NULL, last_error = ?
+                WHERE id = ?
+            """
+            params = (error, video_id)
+        else:
+            query = """
+                UPDATE videos
+                SET status = 'pending', locked_at = NULL, last_error = ?,
+                    next_attempt_at = datetime('now', ?)
+                WHERE id = ?
+            """
+            params = (error, f"+{int(retry_delay)} seconds", video_id)
+
+        result = db_manager.execute_query(query, params)
+        return result is not None and result > 0
+
+    def requeue_interrupted_jobs(self) -> int:
+        """processing 상태로 남은 작업을 대기열로 되돌림 (워커 시작 시 호출)"""
+        query = """
+            UPDATE videos
+            SET status = 'pending', locked_at = NULL, next_attempt_at = CURRENT_TIMESTAMP
+            WHERE status = 'processing'
+        """
+        result = db_manager.execute_query(query)
+        return result or 0
+
+    def get_queue_stats(self) -> Dict[str, int]:
+        """상태별 동영상 수"""
+        query = "SELECT status, COUNT(*) as count FROM videos GROUP BY status"
+        results = db_manager.execute_query(query)
+        stats = {'pending': 0, 'processing': 0, 'completed': 0, 'failed': 0}
+        if results:
+            stats.update({row['status']: row['count'] for row in results})
+        return stats
+
     def update_info(self, video_id: int, description: str, match_id: Optional[int] = None) -> bool:
         """동영상 정보 업데이트 (설명, 연결 경기)"""
         import logging
@@ -815,8 +1278,16 @@ class VideoRepository:
         """특정 경기의 동영상 목록 (별칭 메서드)"""
         return self.get_by_match(match_id)
 
-    def get_completed_videos(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """완료된 동영상 목록"""
+    def get_completed_videos(self, limit: Optional[int] = None, after: Optional[Tuple[str, int]] = None,
+                             match_id: Optional[int] = None, unlinked_only: bool = False) -> List[Dict[str, Any]]:
+        """완료된 동영상 목록 (최신순)
+
+        Args:
+            limit: 최대 개수 (1~1000)
+            after: 키셋 페이지네이션 커서 - 이전 페이지 마지막 항목의 (created_at, id)
+            match_id: 특정 경기 영상만
+            unlinked_only: 경기와 연결되지 않은 영상만
+        """
         query = """
             SELECT v.*, a.name as uploader_name, m.match_date, m.match_time, m.opponent, f.name as field_name
             FROM videos v
@@ -824,16 +1295,54 @@ class VideoRepository:
             LEFT JOIN matches m ON m.id = v.match_id
             LEFT JOIN fields f ON f.id = m.field_id
             WHERE v.status = 'completed'
-            ORDER BY v.created_at DESC
         """
-        params = ()
+        params = []
+
+        if match_id is not None:
+            query += " AND v.match_id = ?"
+            params.append(match_id)
+        elif unlinked_only:
+            query += " AND v.match_id IS NULL"
+
+        if after:
+            # (created_at, id) 기준 키셋 - OFFSET 없이 idx_videos_status_created로 바로 이어서 조회
+            query += " AND (v.created_at < ? OR (v.created_at = ? AND v.id < ?))"
+            params.extend([after[0], after[0], after[1]])
+
+        query += " ORDER BY v.created_at DESC, v.id DESC"
+
         if limit:
             # SQL Injection 방지: 파라미터 바인딩 사용
             limit = max(1, min(int(limit), 1000))  # 1~1000 범위로 제한
             query += " LIMIT ?"
-            params = (limit,)
+            params.append(limit)
+
+        results = db_manager.execute_query(query, tuple(params))
+        return [dict(row) for row in results] if results else []
+
+    def count_completed_videos(self, match_id: Optional[int] = None, unlinked_only: bool = False) -> int:
+        """완료된 동영상 수 (갤러리 필터 기준)"""
+        query = "SELECT COUNT(*) as count FROM videos WHERE status = 'completed'"
+        params = ()
+        if match_id is not None:
+            query += " AND match_id = ?"
+            params = (match_id,)
+        elif unlinked_only:
+            query += " AND match_id IS NULL"
 
-        results = db_manager.execute_query(query, params)
+        result = db_manager.execute_query(query, params, fetch_all=False)
+        return result['count'] if result else 0
+
+    def get_matches_with_videos(self) -> List[Dict[str, Any]]:
+        """완료된 동영상이 있는 경기 목록 (갤러리 필터용, 최신 경기순)"""
+        query = """
+            SELECT m.id, m.match_date, m.opponent, f.name as field_name
+            FROM matches m
+            LEFT JOIN fields f ON f.id = m.field_id
+            WHERE m.id IN (SELECT DISTINCT match_id FROM videos WHERE status = 'completed' AND match_id IS NOT NULL)
+            ORDER BY m.match_date DESC, m.match_time DESC
+        """
+        results = db_manager.execute_query(query)
         return [dict(row) for row in results] if results else []
 
     def delete(self, video_id: int) -> bool:
@@ -854,6 +1363,139 @@ class VideoRepository:
         result = db_manager.execute_query(query, fetch_all=False)
         return result['total'] if result else 0
 
+class MediaBlobRepository:
+    """콘텐츠 해시(SHA-256) 인덱스 데이터 액세스 (같은 내용의 파일은 한 번만 저장하고 참조 수로 관리)"""
+
+    def get(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """해시로 조회"""
+        query = "SELECT * FROM media_blobs WHERE sha256 = ?"
+        result = db_manager.execute_query(query, (sha256,), fetch_all=False)
+        return dict(result) if result else None
+
+    def exists(self, sha256: str) -> bool:
+        """이미 저장된 내용인지 확인"""
+        return self.get(sha256) is not None
+
+    def acquire(self, sha256: str, kind: str, file_path: str, file_size: int,
+                owner_video_id: Optional[int] = None) -> bool:
+        """참조 추가 (처음 저장하는 내용이면 등록)"""
+        query = """
+            INSERT INTO media_blobs (sha256, kind, file_path, file_size, owner_video_id, ref_count)
+            VALUES (?, ?, ?, ?, ?, 1)
+            ON CONFLICT(sha256) DO UPDATE SET ref_count = ref_count + 1
+        """
+        result = db_manager.execute_query(query, (sha256, kind, file_path, file_size, owner_video_id))
+        return result is not None
+
+    def release(self, sha256: str) -> Optional[Dict[str, Any]]:
+        """참조 제거 - 남은 참조 수가 담긴 행 반환 (0이면 행도 삭제, 호출자가 파일 삭제)"""
+        with db_manager.transaction() as conn:
+            conn.execute("""
+                UPDATE media_blobs
+                SET ref_count = ref_count - 1
+                WHERE sha256 = ? AND ref_count > 0
+            """, (sha256,))
+            row = conn.execute("SELECT * FROM media_blobs WHERE sha256 = ?", (sha256,)).fetchone()
+            if not row:
+                return None
+
+            if row['ref_count'] <= 0:
+                conn.execute("DELETE FROM media_blobs WHERE sha256 = ?", (sha256,))
+
+        return dict(row)
+
+
+class VideoUploadRepository:
+    """이어올리기 업로드 세션 데이터 액세스"""
+
+    def create_ticket(self, upload_id: str, title: str, description: str, match_id: Optional[int],
+                      uploaded_by: Optional[int], ttl_hours: int) -> bool:
+        """업로드 티켓 발급 (관리자 페이지 → 브라우저 업로더)"""
+        query = """
+            INSERT INTO video_uploads (id, title, description, match_id, uploaded_by, expires_at)
+            VALUES (?, ?, ?, ?, ?, datetime('now', ?))
+        """
+        result = db_manager.execute_query(
+            query, (upload_id, title, description, match_id, uploaded_by, f'+{ttl_hours} hours')
+        )
+        return result is not None
+
+    def get_by_id(self, upload_id: str) -> Optional[Dict[str, Any]]:
+        """업로드 세션 조회 (expired: 유효 시간 경과 여부)"""
+        query = """
+            SELECT *, expires_at <= CURRENT_TIMESTAMP AS expired
+            FROM video_uploads
+            WHERE id = ?
+        """
+        result = db_manager.execute_query(query, (upload_id,), fetch_all=False)
+        return dict(result) if result else None
+
+    def start_upload(self, upload_id: str, original_filename: str, upload_length: int) -> bool:
+        """티켓을 업로드 중 상태로 전환 (유효한 미사용 티켓만)"""
+        query = """
+            UPDATE video_uploads
+            SET status = 'uploading', original_filename = ?, upload_length = ?, upload_offset = 0,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'ticket' AND expires_at > CURRENT_TIMESTAMP
+        """
+        result = db_manager.execute_query(query, (original_filename, upload_length, upload_id))
+        return result is not None and result > 0
+
+    def advance_offset(self, upload_id: str, expected_offset: int, new_offset: int, ttl_hours: int) -> bool:
+        """수신 완료 위치 갱신 (다른 요청이 먼저 갱신했으면 실패) 및 유효 시간 연장"""
+        query = """
+            UPDATE video_uploads
+            SET upload_offset = ?, updated_at = CURRENT_TIMESTAMP, expires_at = datetime('now', ?)
+            WHERE id = ? AND status = 'uploading' AND upload_offset = ?
+        """
+        result = db_manager.execute_query(
+            query, (new_offset, f'+{ttl_hours} hours', upload_id, expected_offset)
+        )
+        return result is not None and result > 0
+
+    def claim_finalize(self, upload_id: str, stale_minutes: int) -> bool:
+        """전체 수신된 업로드의 완료 처리 선점 (한 요청만 성공 - 중단된 완료 처리는 stale_minutes 후 재선점)"""
+        query = """
+            UPDATE video_uploads
+            SET status = 'finalizing', updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND upload_offset = upload_length
+            AND (status = 'uploading'
+                 OR (status = 'finalizing' AND updated_at <= datetime('now', ?)))
+        """
+        result = db_manager.execute_query(query, (upload_id, f'-{stale_minutes} minutes'))
+        return result is not None and result == 1
+
+    def complete(self, upload_id: str, video_id: int) -> bool:
+        """업로드 완료 처리 (생성된 동영상 연결)"""
+        query = """
+            UPDATE video_uploads
+            SET status = 'completed', video_id = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'finalizing'
+        """
+        result = db_manager.execute_query(query, (video_id, upload_id))
+        return result is not None and result > 0
+
+    def get_expired(self) -> List[Dict[str, Any]]:
+        """유효 시간이 지난 미완료 업로드"""
+        query = """
+            SELECT id, status
+            FROM video_uploads
+            WHERE status IN ('ticket', 'uploading') AND expires_at <= CURRENT_TIMESTAMP
+        """
+        results = db_manager.execute_query(query)
+        return [dict(row) for row in results] if results else []
+
+    def mark_expired(self, upload_id: str) -> bool:
+        """미완료 업로드 만료 처리"""
+        query = """
+            UPDATE video_uploads
+            SET status = 'expired', updated_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status IN ('ticket', 'uploading', 'finalizing')
+        """
+        result = db_manager.execute_query(query, (upload_id,))
+        return result is not None and result > 0
+
+
 class TeamDistributionRepository:
     """팀 구성 데이터 액세스"""
 
@@ -939,5 +1581,8 @@ gallery_repo = GalleryRepository()
 finance_repo = FinanceRepository()
 attendance_repo = AttendanceRepository()
 admin_repo = AdminRepository()
+admin_session_repo = AdminSessionRepository()
 video_repo = VideoRepository()
+video_upload_repo = VideoUploadRepository()
+media_blob_repo = MediaBlobRepository()
 team_distribution_repo = TeamDistributionRepository()
@@ -0,0 +1,54 @@
+"""테이블 버전 조회 (쓰기 알림)
+
+마이그레이션 15의 트리거가 INSERT/UPDATE/DELETE마다 table_versions 테이블의 버전을 올리므로
+업로드 API, 동영상 워커, 다른 Streamlit 프로세스의 쓰기도 모두 반영됩니다.
+캐시는 의존하는 테이블 버전을 키에 포함하거나 저장 당시 버전과 비교해 데이터가 바뀌면 바로 새로 조회합니다.
+
+버전 테이블은 PRAGMA data_version이 바뀐 경우(다른 연결이 커밋한 경우)에만 다시 읽습니다.
+data_version은 연결마다 따로 추적되므로 풀과 별도의 스레드별 전용 연결을 사용합니다.
+"""
+import sqlite3
+import threading
+from typing import Dict
+
+from config.settings import db_config
+
+
+class TableVersions:
+    """DB 테이블 버전 조회 (스레드별 전용 연결)"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.db_path != db_config.DB_PATH:
+            conn = sqlite3.connect(db_config.DB_PATH, timeout=5, isolation_level=None)
+            self._local.conn = conn
+            self._local.db_path = db_config.DB_PATH
+            self._local.data_version = None
+            self._local.versions = {}
+        return conn
+
+    def get(self, *tables: str) -> Dict[str, int]:
+        """의존 테이블 버전 (data_version이 그대로면 이전 조회 결과 재사용)
+
+        Raises:
+            sqlite3.Error: 버전 테이블을 읽을 수 없는 경우 (호출 측에서 캐시 없이 조회)
+        """
+        conn = self._conn()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._local.data_version or any(t not in self._local.versions for t in tables):
+            rows = conn.execute("SELECT table_name, version FROM table_versions").fetchall()
+            self._local.versions = {name: version for name, version in rows}
+            self._local.data_version = data_version
+        return {table: self._local.versions.get(table, 0) for table in tables}
+
+    def snapshot(self) -> Dict[str, int]:
+        """전체 버전 조회 (진단용)"""
+        self.get()
+        return dict(self._local.versions)
+
+
+# 프로세스 공용 인스턴스
+table_versions = TableVersions()
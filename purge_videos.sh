@@ -12,8 +12,9 @@ import sqlite3
 conn = sqlite3.connect('/app/team_platform.db')
 cur = conn.cursor()
 cur.execute('DELETE FROM videos')
-conn.commit()
 affected = cur.rowcount
+cur.execute("DELETE FROM media_blobs WHERE kind = 'video'")
+conn.commit()
 conn.close()
 print(f'삭제된 레코드: {affected}개')
 "
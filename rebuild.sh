@@ -26,6 +26,7 @@ if [ $? -eq 0 ]; then
     docker run -d \
       --name futsal-team-platform \
       -p 8501:8501 \
+      -p 8502:8502 \
       -v $(pwd):/app \
       --restart unless-stopped \
       --log-driver json-file \
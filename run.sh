@@ -60,6 +60,7 @@ echo "🚀 새 컨테이너 생성 중..."
 docker run -d \
   --name futsal-team-platform \
   -p 8501:8501 \
+  -p 8502:8502 \
   -v /futsal_proj/futsal.db:/app/futsal.db \
   -v /futsal_proj/uploads:/app/uploads \
   --restart unless-stopped \
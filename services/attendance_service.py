@@ -15,23 +15,26 @@ class AttendanceService:
         """새 경기 생성 시 모든 선수의 출석 상태 생성"""
         return self.attendance_repo.create_for_match(match_id)
 
-    def is_attendance_locked(self, match_id: int, *, now: Optional[datetime] = None) -> bool:
-        """경기 출석 변경이 잠금되었는지 확인"""
+    @staticmethod
+    def _now_kst() -> datetime:
+        """현재 한국 표준시(KST, UTC+9) - 경기 시간이 KST로 저장됨"""
         from datetime import timezone, timedelta as td
 
-        # 한국 표준시(KST) = UTC+9
         KST = timezone(td(hours=9))
+        return datetime.now(timezone.utc).astimezone(KST).replace(tzinfo=None)
 
+    def is_attendance_locked(self, match_id: int, *, now: Optional[datetime] = None) -> bool:
+        """경기 출석 변경이 잠금되었는지 확인"""
         if now is None:
-            # 현재 시간을 KST로 변환
-            now = datetime.now(timezone.utc).astimezone(KST).replace(tzinfo=None)
+            now = self._now_kst()
 
         # 경기 정보 조회
         match = self.match_repo.get_by_id(match_id)
         if not match:
             return False
 
-        lock_minutes = match.get('attendance_lock_minutes', 0)
+        # NULL은 0(제한 없음)과 같게 처리 (AttendanceRepository.UNLOCKED_CONDITION과 동일)
+        lock_minutes = match.get('attendance_lock_minutes') or 0
 
         # -1이면 즉시 마감 (항상 잠금)
         if lock_minutes == -1:
@@ -52,7 +55,6 @@ class AttendanceService:
                 return True
 
             # 마감 시간 계산
-            lock_minutes = match.get('attendance_lock_minutes', 0)
             lock_datetime = match_datetime - timedelta(minutes=lock_minutes)
 
             # 현재 시간이 마감 시간을 지났는지 확인
@@ -64,54 +66,71 @@ class AttendanceService:
     def update_player_status(self, match_id: int, player_id: int, status: str, is_admin: bool = False) -> Dict[str, Any]:
         """선수 개인의 출석 상태 변경
 
+        마감/정원 확인과 변경을 조건부 UPDATE 한 번으로 처리합니다.
+
         Returns:
-            Dict with 'success' (bool) and 'message' (str)
+            Dict with 'success' (bool), 'message' (str), 'present_count' (int)
         """
         valid_statuses = ['present', 'absent', 'pending']
         if status not in valid_statuses:
-            return {'success': False, 'message': f"잘못된 상태값입니다: {status}"}
-
-        # 출석 변경이 잠금되었는지 확인
-        if self.is_attendance_locked(match_id):
-            return {'success': False, 'message': "출석 변경 가능 시간이 지났습니다."}
-
-        # 참석으로 변경하는 경우에만 정원 체크
-        if status == 'present':
-            # 현재 상태 확인 (이미 참석 상태면 정원 체크 불필요)
-            current_attendances = self.attendance_repo.get_by_match(match_id)
-            current_status = None
-            for att in current_attendances:
-                if att['player_id'] == player_id:
-                    current_status = att['status']
-                    break
-
-            # 이미 참석 상태가 아닌 경우에만 정원 체크
-            if current_status != 'present':
-                match = self.match_repo.get_by_id(match_id)
-                if not match:
-                    return {'success': False, 'message': "경기를 찾을 수 없습니다."}
-
-                capacity = match.get('attendance_capacity')
-
-                # 정원이 설정되어 있는 경우
-                if capacity is not None and capacity > 0:
-                    current_count = self.attendance_repo.count_present(match_id)
-
-                    # 정원 초과 체크
-                    if current_count >= capacity:
-                        # 관리자는 정원 초과 허용
-                        if not is_admin:
-                            return {
-                                'success': False,
-                                'message': f"참석 정원이 가득 찼습니다. (현재 {current_count}/{capacity}명)"
-                            }
-
-        success = self.attendance_repo.update_status(match_id, player_id, status)
-
-        if success:
-            return {'success': True, 'message': "출석 상태가 변경되었습니다."}
-        else:
-            return {'success': False, 'message': "출석 상태 변경에 실패했습니다."}
+            return {'success': False, 'message': f"잘못된 상태값입니다: {status}", 'present_count': None}
+
+        now = self._now_kst().strftime("%Y-%m-%d %H:%M:%S")
+        # 관리자는 정원 초과 허용
+        result = self.attendance_repo.update_status_checked(match_id, player_id, status, now,
+                                                            allow_over_capacity=is_admin)
+
+        return {
+            'success': result['updated'],
+            'message': self._get_update_message(result),
+            'present_count': result['present_count']
+        }
+
+    def update_player_statuses(self, match_id: int, updates: Dict[int, str], is_admin: bool = False) -> Dict[str, Any]:
+        """여러 선수의 출석 상태를 한 번에 변경 (관리자 일괄 수정용)
+
+        Returns:
+            Dict with 'success' (bool), 'message' (str), 'updated' (List[int]),
+            'failed' (Dict[int, str] - 선수 ID별 실패 사유), 'present_count' (int)
+        """
+        valid_statuses = ['present', 'absent', 'pending']
+        invalid = {player_id: f"잘못된 상태값입니다: {status}"
+                   for player_id, status in updates.items() if status not in valid_statuses}
+        valid_updates = {player_id: status for player_id, status in updates.items() if player_id not in invalid}
+
+        now = self._now_kst().strftime("%Y-%m-%d %H:%M:%S")
+        result = self.attendance_repo.update_statuses_bulk(match_id, valid_updates, now,
+                                                           allow_over_capacity=is_admin)
+
+        failure_messages = {
+            'not_found': "출석 정보가 없습니다.",
+            'locked': "출석 변경 가능 시간이 지났습니다.",
+            'full': f"참석 정원이 가득 찼습니다. (정원 {result['capacity']}명)"
+        }
+        updated = [player_id for player_id, outcome in result['outcomes'].items() if outcome == 'updated']
+        failed = dict(invalid)
+        failed.update({
+            player_id: failure_messages[outcome]
+            for player_id, outcome in result['outcomes'].items() if outcome in failure_messages
+        })
+
+        return {
+            'success': not failed,
+            'message': f"{len(updated)}명 변경, {len(failed)}명 실패" if failed else f"{len(updated)}명 변경되었습니다.",
+            'updated': updated,
+            'failed': failed,
+            'present_count': result['present_count']
+        }
+
+    def _get_update_message(self, result: Dict[str, Any]) -> str:
+        """출석 변경 결과 메시지"""
+        if result['updated']:
+            return "출석 상태가 변경되었습니다."
+        if result['reason'] == 'locked':
+            return "출석 변경 가능 시간이 지났습니다."
+        if result['reason'] == 'full':
+            return f"참석 정원이 가득 찼습니다. (현재 {result['present_count']}/{result['capacity']}명)"
+        return "출석 상태 변경에 실패했습니다."
 
     def get_match_attendance(self, match_id: int) -> List[Dict[str, Any]]:
         """경기별 전체 출석 현황 (관리자용)"""
@@ -1,36 +1,203 @@
-"""인증 서비스"""
-import bcrypt
+"""인증 서비스
+
+bcrypt 검증은 Streamlit 스크립트 스레드를 막지 않도록 크기가 제한된 스레드 풀에서 실행합니다.
+(bcrypt는 해시 계산 중 GIL을 놓음) 사용자별 실패 횟수 제한으로 무차별 대입이 CPU를 점유하지 못하게 하고,
+최근 검증 성공 결과는 프로세스 메모리에만 짧게 캐시해 같은 관리자의 재로그인은 bcrypt를 다시 실행하지 않습니다.
+검증 대기열이 가득 찼거나 시간이 초과되면 VerificationUnavailableError - 실패 횟수에 포함하지 않습니다.
+"""
+import hmac
+import time
+import secrets
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional, Dict, Any
+
+import bcrypt
+
+from config.settings import auth_config
 from database.repositories import admin_repo
 from database.models import Admin
 
+logger = logging.getLogger(__name__)
+
+
+class VerificationUnavailableError(Exception):
+    """서버가 바빠 비밀번호를 검증하지 못함 (비밀번호가 틀린 것이 아님 - 잠시 후 재시도)"""
+
+
+class LoginAttemptLimiter:
+    """사용자별 로그인 실패 횟수 제한 (메모리)"""
+
+    def __init__(self, max_attempts: int, window_seconds: int, lockout_seconds: int):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.lockout_seconds = lockout_seconds
+        self._failures: Dict[str, deque] = {}
+        self._locked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_lockout_remaining(self, username: str) -> int:
+        """잠금 해제까지 남은 시간 (초, 잠금이 아니면 0)"""
+        with self._lock:
+            locked_until = self._locked_until.get(username, 0)
+            remaining = locked_until - time.monotonic()
+            if remaining <= 0:
+                self._locked_until.pop(username, None)
+                return 0
+            return int(remaining) + 1
+
+    def record_failure(self, username: str):
+        """실패 기록 - 기간 내 실패 횟수를 넘으면 잠금"""
+        now = time.monotonic()
+        with self._lock:
+            failures = self._failures.setdefault(username, deque())
+            failures.append(now)
+            while failures and now - failures[0] > self.window_seconds:
+                failures.popleft()
+
+            if len(failures) >= self.max_attempts:
+                self._locked_until[username] = now + self.lockout_seconds
+                failures.clear()
+                logger.warning(f"Login locked for {self.lockout_seconds}s after repeated failures: {username}")
+
+            self._prune(now)
+
+    def reset(self, username: str):
+        """로그인 성공 시 실패 기록 초기화"""
+        with self._lock:
+            self._failures.pop(username, None)
+            self._locked_until.pop(username, None)
+
+    def _prune(self, now: float):
+        """오래된 기록 정리 (존재하지 않는 사용자명으로 메모리가 늘지 않도록)"""
+        for username in [name for name, failures in self._failures.items()
+                         if not failures or now - failures[-1] > self.window_seconds]:
+            del self._failures[username]
+        for username in [name for name, until in self._locked_until.items() if until <= now]:
+            del self._locked_until[username]
+
+
+class VerificationCache:
+    """최근 비밀번호 검증 성공 결과 캐시 (메모리 전용, 짧은 유효 시간)
+
+    평문 비밀번호는 저장하지 않고 프로세스마다 새로 만드는 키로 계산한 HMAC만 보관합니다.
+    저장된 해시도 키에 포함되므로 비밀번호가 바뀌면 이전 결과는 자동으로 무효가 됩니다.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._key = secrets.token_bytes(32)
+        self._entries: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, password: str, hashed: str) -> str:
+        message = hashed.encode('utf-8') + b'\0' + password.encode('utf-8')
+        return hmac.new(self._key, message, hashlib.sha256).hexdigest()
+
+    def contains(self, password: str, hashed: str) -> bool:
+        """유효한 검증 성공 기록이 있는지 확인"""
+        digest = self._digest(password, hashed)
+        with self._lock:
+            expires_at = self._entries.get(digest)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[digest]
+                return False
+            return True
+
+    def add(self, password: str, hashed: str):
+        """검증 성공 기록 (가장 오래된 항목부터 제거)"""
+        digest = self._digest(password, hashed)
+        with self._lock:
+            self._entries[digest] = time.monotonic() + self.ttl_seconds
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
 
 class AuthService:
     """관리자 인증 서비스"""
 
-    def __init__(self):
+    def __init__(self, config=auth_config):
         self.admin_repo = admin_repo
+        self.config = config
+        self.limiter = LoginAttemptLimiter(config.MAX_FAILED_ATTEMPTS, config.ATTEMPT_WINDOW_SECONDS,
+                                           config.LOCKOUT_SECONDS)
+        self.verification_cache = VerificationCache(config.CACHE_TTL_SECONDS, config.CACHE_MAX_ENTRIES)
+        self._executor = ThreadPoolExecutor(max_workers=config.VERIFY_WORKERS, thread_name_prefix='bcrypt-verify')
+        # 대기열 크기 제한 (ThreadPoolExecutor 대기열은 무제한이므로 세마포어로 제한)
+        self._slots = threading.BoundedSemaphore(config.VERIFY_QUEUE_SIZE)
 
     def hash_password(self, password: str) -> str:
         """비밀번호 해시화"""
         return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
-    def verify_password(self, password: str, hashed: str) -> bool:
-        """비밀번호 검증"""
+    @staticmethod
+    def _checkpw(password: str, hashed: str) -> bool:
         try:
             return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
         except Exception:
             return False
 
+    def verify_password(self, password: str, hashed: str) -> bool:
+        """비밀번호 검증 (최근 성공 캐시 확인 후 검증 스레드 풀에서 bcrypt 실행)
+
+        Raises:
+            VerificationUnavailableError: 검증 대기열이 가득 찼거나 시간 초과
+        """
+        if self.verification_cache.contains(password, hashed):
+            return True
+
+        if not self._slots.acquire(blocking=False):
+            logger.warning("Password verification rejected: too many pending verifications")
+            raise VerificationUnavailableError("too many pending verifications")
+
+        try:
+            future = self._executor.submit(self._checkpw, password, hashed)
+        except RuntimeError as e:
+            self._slots.release()
+            raise VerificationUnavailableError(str(e)) from e
+        future.add_done_callback(lambda f: self._slots.release())
+
+        try:
+            verified = future.result(timeout=self.config.VERIFY_TIMEOUT)
+        except FutureTimeoutError as e:
+            logger.warning("Password verification timed out")
+            raise VerificationUnavailableError("verification timed out") from e
+
+        if verified:
+            self.verification_cache.add(password, hashed)
+        return verified
+
+    def get_lockout_remaining(self, username: str) -> int:
+        """로그인 잠금 해제까지 남은 시간 (초)"""
+        return self.limiter.get_lockout_remaining(username)
+
     def login(self, username: str, password: str) -> Optional[Dict[str, Any]]:
-        """관리자 로그인"""
+        """관리자 로그인 (잠긴 사용자명은 조회/검증 없이 거절)
+
+        Raises:
+            VerificationUnavailableError: 서버가 바빠 검증하지 못함 (실패 횟수에 포함하지 않음)
+        """
+        if self.limiter.get_lockout_remaining(username):
+            return None
+
         admin = self.admin_repo.get_by_username(username)
         if not admin:
+            self.limiter.record_failure(username)
             return None
 
         if not self.verify_password(password, admin['password_hash']):
+            self.limiter.record_failure(username)
             return None
 
+        self.limiter.reset(username)
+
         # 로그인 시간 업데이트
         self.admin_repo.update_last_login(admin['id'])
 
@@ -57,7 +224,11 @@ class AuthService:
         return self.admin_repo.create(admin)
 
     def change_password(self, admin_id: int, old_password: str, new_password: str) -> bool:
-        """관리자 비밀번호 변경"""
+        """관리자 비밀번호 변경
+
+        Raises:
+            VerificationUnavailableError: 서버가 바빠 현재 비밀번호를 검증하지 못함
+        """
         admin = self.admin_repo.get_by_id(admin_id)
         if not admin:
             return False
@@ -0,0 +1,101 @@
+"""캐시 적중/재계산 통계 (프로세스 메모리)
+
+캐시 래퍼(ui.utils.cached_services, services.shared_cache)가 조회마다 기록하며
+시스템 진단 페이지와 JSON 스냅샷으로 확인해 TTL/상한을 조정하는 데 사용합니다.
+"""
+import time
+import pickle
+import threading
+from datetime import datetime
+from typing import Any, Dict
+
+
+def payload_size(value: Any) -> int:
+    """캐시 값 크기 (bytes, st.cache_data와 같은 pickle 기준 - 직렬화 불가면 0)"""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+class CacheMetrics:
+    """캐시별 적중/미스/재계산 시간/값 크기/무효화/제거 횟수"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def _entry(self, name: str, tier: str) -> Dict[str, Any]:
+        """캐시 통계 항목 (락 보유 상태에서 호출)"""
+        entry = self._stats.get(name)
+        if entry is None:
+            entry = self._stats[name] = {
+                'tier': tier,
+                'hits': 0,
+                'misses': 0,
+                'invalidations': 0,
+                'evictions': 0,
+                'recompute_seconds_total': 0.0,
+                'recompute_seconds_max': 0.0,
+                'payload_bytes_total': 0,
+                'payload_bytes_last': 0,
+            }
+        return entry
+
+    def record_hit(self, name: str, tier: str):
+        with self._lock:
+            self._entry(name, tier)['hits'] += 1
+
+    def record_miss(self, name: str, tier: str, seconds: float, size: int):
+        """미스 - 원래 함수를 실행한 시간과 결과 크기 기록"""
+        with self._lock:
+            entry = self._entry(name, tier)
+            entry['misses'] += 1
+            entry['recompute_seconds_total'] += seconds
+            entry['recompute_seconds_max'] = max(entry['recompute_seconds_max'], seconds)
+            entry['payload_bytes_total'] += size
+            entry['payload_bytes_last'] = size
+
+    def record_invalidation(self, name: str, tier: str):
+        """의존 테이블 버전이 바뀌어 기존 항목을 쓸 수 없게 된 경우"""
+        with self._lock:
+            self._entry(name, tier)['invalidations'] += 1
+
+    def record_eviction(self, name: str, tier: str, count: int = 1):
+        """상한 초과로 항목이 제거된 경우"""
+        if count <= 0:
+            return
+        with self._lock:
+            self._entry(name, tier)['evictions'] += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """통계 스냅샷 (JSON 직렬화 가능)"""
+        with self._lock:
+            caches = {}
+            for name, entry in sorted(self._stats.items()):
+                lookups = entry['hits'] + entry['misses']
+                caches[name] = dict(
+                    entry,
+                    lookups=lookups,
+                    hit_rate=round(entry['hits'] / lookups, 4) if lookups else None,
+                    avg_recompute_ms=round(entry['recompute_seconds_total'] / entry['misses'] * 1000, 2)
+                    if entry['misses'] else None,
+                    avg_payload_bytes=entry['payload_bytes_total'] // entry['misses'] if entry['misses'] else None,
+                )
+
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'uptime_seconds': int(time.time() - self._started_at),
+            'caches': caches,
+        }
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self._started_at = time.time()
+
+
+# 프로세스 공용 인스턴스
+cache_metrics = CacheMetrics()
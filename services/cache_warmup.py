@@ -0,0 +1,122 @@
+"""프로세스 시작 시 캐시 예열
+
+배포 직후 첫 방문자가 모든 집계 쿼리를 기다리지 않도록 대시보드/공개 페이지 데이터를
+백그라운드 스레드에서 미리 계산합니다. 진행 상태는 파일에도 기록해
+다른 프로세스(업로드 API 헬스체크)에서 준비 여부를 확인할 수 있습니다.
+"""
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import shared_cache_config
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmup:
+    """캐시 예열 실행 및 준비 상태 관리"""
+
+    def __init__(self, config=shared_cache_config):
+        self.config = config
+        self.state_path = config.WARMUP_STATE_PATH
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Any] = {'status': 'pending', 'ready': False, 'tasks': []}
+
+    @property
+    def is_ready(self) -> bool:
+        """이 프로세스의 예열 완료 여부"""
+        with self._lock:
+            return self._state['ready']
+
+    def start(self, tasks: List[Tuple[str, Callable[[], Any]]]) -> Optional[threading.Thread]:
+        """예열 스레드 시작 (프로세스당 1회, 요청 처리를 기다리게 하지 않음)"""
+        with self._lock:
+            if self._thread is not None:
+                return self._thread
+
+            if not self.config.WARMUP_ENABLED:
+                self._state = {'status': 'disabled', 'ready': True, 'tasks': []}
+                self._write_state_locked()
+                return None
+
+            self._state = {
+                'status': 'running',
+                'ready': False,
+                'pid': os.getpid(),
+                'started_at': datetime.now().isoformat(timespec='seconds'),
+                'finished_at': None,
+                'tasks': [],
+            }
+            self._write_state_locked()
+            self._thread = threading.Thread(target=self._run, args=(tasks,), name='cache-warmup', daemon=True)
+            self._thread.start()
+            return self._thread
+
+    def _run(self, tasks: List[Tuple[str, Callable[[], Any]]]):
+        """예열 작업 순서대로 실행 (실패한 작업은 기록만 하고 계속)"""
+        total_started = time.perf_counter()
+        for name, task in tasks:
+            started = time.perf_counter()
+            error = None
+            try:
+                task()
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"Cache warm-up task failed: {name} - {e}")
+
+            with self._lock:
+                self._state['tasks'].append({
+                    'name': name,
+                    'seconds': round(time.perf_counter() - started, 4),
+                    'error': error,
+                })
+                self._write_state_locked()
+
+        with self._lock:
+            failed = sum(1 for task in self._state['tasks'] if task['error'])
+            self._state.update({
+                'status': 'ready',
+                'ready': True,
+                'failed': failed,
+                'finished_at': datetime.now().isoformat(timespec='seconds'),
+                'seconds': round(time.perf_counter() - total_started, 4),
+            })
+            self._write_state_locked()
+
+        logger.info(f"Cache warm-up finished: {len(tasks)} tasks, {failed} failed "
+                    f"({time.perf_counter() - total_started:.2f}s)")
+
+    def get_state(self) -> Dict[str, Any]:
+        """이 프로세스의 예열 상태"""
+        with self._lock:
+            return json.loads(json.dumps(self._state))
+
+    def read_state(self) -> Dict[str, Any]:
+        """파일에 기록된 예열 상태 (다른 프로세스용 - 기록이 없으면 status='unknown')"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'status': 'unknown', 'ready': False, 'tasks': []}
+
+    def _write_state_locked(self):
+        """상태 파일 기록 (락 보유 상태에서 호출, 임시 파일 후 교체)"""
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.state_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, ensure_ascii=False)
+            os.replace(temp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache warm-up state: {e}")
+
+
+# 서비스 인스턴스
+cache_warmup = CacheWarmup()
@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional
 from datetime import date
 from database.repositories import finance_repo
 from database.models import FinanceRecord
+from services.shared_cache import shared_cache
 from utils.validators import validate_finance_data
 from utils.formatters import format_currency, format_finance_type, format_finance_category
 
@@ -28,6 +29,7 @@ class FinanceService:
 
         return self.finance_repo.create(date_str, description, amount, transaction_type, category)
 
+    @shared_cache.cached('finances')
     def get_financial_summary(self) -> Dict[str, Any]:
         """재정 요약"""
         summary = self.finance_repo.get_summary()
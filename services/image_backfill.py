@@ -0,0 +1,56 @@
+"""기존 갤러리 사진 파생 이미지 백필
+
+파생 이미지(썸네일/중간 크기/WebP)가 없는 사진을 찾아 스레드 풀로 생성합니다.
+
+실행: python -m services.image_backfill
+"""
+import os
+import logging
+from typing import Dict
+
+from database.repositories import gallery_repo
+from services.image_service import image_derivative_service
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_derivatives() -> Dict[str, int]:
+    """파생 이미지가 없는 사진 전체 백필"""
+    stats = {'total': 0, 'generated': 0, 'skipped': 0, 'failed': 0}
+    futures = {}
+
+    # 중복 제거로 여러 사진이 같은 파일을 쓸 수 있으므로 파일 기준으로 한 번씩만 생성
+    file_paths = sorted({photo['file_path'] for photo in gallery_repo.get_all()})
+
+    for file_path in file_paths:
+        stats['total'] += 1
+        if not os.path.exists(file_path) or image_derivative_service.has_derivatives(file_path):
+            stats['skipped'] += 1
+            continue
+        futures[file_path] = image_derivative_service.submit(file_path)
+
+    for file_path, future in futures.items():
+        try:
+            future.result()
+            stats['generated'] += 1
+        except Exception as e:
+            stats['failed'] += 1
+            logger.warning(f"{file_path}: failed to generate derivatives: {e}")
+
+    return stats
+
+
+def main():
+    """CLI 진입점"""
+    from database.migrations import init_complete_db
+
+    init_complete_db()
+    stats = backfill_derivatives()
+    print(
+        f"사진 파생 이미지 백필 완료: 대상 {stats['total']}개, 생성 {stats['generated']}개, "
+        f"건너뜀 {stats['skipped']}개, 실패 {stats['failed']}개"
+    )
+
+
+if __name__ == "__main__":
+    main()
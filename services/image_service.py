@@ -0,0 +1,123 @@
+"""갤러리 사진 파생 이미지 서비스
+
+업로드 원본(최대 10MB)을 그대로 내려보내지 않도록 썸네일/중간 크기를 JPEG와 WebP로 만들어
+원본 옆에 저장합니다. ({stem}.thumb.jpg, {stem}.thumb.webp, {stem}.medium.jpg, {stem}.medium.webp)
+
+생성은 스레드 풀에서 실행되며 (Pillow는 디코딩/리사이즈/인코딩 중 GIL을 놓음)
+파생 이미지가 준비되기 전에는 원본을 표시합니다.
+"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from pathlib import Path
+from typing import Dict, List
+
+from config.settings import image_derivative_config
+
+logger = logging.getLogger(__name__)
+
+
+class ImageDerivativeService:
+    """사진 파생 이미지 생성/선택"""
+
+    # 파일 확장자 → Pillow 포맷
+    FORMATS = {'webp': 'WEBP', 'jpg': 'JPEG'}
+
+    def __init__(self, config=image_derivative_config):
+        self.config = config
+        self.sizes = {'thumb': config.THUMB_WIDTH, 'medium': config.MEDIUM_WIDTH}
+        self._executor = ThreadPoolExecutor(max_workers=config.WORKERS, thread_name_prefix='image-derivative')
+
+    def get_derivative_path(self, original_path: str, size: str, ext: str) -> str:
+        """파생 이미지 경로 (원본과 같은 디렉토리)"""
+        path = Path(original_path)
+        return str(path.with_name(f"{path.stem}.{size}.{ext}"))
+
+    def get_derivative_paths(self, original_path: str) -> List[str]:
+        """원본 하나에 대한 모든 파생 이미지 경로"""
+        return [
+            self.get_derivative_path(original_path, size, ext)
+            for size in self.sizes
+            for ext in self.FORMATS
+        ]
+
+    def has_derivatives(self, original_path: str) -> bool:
+        """파생 이미지가 모두 있는지 확인"""
+        return all(os.path.exists(path) for path in self.get_derivative_paths(original_path))
+
+    def generate(self, original_path: str) -> Dict[str, str]:
+        """파생 이미지 생성 (원본 1회 디코딩 → 크기별 리사이즈 → JPEG/WebP 저장)
+
+        Returns:
+            Dict: {'thumb.jpg': 경로, 'thumb.webp': 경로, ...}
+        """
+        from PIL import Image, ImageOps
+
+        generated = {}
+        with Image.open(original_path) as img:
+            # 휴대폰 사진의 EXIF 회전 정보 반영
+            img = ImageOps.exif_transpose(img)
+
+            # 큰 크기부터 줄여 나가며 재사용 (원본보다 크게 만들지 않음)
+            source = img
+            for size, width in sorted(self.sizes.items(), key=lambda item: -item[1]):
+                resized = source.copy()
+                resized.thumbnail((width, width * 4), Image.LANCZOS)
+
+                for ext, image_format in self.FORMATS.items():
+                    path = self.get_derivative_path(original_path, size, ext)
+                    self._save(resized, path, image_format)
+                    generated[f"{size}.{ext}"] = path
+
+                source = resized
+
+        logger.info(f"Image derivatives generated: {original_path} ({len(generated)} files)")
+        return generated
+
+    def submit(self, original_path: str) -> Future:
+        """파생 이미지 생성을 스레드 풀에 등록 (업로드 응답을 기다리게 하지 않음)"""
+        future = self._executor.submit(self.generate, original_path)
+        future.add_done_callback(lambda f: f.exception() and logger.error(
+            f"Image derivative generation failed: {original_path} - {f.exception()}"
+        ))
+        return future
+
+    def get_display_path(self, original_path: str, size: str = 'thumb') -> str:
+        """표시용 경로 - 해당 크기 파생 이미지 중 가장 작은 파일 (없으면 원본)"""
+        candidates = []
+        for ext in self.FORMATS:
+            path = self.get_derivative_path(original_path, size, ext)
+            try:
+                candidates.append((os.path.getsize(path), path))
+            except OSError:
+                continue
+
+        return min(candidates)[1] if candidates else original_path
+
+    def delete_derivatives(self, original_path: str):
+        """원본 삭제 시 파생 이미지도 삭제"""
+        for path in self.get_derivative_paths(original_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _save(self, img, path: str, image_format: str):
+        """임시 파일에 저장 후 교체 (생성 중인 파일이 표시되지 않도록)"""
+        from PIL import Image
+
+        if image_format == 'JPEG' and img.mode != 'RGB':
+            # JPEG는 투명도 미지원 - 흰 배경에 합성
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.convert('RGBA').split()[-1])
+            img = background
+
+        temp_path = f"{path}.tmp"
+        if image_format == 'JPEG':
+            img.save(temp_path, image_format, quality=self.config.JPEG_QUALITY, optimize=True, progressive=True)
+        else:
+            img.save(temp_path, image_format, quality=self.config.WEBP_QUALITY, method=4)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+
+
+# 서비스 인스턴스
+image_derivative_service = ImageDerivativeService()
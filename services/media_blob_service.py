@@ -0,0 +1,149 @@
+"""콘텐츠 해시 기반 중복 제거 서비스
+
+업로드를 스트리밍 저장하면서 계산한 SHA-256으로 media_blobs 테이블을 조회해
+같은 내용의 사진/동영상은 다시 저장하거나 다시 변환하지 않습니다.
+같은 파일을 여러 행이 공유하므로 삭제는 참조 수가 0이 될 때만 실제 파일에 반영합니다.
+"""
+import os
+import logging
+from typing import Optional, Dict, Any, List
+
+from database.models import Video
+from database.repositories import video_repo, gallery_repo, media_blob_repo
+from services.video_service import VideoService
+
+logger = logging.getLogger(__name__)
+
+
+class MediaBlobService:
+    """콘텐츠 해시 인덱스 관리"""
+
+    def __init__(self):
+        self.media_blob_repo = media_blob_repo
+
+    def is_known(self, sha256: str) -> bool:
+        """이미 저장된 내용인지 확인 (PK 조회)"""
+        return self.media_blob_repo.exists(sha256)
+
+    # ------------------------------------------------------------------
+    # 사진
+    # ------------------------------------------------------------------
+
+    def register_photo(self, sha256: str, file_path: str, file_size: int) -> bool:
+        """갤러리 사진 파일 참조 추가"""
+        return self.media_blob_repo.acquire(sha256, 'photo', file_path, file_size)
+
+    def release_photo(self, photo: Dict[str, Any]) -> bool:
+        """갤러리 사진 참조 제거 - 실제 파일을 지워도 되면 True"""
+        if photo.get('content_sha256'):
+            blob = self.media_blob_repo.release(photo['content_sha256'])
+            return blob is None or blob['ref_count'] <= 0
+
+        # 해시 인덱스 도입 전 사진 - 같은 파일을 쓰는 다른 사진이 없을 때만 삭제
+        return gallery_repo.count_by_file_path(photo['file_path']) <= 1
+
+    # ------------------------------------------------------------------
+    # 동영상
+    # ------------------------------------------------------------------
+
+    def ingest_video(self, video_service: VideoService, temp_path: str, sha256: str, file_size: int,
+                     original_filename: str, title: str, description: str = '',
+                     match_id: Optional[int] = None, uploaded_by: Optional[int] = None) -> Dict[str, Any]:
+        """저장이 끝난 임시 파일로 동영상 등록
+
+        같은 내용이 이미 변환 완료되어 있으면 임시 파일을 버리고 HLS/썸네일을 공유하는 동영상을 만들고,
+        처음 보는 내용이면 원본 위치로 옮긴 뒤 변환 대기열에 등록합니다.
+
+        Returns:
+            Dict: {'success', 'message', 'video_id', 'duplicate_of'}
+        """
+        result = {'success': False, 'message': '', 'video_id': None, 'duplicate_of': None}
+
+        if self.is_known(sha256):
+            os.remove(temp_path)
+            return self._register_duplicate(result, sha256, original_filename, title, description,
+                                            match_id, uploaded_by)
+
+        video = Video(
+            title=title,
+            description=description,
+            original_filename=original_filename,
+            file_size=file_size,
+            status='pending',
+            match_id=match_id,
+            uploaded_by=uploaded_by
+        )
+        video_id = video_repo.create(video)
+        if not video_id:
+            os.remove(temp_path)
+            result['message'] = '동영상 메타데이터 생성 실패'
+            return result
+
+        original_path = video_service.get_original_path(video_id, original_filename)
+        os.replace(temp_path, original_path)
+
+        self.media_blob_repo.acquire(sha256, 'video', str(original_path), file_size, owner_video_id=video_id)
+        video_repo.set_content_hash(video_id, sha256)
+
+        if not video_repo.enqueue_processing(video_id, str(original_path)):
+            video_repo.update_processing_status(video_id, 'failed')
+            result['message'] = '변환 대기열 등록 실패'
+            return result
+
+        result.update({'success': True, 'message': '변환 대기열에 등록되었습니다.', 'video_id': video_id})
+        return result
+
+    def _register_duplicate(self, result: Dict[str, Any], sha256: str, original_filename: str, title: str,
+                            description: str, match_id: Optional[int], uploaded_by: Optional[int]) -> Dict[str, Any]:
+        """같은 내용의 동영상이 이미 있을 때 - 변환 결과를 공유하는 동영상 생성"""
+        existing = video_repo.get_by_content_hash(sha256)
+        if not existing:
+            result['message'] = '같은 내용의 동영상 정보를 찾을 수 없습니다.'
+            return result
+
+        result['duplicate_of'] = existing['id']
+
+        if existing['status'] != 'completed':
+            status_text = '변환에 실패한 상태입니다. 목록에서 재시도해주세요' if existing['status'] == 'failed' \
+                else '변환 대기 중이거나 변환 중입니다'
+            result['message'] = f"같은 동영상('{existing['title']}')이 이미 {status_text}."
+            return result
+
+        video_id = video_repo.create_duplicate(existing['id'], title, description, original_filename,
+                                               match_id, uploaded_by)
+        if not video_id:
+            result['message'] = '동영상 메타데이터 생성 실패'
+            return result
+
+        logger.info(f"Video {video_id}: duplicate of video {existing['id']} - sharing HLS output (sha256={sha256[:16]})")
+        result.update({
+            'success': True,
+            'message': f"같은 동영상('{existing['title']}')이 이미 변환되어 있어 변환 없이 바로 등록했습니다.",
+            'video_id': video_id
+        })
+        return result
+
+    def release_video(self, video: Dict[str, Any]) -> List[int]:
+        """동영상 참조 제거 - 파일을 삭제해도 되는 동영상 ID 목록 반환
+
+        공유 파일(HLS/썸네일)은 처음 변환한 동영상 ID 경로에 있으므로
+        마지막 참조가 사라질 때만 그 ID의 파일을 삭제합니다.
+        """
+        if not video.get('content_sha256'):
+            return [video['id']]
+
+        blob = self.media_blob_repo.release(video['content_sha256'])
+        if blob is None:
+            return [video['id']]
+
+        owner_video_id = blob['owner_video_id']
+        purge_ids = []
+        if video['id'] != owner_video_id or blob['ref_count'] <= 0:
+            purge_ids.append(video['id'])
+        if blob['ref_count'] <= 0 and owner_video_id and owner_video_id != video['id']:
+            purge_ids.append(owner_video_id)
+        return purge_ids
+
+
+# 서비스 인스턴스
+media_blob_service = MediaBlobService()
@@ -2,6 +2,7 @@
 from typing import List, Dict, Any, Optional
 from database.repositories import player_repo, player_stats_repo
 from database.models import Player
+from services.shared_cache import shared_cache
 from utils.validators import validate_player_data
 from utils.formatters import format_position_display, format_phone_number
 
@@ -97,10 +98,12 @@ class PlayerService:
         all_players = self.get_all_players()
         return [player for player in all_players if player['position'] == position]
 
+    @shared_cache.cached('player_stats', 'players', 'matches', daily=True)
     def get_leaderboard_data(self) -> Dict[str, List]:
         """순위표 데이터"""
         return self.player_stats_repo.get_leaderboard_data()
 
+    @shared_cache.cached('player_stats', 'attendance', 'matches', daily=True)
     def get_team_average_stats(self) -> Dict[str, float]:
         """팀 평균 통계"""
         return self.player_stats_repo.get_team_average_stats()
@@ -0,0 +1,277 @@
+"""이어올리기(재개 가능한 분할 업로드) 서비스
+
+tus 프로토콜과 같은 흐름으로 대용량 경기 영상을 여러 요청에 나누어 받습니다.
+1. 관리자 페이지에서 제목/경기 정보와 함께 업로드 티켓 발급
+2. 브라우저가 티켓으로 업로드 생성 (파일명, 전체 크기)
+3. 오프셋을 맞춰 조각 전송 - 연결이 끊기면 마지막으로 기록된 위치부터 다시 전송
+4. 전체 크기를 받으면 동영상 등록 후 변환 대기열에 추가 (같은 내용이 이미 변환되어 있으면 공유)
+   완료 처리는 status='finalizing' 선점에 성공한 요청 하나만 수행하고, 나머지 요청은 진행 상태만 보고
+
+조각은 uploads/videos/original/ 안의 .part 파일에 바로 기록하므로 완료 시 rename만 하면 됩니다.
+"""
+import os
+import secrets
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, BinaryIO
+
+from config.settings import app_config, upload_api_config
+from database.repositories import video_upload_repo
+from services.media_blob_service import media_blob_service
+from services.video_service import VideoService
+from utils.file_streaming import CHUNK_SIZE, HEADER_SIZE, hash_file
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResumableUploadService:
+    """이어올리기 업로드 처리"""
+
+    def __init__(self, upload_dir: str = None):
+        self.video_service = VideoService(upload_dir=upload_dir or app_config.UPLOAD_DIR)
+        self.ttl_hours = upload_api_config.TICKET_TTL_HOURS
+        self.finalize_stale_minutes = upload_api_config.FINALIZE_STALE_MINUTES
+
+    def get_part_path(self, upload_id: str) -> Path:
+        """수신 중인 조각 파일 경로 (원본 디렉토리 안 - 완료 시 같은 파일시스템에서 rename)"""
+        return self.video_service.video_original_dir / f".upload-{upload_id}.part"
+
+    def create_ticket(self, title: str, description: str = '', match_id: Optional[int] = None,
+                      admin_id: Optional[int] = None) -> Optional[str]:
+        """업로드 티켓 발급 (추측할 수 없는 업로드 ID가 곧 업로드 권한)"""
+        self.cleanup_expired()
+
+        upload_id = secrets.token_urlsafe(24)
+        if not video_upload_repo.create_ticket(upload_id, title, description, match_id, admin_id, self.ttl_hours):
+            return None
+        return upload_id
+
+    def create_upload(self, upload_id: str, filename: str, upload_length: int) -> Dict[str, Any]:
+        """티켓으로 업로드 생성 (같은 파일로 다시 호출하면 현재 오프셋 반환)"""
+        upload = video_upload_repo.get_by_id(upload_id)
+        error = self._check_upload(upload, allowed_statuses=('ticket', 'uploading'))
+        if error:
+            return error
+
+        if upload['status'] == 'uploading':
+            # 브라우저가 업로드 주소를 잃어버린 경우 - 같은 파일이면 이어서 전송
+            if upload['original_filename'] != filename or upload['upload_length'] != upload_length:
+                return self._error('conflict', '이미 다른 파일 업로드에 사용된 티켓입니다.')
+            return self._success(upload)
+
+        is_valid, message = self.video_service.validate_uploaded_file(filename, upload_length)
+        if not is_valid:
+            return self._error('invalid', message)
+        if upload_length <= 0:
+            return self._error('invalid', '빈 파일은 업로드할 수 없습니다.')
+
+        part_path = self.get_part_path(upload_id)
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path.touch()
+
+        if not video_upload_repo.start_upload(upload_id, filename, upload_length):
+            part_path.unlink()
+            return self._error('conflict', '업로드를 시작할 수 없습니다. 티켓을 다시 발급해주세요.')
+
+        logger.info(f"Resumable upload started: {upload_id} ({filename}, {upload_length} bytes)")
+        return self._success(video_upload_repo.get_by_id(upload_id))
+
+    def get_status(self, upload_id: str) -> Dict[str, Any]:
+        """업로드 진행 상태 (완료 처리는 하지 않음 - 전체 수신 후 PATCH를 다시 보내면 이어서 처리)"""
+        upload = video_upload_repo.get_by_id(upload_id)
+        error = self._check_upload(upload, allowed_statuses=('uploading', 'finalizing', 'completed'))
+        if error:
+            return error
+        return self._success(upload)
+
+    def append_chunk(self, upload_id: str, offset: int, source: BinaryIO,
+                     content_length: Optional[int]) -> Dict[str, Any]:
+        """offset 위치부터 조각 기록
+
+        연결이 중간에 끊겨도 받은 만큼은 기록하고 오프셋을 갱신하므로 클라이언트는 HEAD로
+        확인한 위치부터 다시 보내면 됩니다. 전체 크기 위치로 빈 요청을 보내면 완료 처리를
+        다시 시도하거나 진행 상태를 보고합니다.
+        """
+        upload = video_upload_repo.get_by_id(upload_id)
+        error = self._check_upload(upload, allowed_statuses=('uploading', 'finalizing', 'completed'))
+        if error:
+            return error
+
+        if offset != upload['upload_offset']:
+            return self._error('conflict', f"오프셋이 일치하지 않습니다. (서버: {upload['upload_offset']})",
+                               upload)
+
+        if upload['status'] != 'uploading' or offset == upload['upload_length']:
+            # 전체 수신 후 재전송 (응답 유실, 완료 처리 확인) - 완료 처리만 다시 시도
+            return self._finalize(upload)
+
+        remaining = upload['upload_length'] - offset
+        if content_length is not None and content_length > remaining:
+            return self._error('invalid', '전체 파일 크기를 초과하는 데이터입니다.', upload)
+
+        part_path = self.get_part_path(upload_id)
+        if not part_path.exists():
+            return self._error('not_found', '업로드 중인 파일을 찾을 수 없습니다.')
+
+        with open(part_path, 'r+b') as f:
+            if not self._try_lock(f):
+                return self._error('conflict', '같은 업로드에 대한 다른 요청이 진행 중입니다.', upload)
+
+            # 잠금을 잡은 뒤 오프셋 재확인 - 잠금 전에 읽은 오프셋은 먼저 끝난 요청이 이미 옮겼을 수 있음
+            # (오래된 오프셋으로 truncate하면 앞 요청이 기록한 데이터가 지워짐)
+            upload = video_upload_repo.get_by_id(upload_id)
+            error = self._check_upload(upload, allowed_statuses=('uploading',))
+            if error:
+                return error
+            if offset != upload['upload_offset']:
+                return self._error('conflict', f"오프셋이 일치하지 않습니다. (서버: {upload['upload_offset']})",
+                                   upload)
+
+            # 기록은 됐지만 오프셋 갱신 전에 끊긴 데이터는 버림
+            f.seek(offset)
+            f.truncate()
+
+            written, header_error = self._copy_stream(source, f, min(remaining, content_length or remaining),
+                                                      validate_header=(offset == 0))
+            if header_error:
+                f.seek(0)
+                f.truncate()
+                return self._error('invalid', header_error, upload)
+
+            f.flush()
+            os.fsync(f.fileno())
+
+            # 오프셋 갱신까지 잠금 안에서 - 다음 요청은 갱신된 오프셋을 보고 이어서 기록
+            new_offset = offset + written
+            if written and not video_upload_repo.advance_offset(upload_id, offset, new_offset, self.ttl_hours):
+                return self._error('conflict', '다른 요청이 먼저 오프셋을 갱신했습니다.', upload)
+
+        upload = video_upload_repo.get_by_id(upload_id)
+        if new_offset == upload['upload_length']:
+            return self._finalize(upload)
+
+        if content_length is not None and written < content_length:
+            logger.warning(f"Resumable upload {upload_id}: connection lost at {new_offset} bytes")
+        return self._success(upload)
+
+    def cleanup_expired(self) -> int:
+        """유효 시간이 지난 미완료 업로드 정리 (조각 파일 삭제)"""
+        expired_count = 0
+        for upload in video_upload_repo.get_expired():
+            part_path = self.get_part_path(upload['id'])
+            if part_path.exists():
+                part_path.unlink()
+            if video_upload_repo.mark_expired(upload['id']):
+                expired_count += 1
+
+        if expired_count:
+            logger.info(f"Expired {expired_count} resumable uploads")
+        return expired_count
+
+    def _copy_stream(self, source: BinaryIO, dest: BinaryIO, limit: int, validate_header: bool):
+        """요청 본문을 CHUNK_SIZE 단위로 기록 (반환: 기록한 바이트 수, 헤더 오류 메시지)"""
+        written = 0
+        header = b''
+
+        while written < limit:
+            try:
+                chunk = source.read(min(CHUNK_SIZE, limit - written))
+            except Exception as e:
+                # 클라이언트 연결 끊김 - 여기까지 받은 데이터는 유지
+                logger.info(f"Upload stream interrupted after {written} bytes: {e}")
+                break
+            if not chunk:
+                break
+
+            if validate_header and len(header) < HEADER_SIZE:
+                header += chunk[:HEADER_SIZE - len(header)]
+                if len(header) >= HEADER_SIZE or written + len(chunk) >= limit:
+                    if not self.video_service.is_video_header(header):
+                        return 0, '파일 내용이 동영상 형식이 아닙니다.'
+
+            dest.write(chunk)
+            written += len(chunk)
+
+        return written, None
+
+    def _finalize(self, upload: Dict[str, Any]) -> Dict[str, Any]:
+        """전체 수신 완료 - 중복 확인 후 동영상 등록 (새 내용이면 원본 위치로 이동 후 변환 대기열 추가)
+
+        마지막 PATCH와 재시도 PATCH가 겹쳐도 같은 조각 파일을 두 번 등록하지 않도록
+        'finalizing' 선점에 성공한 요청만 처리합니다.
+        """
+        if not video_upload_repo.claim_finalize(upload['id'], self.finalize_stale_minutes):
+            # 다른 요청이 완료 처리 중이거나 이미 끝남 - 현재 상태만 보고
+            upload = video_upload_repo.get_by_id(upload['id'])
+            error = self._check_upload(upload, allowed_statuses=('finalizing', 'completed'))
+            return error or self._success(upload)
+
+        part_path = self.get_part_path(upload['id'])
+
+        # 조각이 여러 요청에 나뉘어 와서 해시 상태를 이어갈 수 없으므로 완료 시 한 번 순차로 읽어 계산
+        try:
+            sha256 = hash_file(str(part_path))
+        except OSError as e:
+            logger.error(f"Resumable upload {upload['id']}: cannot read part file - {e}")
+            video_upload_repo.mark_expired(upload['id'])
+            return self._error('server', '업로드된 파일을 읽을 수 없습니다. 다시 업로드해주세요.', upload)
+
+        ingest_result = media_blob_service.ingest_video(
+            self.video_service,
+            str(part_path),
+            sha256,
+            upload['upload_length'],
+            upload['original_filename'],
+            upload['title'],
+            upload['description'] or '',
+            upload['match_id'],
+            upload['uploaded_by']
+        )
+        if not ingest_result['success']:
+            # 조각 파일은 ingest_video에서 정리됨 - 같은 티켓으로 다시 시도하지 않도록 만료 처리
+            video_upload_repo.mark_expired(upload['id'])
+            return self._error('duplicate' if ingest_result['duplicate_of'] else 'server',
+                               ingest_result['message'], upload)
+
+        video_id = ingest_result['video_id']
+        video_upload_repo.complete(upload['id'], video_id)
+        logger.info(f"Resumable upload {upload['id']} completed: video {video_id}")
+        return self._success(video_upload_repo.get_by_id(upload['id']))
+
+    def _check_upload(self, upload: Optional[Dict[str, Any]], allowed_statuses: tuple) -> Optional[Dict[str, Any]]:
+        """업로드 세션 상태 확인 (문제 없으면 None)"""
+        if not upload:
+            return self._error('not_found', '업로드를 찾을 수 없습니다.')
+        if upload['status'] == 'expired' or (upload['expired'] and upload['status'] != 'completed'):
+            return self._error('expired', '업로드 유효 시간이 지났습니다. 티켓을 다시 발급해주세요.')
+        if upload['status'] not in allowed_statuses:
+            return self._error('conflict', f"현재 상태에서 처리할 수 없는 요청입니다. ({upload['status']})", upload)
+        return None
+
+    @staticmethod
+    def _try_lock(f) -> bool:
+        """조각 파일 배타 잠금 (같은 업로드에 동시 PATCH 방지)"""
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _success(upload: Dict[str, Any]) -> Dict[str, Any]:
+        return {'success': True, 'message': '', 'reason': None, 'upload': upload}
+
+    @staticmethod
+    def _error(reason: str, message: str, upload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {'success': False, 'message': message, 'reason': reason, 'upload': upload}
+
+
+# 서비스 인스턴스
+resumable_upload_service = ResumableUploadService()
@@ -0,0 +1,192 @@
+"""프로세스 간 공유 읽기 캐시
+
+st.cache_data는 Streamlit 프로세스 메모리에만 있어 재시작하거나 여러 프로세스로 실행하면 매번 비어 있습니다.
+집계 결과(순위표, 팀 평균, 재정 요약)를 디스크 SQLite 파일에 저장해 재시작 후에도, 프로세스끼리도 공유합니다.
+
+유효성 검사:
+- 본 DB의 table_versions 테이블(트리거가 변경 시 버전 증가)에서 의존 테이블 버전을 읽어 저장 당시 버전과 비교
+  (database.table_versions - PRAGMA data_version이 바뀐 경우에만 다시 조회)
+- 항목 수/전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+
+캐시 오류는 경고만 남기고 원래 함수를 실행합니다.
+"""
+import os
+import json
+import time
+import sqlite3
+import logging
+import functools
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from config.settings import shared_cache_config
+from database.table_versions import table_versions
+from services.cache_metrics import cache_metrics, payload_size
+
+logger = logging.getLogger(__name__)
+
+
+class SharedCache:
+    """디스크 SQLite 기반 공유 캐시"""
+
+    def __init__(self, config=shared_cache_config):
+        self.config = config
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 연결 (스레드별)
+    # ------------------------------------------------------------------
+
+    def _cache_conn(self) -> sqlite3.Connection:
+        """캐시 파일 연결"""
+        conn = getattr(self._local, 'cache_conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.config.PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.config.PATH, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._ensure_schema(conn)
+            self._local.cache_conn = conn
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_entries(
+                    key TEXT PRIMARY KEY,
+                    versions TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access ON cache_entries(last_access)")
+            self._schema_ready = True
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, versions: Dict[str, int], name: str = 'shared') -> Tuple[bool, Any]:
+        """캐시 조회 (반환: 적중 여부, 값)"""
+        conn = self._cache_conn()
+        row = conn.execute(
+            "SELECT versions, value, expires_at, last_access FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        stored_versions, value, expires_at, last_access = row
+        now = time.time()
+        if json.loads(stored_versions) != versions:
+            cache_metrics.record_invalidation(name, 'shared')
+            return False, None
+        if expires_at <= now:
+            cache_metrics.record_eviction(name, 'shared')
+            return False, None
+
+        if now - last_access >= self.config.TOUCH_INTERVAL_SECONDS:
+            conn.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (now, key))
+        return True, json.loads(value)
+
+    def set(self, key: str, versions: Dict[str, int], value: Any, ttl: Optional[int] = None):
+        """캐시 저장 후 상한 초과분 제거"""
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        now = time.time()
+        conn = self._cache_conn()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO cache_entries (key, versions, value, size, created_at, expires_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, json.dumps(versions, sort_keys=True), payload, len(payload), now,
+             now + (ttl or self.config.DEFAULT_TTL_SECONDS), now)
+        )
+        # LRU 제거는 다른 항목이 대상이므로 캐시 파일 전체 기준으로 기록
+        cache_metrics.record_eviction('SharedCache', 'shared', self._evict(conn))
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """항목 수/전체 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        count, total_size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+        evicted = 0
+
+        if count > self.config.MAX_ENTRIES:
+            evicted += conn.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY last_access LIMIT ?)",
+                (count - self.config.MAX_ENTRIES,)
+            ).rowcount
+
+        while total_size > self.config.MAX_BYTES:
+            row = conn.execute("SELECT key, size FROM cache_entries ORDER BY last_access LIMIT 1").fetchone()
+            if row is None:
+                break
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (row[0],))
+            total_size -= row[1]
+            evicted += 1
+
+        return evicted
+
+    def clear(self):
+        """전체 캐시 삭제"""
+        self._cache_conn().execute("DELETE FROM cache_entries")
+
+    # ------------------------------------------------------------------
+    # 데코레이터
+    # ------------------------------------------------------------------
+
+    def cached(self, *tables: str, ttl: Optional[int] = None, daily: bool = False) -> Callable:
+        """서비스 메서드 결과를 공유 캐시에 저장하는 데코레이터
+
+        Args:
+            tables: 결과가 의존하는 테이블 (table_versions에 등록된 테이블)
+            ttl: 최대 유지 시간 (초, 기본 DEFAULT_TTL_SECONDS)
+            daily: 결과가 오늘 날짜에 따라 바뀌면 True (date('now') 조건 사용 쿼리)
+        """
+        def decorator(func):
+            name = func.__qualname__  # 통계 표시용
+            key_prefix = f"{func.__module__}.{func.__qualname__}"
+
+            @functools.wraps(func)
+            def wrapper(service, *args, **kwargs):
+                if not self.config.ENABLED:
+                    return func(service, *args, **kwargs)
+
+                key = json.dumps([key_prefix, args, kwargs, date.today().isoformat() if daily else None],
+                                 sort_keys=True, default=str)
+                try:
+                    versions = table_versions.get(*tables)
+                    hit, value = self.get(key, versions, name)
+                except sqlite3.Error as e:
+                    logger.warning(f"Shared cache lookup failed for {name}: {e}")
+                    return func(service, *args, **kwargs)
+
+                if hit:
+                    cache_metrics.record_hit(name, 'shared')
+                    return value
+
+                started = time.perf_counter()
+                value = func(service, *args, **kwargs)
+                cache_metrics.record_miss(name, 'shared', time.perf_counter() - started, payload_size(value))
+                try:
+                    self.set(key, versions, value, ttl)
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    logger.warning(f"Shared cache store failed for {name}: {e}")
+                return value
+
+            return wrapper
+
+        return decorator
+
+
+# 공유 캐시 인스턴스
+shared_cache = SharedCache()
@@ -0,0 +1,75 @@
+"""기존 동영상 해상도/화면비 백필
+
+해상도 정보 없이 처리 완료된 동영상에 width/height/aspect_ratio/fps/codec을 채웁니다.
+원본 → HLS 마스터 플레이리스트 순으로 ffprobe를 시도하고, 둘 다 안 되면 썸네일 크기를 사용합니다.
+
+실행: python -m services.video_backfill
+"""
+import os
+import logging
+from typing import Optional, Dict, Any
+
+from config.settings import app_config
+from database.repositories import video_repo
+from services.video_service import VideoService
+
+logger = logging.getLogger(__name__)
+
+
+def _probe_media_info(video_service: VideoService, video: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """동영상 한 개의 해상도 정보 조회"""
+    original_path = video['original_path'] or str(
+        video_service.get_original_path(video['id'], video['original_filename'])
+    )
+
+    for path in (original_path, video['hls_path']):
+        if path and os.path.exists(path):
+            video_info = video_service.get_video_info(path)
+            if video_info and video_info.get('width') and video_info.get('height'):
+                return video_service.extract_media_info(video_info)
+
+    # 썸네일은 원본 화면비 그대로 가로 640px로 만들어짐
+    thumbnail_path = video['thumbnail_path']
+    if thumbnail_path and os.path.exists(thumbnail_path):
+        try:
+            from PIL import Image
+
+            with Image.open(thumbnail_path) as img:
+                width, height = img.size
+            return {'width': width, 'height': height, 'fps': None, 'codec': None}
+        except Exception as e:
+            logger.warning(f"Video {video['id']}: failed to read thumbnail size: {e}")
+
+    return None
+
+
+def backfill_media_info() -> Dict[str, int]:
+    """해상도 정보가 없는 완료 동영상 전체 백필"""
+    video_service = VideoService(upload_dir=app_config.UPLOAD_DIR)
+    stats = {'total': 0, 'updated': 0, 'skipped': 0}
+
+    for video in video_repo.get_missing_media_info():
+        stats['total'] += 1
+        media_info = _probe_media_info(video_service, video)
+
+        if media_info and video_repo.update_media_info(video['id'], **media_info):
+            stats['updated'] += 1
+            logger.info(f"Video {video['id']}: {media_info['width']}x{media_info['height']}")
+        else:
+            stats['skipped'] += 1
+            logger.warning(f"Video {video['id']}: media info not available")
+
+    return stats
+
+
+def main():
+    """CLI 진입점"""
+    from database.migrations import init_complete_db
+
+    init_complete_db()
+    stats = backfill_media_info()
+    print(f"동영상 해상도 백필 완료: 대상 {stats['total']}개, 갱신 {stats['updated']}개, 건너뜀 {stats['skipped']}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,48 @@
 """동영상 업로드 및 HLS 트랜스코딩 서비스"""
 import os
+import math
 import subprocess
 import json
 import logging
 import shutil
-from typing import Optional, Dict, Any, Tuple
+import tempfile
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple, Callable
 from pathlib import Path
 from datetime import datetime
+from config.settings import app_config
+from utils.file_streaming import stream_to_file, stream_to_temp_file
 
 logger = logging.getLogger(__name__)
 
+# nginx가 업로드 디렉토리(app_config.UPLOAD_DIR)를 제공하는 웹 경로
+WEB_UPLOADS_PREFIX = "/futsal/uploads"
+
+
+def get_upload_web_url(path: Optional[str], upload_dir: str = None) -> Optional[str]:
+    """업로드 디렉토리 안 파일 경로 → 웹 경로 (업로드 디렉토리 밖이거나 경로가 없으면 None)"""
+    if not path:
+        return None
+    relative = os.path.relpath(os.path.abspath(path), os.path.abspath(upload_dir or app_config.UPLOAD_DIR))
+    if relative == '..' or relative.startswith('..' + os.sep):
+        return None
+    return f"{WEB_UPLOADS_PREFIX}/{Path(relative).as_posix()}"
+
+
+def get_video_web_urls(video: Dict[str, Any], upload_dir: str = None) -> Dict[str, Optional[str]]:
+    """동영상 재생용 웹 경로 (플레이리스트, 포스터, 탐색 미리보기 디렉토리)
+
+    중복 제거로 만든 동영상은 원본 동영상 ID 아래의 파일을 공유하므로
+    동영상 ID가 아니라 저장된 경로에서 만듭니다.
+    """
+    preview_vtt_url = get_upload_web_url(video.get('preview_vtt_path'), upload_dir)
+    return {
+        'hls': get_upload_web_url(video.get('hls_path'), upload_dir),
+        'poster': get_upload_web_url(video.get('thumbnail_path'), upload_dir),
+        'preview_base': preview_vtt_url.rsplit('/', 1)[0] + '/' if preview_vtt_url else None,
+    }
+
 class VideoService:
     """동영상 업로드 및 트랜스코딩 서비스"""
 
@@ -19,16 +52,56 @@ class VideoService:
     # 최대 파일 크기 (2GB)
     MAX_FILE_SIZE = 2 * 1024 * 1024 * 1024
 
-    # HLS 해상도 설정 (height:bitrate)
-    # 720p 단일 해상도로 운영 (필요시 480p 추가 가능)
+    # HLS ABR 사다리 (높은 화질부터) - ffmpeg 한 번 실행으로 디코딩 1회에 모든 해상도 인코딩
+    # 원본보다 높은 해상도는 만들지 않음
     HLS_VARIANTS = {
-        '720p': {'height': 720, 'bitrate': '2500k', 'audio_bitrate': '128k'}
-        # '480p': {'height': 480, 'bitrate': '1000k', 'audio_bitrate': '96k'},
-        # '360p': {'height': 360, 'bitrate': '600k', 'audio_bitrate': '64k'}
+        '720p': {'height': 720, 'bitrate': '2500k', 'audio_bitrate': '128k'},
+        '480p': {'height': 480, 'bitrate': '1000k', 'audio_bitrate': '96k'},
+        '360p': {'height': 360, 'bitrate': '600k', 'audio_bitrate': '64k'}
     }
 
-    def __init__(self, upload_dir: str = "uploads"):
+    # H.264 Main@4.0 + AAC-LC (마스터 플레이리스트 CODECS 값과 일치해야 함)
+    H264_PROFILE = 'main'
+    H264_LEVEL = '4.0'
+    HLS_CODECS = 'avc1.4d4028,mp4a.40.2'
+
+    # 세그먼트 길이 (초) - 모든 해상도의 키프레임을 같은 시점에 맞춰 화질 전환이 매끄럽도록 함
+    HLS_SEGMENT_SECONDS = 6
+
+    # 트랜스코딩 제한 시간 (초)
+    TRANSCODE_TIMEOUT = 1800
+
+    # 썸네일 단계 설정 (디코딩 1회로 포스터 + 여러 크기 + 탐색 미리보기 스프라이트 생성)
+    POSTER_WIDTHS = {'large': 1280, 'small': 320}  # 기본 640px 포스터는 thumbnails/{id}.jpg
+    POSTER_DEFAULT_WIDTH = 640
+    POSTER_CANDIDATES = 50  # 포스터 후보 프레임 수 (thumbnail 필터가 메모리에 보관)
+    POSTER_SCENE_THRESHOLD = 0.02  # 이전 후보와 거의 같은 프레임(검은 화면, 정지 화면) 제외
+    SPRITE_TILE_WIDTH = 160
+    SPRITE_COLUMNS = 10
+    SPRITE_ROWS = 10
+    SPRITE_MIN_INTERVAL = 2  # 미리보기 간격 하한 (초)
+    SPRITE_MAX_TILES = 300  # 영상 전체 미리보기 최대 개수
+    THUMBNAIL_TIMEOUT = 900
+
+    # 리먹스(재인코딩 없이 HLS로 포장) 허용 조건 - 이미 H.264/AAC인 휴대폰 영상용
+    REMUX_MAX_SHORT_SIDE = 1080  # 짧은 변 기준 최대 해상도
+    REMUX_MAX_BITRATE = 8_000_000  # 최대 비트레이트 (bps)
+    REMUX_MAX_KEYFRAME_INTERVAL = 10.0  # 키프레임 간격 상한 (초) - 세그먼트 길이를 결정
+    REMUX_TIMEOUT = 300
+
+    # ffprobe H.264 profile → CODECS 문자열의 profile_idc + constraint 바이트
+    H264_PROFILE_CODES = {
+        'Constrained Baseline': '42e0',
+        'Baseline': '4200',
+        'Main': '4d40',
+        'High': '6400',
+    }
+
+    def __init__(self, upload_dir: str = "uploads", ffmpeg_threads: int = 0,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
         self.upload_dir = Path(upload_dir)
+        self.ffmpeg_threads = ffmpeg_threads  # 0이면 ffmpeg 자동 (모든 코어 사용)
+        self.progress_callback = progress_callback  # ffmpeg 진행률 수신 (stage, percent, speed, eta_seconds)
         self.video_original_dir = self.upload_dir / "videos" / "original"
         self.video_hls_dir = self.upload_dir / "videos" / "hls"
         self.thumbnail_dir = self.upload_dir / "thumbnails"
@@ -42,6 +115,17 @@ class VideoService:
         self.video_hls_dir.mkdir(parents=True, exist_ok=True)
         self.thumbnail_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def is_video_header(header: bytes) -> bool:
+        """컨테이너 매직 바이트 확인 (MP4/MOV/M4V, MKV/WebM, AVI)"""
+        if header[4:8] in (b'ftyp', b'moov', b'mdat', b'free', b'wide', b'skip'):
+            return True  # ISO BMFF / QuickTime
+        if header.startswith(b'\x1a\x45\xdf\xa3'):
+            return True  # EBML (Matroska, WebM)
+        if header.startswith(b'RIFF') and header[8:12] == b'AVI ':
+            return True
+        return False
+
     def validate_uploaded_file(self, filename: str, file_size: int) -> Tuple[bool, str]:
         """업로드된 파일 검증 (UploadedFile 객체용)"""
         # 확장자 체크
@@ -92,6 +176,8 @@ class VideoService:
             if not video_stream:
                 return None
 
+            audio_stream = next((s for s in info.get('streams', []) if s['codec_type'] == 'audio'), None)
+
             # 재생 시간 (초)
             duration = float(info.get('format', {}).get('duration', 0))
 
@@ -107,37 +193,197 @@ class VideoService:
             except (ValueError, ZeroDivisionError, TypeError):
                 fps = 0.0
 
+            # 휴대폰 세로 영상은 회전 메타데이터로 저장됨 - 재생 기준 가로/세로로 변환
+            width, height = video_stream.get('width'), video_stream.get('height')
+            rotation = self._get_rotation(video_stream)
+            if rotation in (90, 270):
+                width, height = height, width
+
+            # 전체 비트레이트 (컨테이너 값이 없으면 비디오 스트림 값)
+            try:
+                bit_rate = int(info.get('format', {}).get('bit_rate') or video_stream.get('bit_rate') or 0)
+            except (ValueError, TypeError):
+                bit_rate = 0
+
             return {
                 'duration': int(duration),
-                'width': video_stream.get('width'),
-                'height': video_stream.get('height'),
+                'width': width,
+                'height': height,
                 'codec': video_stream.get('codec_name'),
-                'fps': fps
+                'profile': video_stream.get('profile'),
+                'level': video_stream.get('level'),
+                'pix_fmt': video_stream.get('pix_fmt'),
+                'rotation': rotation,
+                'bit_rate': bit_rate,
+                'fps': fps,
+                'has_audio': audio_stream is not None,
+                'audio_codec': audio_stream.get('codec_name') if audio_stream else None,
+                'audio_profile': audio_stream.get('profile') if audio_stream else None
             }
 
         except Exception as e:
             logger.error(f"Error getting video info: {e}")
             return None
 
+    @staticmethod
+    def extract_media_info(video_info: Dict[str, Any]) -> Dict[str, Any]:
+        """videos 테이블에 저장할 재생 기준 해상도/fps/코덱"""
+        return {
+            'width': video_info.get('width'),
+            'height': video_info.get('height'),
+            'fps': round(video_info['fps'], 3) if video_info.get('fps') else None,
+            'codec': video_info.get('codec')
+        }
+
+    def get_original_path(self, video_id: int, original_filename: str) -> Path:
+        """원본 동영상 저장 경로 (video_id + 원본 확장자)"""
+        ext = Path(original_filename).suffix.lower()
+        return self.video_original_dir / f"{video_id}{ext}"
+
+    @staticmethod
+    def _get_rotation(video_stream: Dict[str, Any]) -> int:
+        """비디오 스트림 회전 각도 (0, 90, 180, 270)"""
+        rotation = video_stream.get('tags', {}).get('rotate')
+        if rotation is None:
+            for side_data in video_stream.get('side_data_list', []):
+                if 'rotation' in side_data:
+                    rotation = side_data['rotation']
+                    break
+
+        try:
+            return int(float(rotation or 0)) % 360
+        except (ValueError, TypeError):
+            return 0
+
+    def receive_upload(self, uploaded_file) -> Dict[str, Any]:
+        """업로드를 원본 디렉토리 안 임시 파일로 스트리밍 저장 (SHA-256 계산 포함, 이동은 호출자가)"""
+        return stream_to_temp_file(
+            uploaded_file, str(self.video_original_dir), self.MAX_FILE_SIZE, self.is_video_header
+        )
+
     def save_uploaded_video(self, uploaded_file, video_id: int) -> Tuple[bool, str, Optional[str]]:
         """업로드된 동영상을 원본 디렉토리에 저장"""
         try:
             # 파일명 생성 (video_id + 확장자)
-            ext = Path(uploaded_file.name).suffix.lower()
-            original_filename = f"{video_id}{ext}"
-            original_path = self.video_original_dir / original_filename
+            original_path = self.get_original_path(video_id, uploaded_file.name)
 
-            # 파일 저장
-            with open(original_path, 'wb') as f:
-                f.write(uploaded_file.getbuffer())
+            # 1MB 단위 스트리밍 저장 (임시 파일 → 검증 완료 후 이동)
+            save_result = stream_to_file(uploaded_file, str(original_path), self.MAX_FILE_SIZE, self.is_video_header)
+            if not save_result['is_valid']:
+                return False, f"동영상 저장 실패: {save_result['error_message']}", None
 
-            logger.info(f"Video saved: {original_path}")
+            logger.info(f"Video saved: {original_path} ({save_result['file_size']} bytes, sha256={save_result['sha256'][:16]})")
             return True, "동영상 저장 완료", str(original_path)
 
         except Exception as e:
             logger.error(f"Error saving video: {e}")
             return False, f"동영상 저장 실패: {str(e)}", None
 
+    def generate_preview_assets(self, video_path: str, video_id: int,
+                                video_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """썸네일 단계 - 한 번의 디코딩으로 대표 포스터(여러 크기)와 WebVTT 스프라이트 시트 생성
+
+        대표 포스터는 일정 간격 후보 프레임 중 장면 변화가 없는 프레임(검은 화면 등)을 제외하고
+        ffmpeg thumbnail 필터로 가장 대표적인 프레임을 고릅니다.
+
+        Returns:
+            Dict: {'success', 'thumbnail_path', 'posters', 'preview_vtt_path'}
+        """
+        result = {'success': False, 'thumbnail_path': None, 'posters': {}, 'preview_vtt_path': None}
+
+        duration = (video_info or {}).get('duration') or 0
+        width = (video_info or {}).get('width')
+        height = (video_info or {}).get('height')
+        if duration <= 0 or not width or not height:
+            return result
+
+        assets_dir = self.thumbnail_dir / str(video_id)
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        for old_sprite in assets_dir.glob("sprite_*.jpg"):
+            old_sprite.unlink()
+
+        # 스프라이트 타일 크기/간격
+        tile_width = self.SPRITE_TILE_WIDTH
+        tile_height = int(round(tile_width * height / width / 2)) * 2
+        interval = max(self.SPRITE_MIN_INTERVAL, math.ceil(duration / self.SPRITE_MAX_TILES))
+        tile_count = math.ceil(duration / interval)
+
+        # 포스터 크기별 출력 경로
+        poster_outputs = {'default': (self.POSTER_DEFAULT_WIDTH, self.thumbnail_dir / f"{video_id}.jpg")}
+        for size_name, poster_width in self.POSTER_WIDTHS.items():
+            poster_outputs[size_name] = (poster_width, assets_dir / f"poster_{poster_width}.jpg")
+
+        candidate_fps = self.POSTER_CANDIDATES / duration
+        poster_labels = ''.join(f"[p{i}]" for i in range(len(poster_outputs)))
+        filters = [
+            "[0:v]split=2[sprite_in][poster_in]",
+            f"[sprite_in]fps=1/{interval},scale={tile_width}:{tile_height},"
+            f"tile={self.SPRITE_COLUMNS}x{self.SPRITE_ROWS}[sprite]",
+            f"[poster_in]fps={candidate_fps:.6f},scale={max(self.POSTER_WIDTHS.values())}:-2,"
+            f"select='gt(scene,{self.POSTER_SCENE_THRESHOLD})',"
+            f"thumbnail=n={self.POSTER_CANDIDATES},split={len(poster_outputs)}{poster_labels}",
+        ]
+        for i, (poster_width, _) in enumerate(poster_outputs.values()):
+            filters.append(f"[p{i}]scale={poster_width}:-2[poster{i}]")
+
+        cmd = [
+            'ffmpeg',
+            '-i', video_path,
+            '-filter_complex', ';'.join(filters),
+            '-threads', str(self.ffmpeg_threads),
+            '-map', '[sprite]', '-q:v', '5', '-y', str(assets_dir / "sprite_%03d.jpg"),
+        ]
+        for i, (_, poster_path) in enumerate(poster_outputs.values()):
+            cmd += ['-map', f"[poster{i}]", '-frames:v', '1', '-q:v', '2', '-update', '1', '-y', str(poster_path)]
+
+        try:
+            returncode, stderr = self._run_ffmpeg(cmd, self.THUMBNAIL_TIMEOUT, 'thumbnail', duration)
+        except subprocess.TimeoutExpired:
+            logger.error("Preview asset generation timeout")
+            return result
+
+        if returncode != 0:
+            logger.error(f"Preview asset generation failed: {stderr}")
+            return result
+
+        default_poster = poster_outputs['default'][1]
+        if default_poster.exists():
+            result['thumbnail_path'] = str(default_poster)
+        result['posters'] = {
+            size_name: str(path) for size_name, (_, path) in poster_outputs.items() if path.exists()
+        }
+
+        if (assets_dir / "sprite_001.jpg").exists():
+            vtt_path = assets_dir / "previews.vtt"
+            self._write_sprite_vtt(vtt_path, duration, interval, tile_count, tile_width, tile_height)
+            result['preview_vtt_path'] = str(vtt_path)
+
+        result['success'] = result['thumbnail_path'] is not None
+        logger.info(f"Preview assets generated: {assets_dir} ({tile_count} tiles, posters={list(result['posters'])})")
+        return result
+
+    def _write_sprite_vtt(self, vtt_path: Path, duration: float, interval: int,
+                          tile_count: int, tile_width: int, tile_height: int):
+        """스프라이트 시트 좌표를 담은 WebVTT (탐색 미리보기용)"""
+        def timestamp(seconds: float) -> str:
+            hours, remainder = divmod(int(seconds), 3600)
+            minutes, secs = divmod(remainder, 60)
+            return f"{hours:02d}:{minutes:02d}:{secs:02d}.000"
+
+        tiles_per_sheet = self.SPRITE_COLUMNS * self.SPRITE_ROWS
+
+        with open(vtt_path, 'w') as f:
+            f.write("WEBVTT\n\n")
+            for index in range(tile_count):
+                start = index * interval
+                end = min(start + interval, duration)
+                sheet, position = divmod(index, tiles_per_sheet)
+                x = (position % self.SPRITE_COLUMNS) * tile_width
+                y = (position // self.SPRITE_COLUMNS) * tile_height
+
+                f.write(f"{timestamp(start)} --> {timestamp(end)}\n")
+                f.write(f"sprite_{sheet + 1:03d}.jpg#xywh={x},{y},{tile_width},{tile_height}\n\n")
+
     def generate_thumbnail(self, video_path: str, video_id: int, timestamp: float = 5.0) -> Tuple[bool, Optional[str]]:
         """동영상 썸네일 생성 (5초 지점)"""
         try:
@@ -168,8 +414,322 @@ class VideoService:
             logger.error(f"Error generating thumbnail: {e}")
             return False, None
 
-    def transcode_to_hls(self, video_path: str, video_id: int) -> Tuple[bool, Optional[str], str]:
-        """HLS 다중 해상도 트랜스코딩 (완전 자동화)"""
+    @staticmethod
+    def _parse_bitrate(bitrate: str) -> int:
+        """'2500k' 형식 비트레이트를 bps로 변환"""
+        return int(bitrate.lower().replace('k', '')) * 1000
+
+    def _select_variants(self, video_info: Optional[Dict[str, Any]]) -> list:
+        """원본 해상도에 맞는 HLS 사다리 선택
+
+        단계 높이(720/480/360)는 짧은 변 기준이라 세로 영상도 같은 화질로 인코딩되며,
+        원본보다 큰 단계는 만들지 않습니다 (업스케일 없음).
+        """
+        source_width = (video_info or {}).get('width')
+        source_height = (video_info or {}).get('height')
+        short_side = min(source_width, source_height) if source_width and source_height else None
+
+        def build_variant(name: str, settings: Dict[str, Any], target: int) -> Dict[str, Any]:
+            width, height = None, target
+            if short_side:
+                # 짧은 변을 target에 맞추고 긴 변은 비율 유지 (H.264는 짝수 해상도 필요)
+                scale = target / short_side
+                width = int(round(source_width * scale / 2)) * 2
+                height = int(round(source_height * scale / 2)) * 2
+            return {
+                'name': name,
+                'playlist': f"{name}.m3u8",
+                'width': width,
+                'height': height,
+                'bitrate': settings['bitrate'],
+                'audio_bitrate': settings['audio_bitrate'],
+                'bandwidth': self._parse_bitrate(settings['bitrate']) + self._parse_bitrate(settings['audio_bitrate'])
+            }
+
+        variants = [
+            build_variant(name, settings, settings['height'])
+            for name, settings in self.HLS_VARIANTS.items()
+            if not short_side or settings['height'] <= short_side
+        ]
+
+        if not variants:
+            # 원본이 가장 낮은 단계보다 작으면 원본 크기로 한 단계만 생성
+            lowest_name, lowest = list(self.HLS_VARIANTS.items())[-1]
+            variants.append(build_variant(lowest_name, lowest, short_side - (short_side % 2)))
+
+        return variants
+
+    def _build_hls_command(self, video_path: str, hls_video_dir: Path, variants: list, has_audio: bool) -> list:
+        """디코딩 1회 → split → 해상도별 인코딩 → var_stream_map으로 HLS 출력하는 ffmpeg 명령"""
+        segment_seconds = self.HLS_SEGMENT_SECONDS
+
+        # [0:v]split=N[s0][s1]...; [s0]scale=W:H[v0]; ...
+        split_outputs = ''.join(f"[s{i}]" for i in range(len(variants)))
+        filters = [f"[0:v]split={len(variants)}{split_outputs}"]
+        for i, variant in enumerate(variants):
+            width = variant['width'] if variant['width'] else -2
+            filters.append(f"[s{i}]scale={width}:{variant['height']}[v{i}]")
+
+        cmd = [
+            'ffmpeg',
+            '-i', video_path,
+            '-filter_complex', ';'.join(filters),
+        ]
+
+        stream_map = []
+        for i, variant in enumerate(variants):
+            video_bitrate = self._parse_bitrate(variant['bitrate'])
+            cmd += [
+                '-map', f"[v{i}]",
+                f"-c:v:{i}", 'libx264',
+                f"-b:v:{i}", variant['bitrate'],
+                f"-maxrate:v:{i}", str(int(video_bitrate * 1.07)),
+                f"-bufsize:v:{i}", str(int(video_bitrate * 1.5)),
+            ]
+            entry = f"v:{i}"
+            if has_audio:
+                cmd += [
+                    '-map', 'a:0',
+                    f"-c:a:{i}", 'aac',
+                    f"-b:a:{i}", variant['audio_bitrate'],
+                ]
+                entry += f",a:{i}"
+            stream_map.append(f"{entry},name:{variant['name']}")
+
+        cmd += [
+            '-profile:v', self.H264_PROFILE,
+            '-level:v', self.H264_LEVEL,
+            '-pix_fmt', 'yuv420p',
+            # 모든 해상도가 같은 시점에 키프레임을 갖도록 고정 (세그먼트 경계 = 키프레임)
+            '-force_key_frames', f"expr:gte(t,n_forced*{segment_seconds})",
+            '-sc_threshold', '0',
+            '-threads', str(self.ffmpeg_threads),  # 워커 코어 예산 내에서 실행
+            '-f', 'hls',
+            '-hls_time', str(segment_seconds),  # 세그먼트 길이 (초)
+            '-hls_list_size', '0',  # 모든 세그먼트 포함
+            '-hls_playlist_type', 'vod',
+            '-hls_segment_type', 'mpegts',
+            '-hls_segment_filename', str(hls_video_dir / "segments" / "%v_%03d.ts"),
+            '-hls_base_url', 'segments/',  # 플레이리스트에서 세그먼트 경로 프리픽스
+            '-var_stream_map', ' '.join(stream_map),
+            '-y',
+            str(hls_video_dir / "%v.m3u8")
+        ]
+        return cmd
+
+    def _report_progress(self, stage: str, percent: Optional[float] = None,
+                         speed: Optional[float] = None, eta_seconds: Optional[int] = None):
+        """진행률 콜백 호출 (콜백 오류는 처리 자체를 중단시키지 않음)"""
+        if not self.progress_callback:
+            return
+        try:
+            self.progress_callback({
+                'stage': stage,
+                'percent': percent,
+                'speed': speed,
+                'eta_seconds': eta_seconds
+            })
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
+
+    def _run_ffmpeg(self, cmd: list, timeout: int, stage: str,
+                    duration: Optional[float] = None) -> Tuple[int, str]:
+        """ffmpeg 실행 + -progress 출력 파싱으로 진행률/속도/남은 시간 보고
+
+        Returns:
+            (종료 코드, stderr)  - 제한 시간 초과 시 subprocess.TimeoutExpired
+        """
+        cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+        self._report_progress(stage, 0.0)
+
+        # stderr는 파일로 받아 파이프가 가득 차 ffmpeg가 멈추는 일을 방지
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+
+            # 출력 없이 멈춘 경우에도 제한 시간에 강제 종료
+            timed_out = threading.Event()
+
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+
+            watchdog = threading.Timer(timeout, kill_on_timeout)
+            watchdog.start()
+
+            try:
+                # -progress는 key=value 줄을 묶음으로 출력하고 progress=continue/end로 끝남
+                block = {}
+                last_speed = None
+                for line in process.stdout:
+                    key, _, value = line.strip().partition('=')
+                    block[key] = value
+                    if key != 'progress':
+                        continue
+
+                    if 'out_time_us' in block or 'out_time_ms' in block:
+                        percent, last_speed, eta_seconds = self._parse_progress_block(block, duration)
+                        self._report_progress(stage, percent, last_speed, eta_seconds)
+                    block = {}
+
+                process.wait()
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace')
+
+        if process.returncode == 0:
+            self._report_progress(stage, 100.0, last_speed, 0)
+
+        return process.returncode, stderr
+
+    @staticmethod
+    def _parse_progress_block(block: Dict[str, str],
+                              duration: Optional[float]) -> Tuple[Optional[float], Optional[float], Optional[int]]:
+        """ffmpeg -progress 한 묶음에서 (진행률 %, 속도 x배속, 남은 시간 초) 계산"""
+        try:
+            out_time = int(block.get('out_time_us') or block.get('out_time_ms') or 0) / 1_000_000
+        except ValueError:
+            out_time = 0.0
+
+        try:
+            speed = float(block.get('speed', '').rstrip('x'))
+        except ValueError:
+            speed = None
+
+        if not duration or duration <= 0:
+            return None, speed, None
+
+        percent = max(0.0, min(100.0, out_time / duration * 100))
+        eta_seconds = int((duration - out_time) / speed) if speed and speed > 0 else None
+        return percent, speed, eta_seconds
+
+    def can_remux(self, video_info: Optional[Dict[str, Any]]) -> Tuple[bool, str]:
+        """재인코딩 없이 HLS로 포장 가능한지 확인 (코덱/해상도/비트레이트 기준)"""
+        if not video_info:
+            return False, "동영상 정보 없음"
+        if video_info.get('codec') != 'h264':
+            return False, f"비디오 코덱 {video_info.get('codec')}"
+        if video_info.get('profile') not in self.H264_PROFILE_CODES:
+            return False, f"H.264 프로파일 {video_info.get('profile')}"
+        if video_info.get('pix_fmt') not in ('yuv420p', 'yuvj420p'):
+            return False, f"픽셀 포맷 {video_info.get('pix_fmt')}"
+        if video_info.get('has_audio') and video_info.get('audio_codec') != 'aac':
+            return False, f"오디오 코덱 {video_info.get('audio_codec')}"
+        if video_info.get('rotation'):
+            # MPEG-TS는 회전 메타데이터를 담지 못함
+            return False, f"회전 메타데이터 {video_info['rotation']}도"
+        if not video_info.get('width') or not video_info.get('height'):
+            return False, "해상도 정보 없음"
+        if min(video_info['width'], video_info['height']) > self.REMUX_MAX_SHORT_SIDE:
+            return False, f"해상도 {video_info['width']}x{video_info['height']}"
+        if not video_info.get('bit_rate') or video_info['bit_rate'] > self.REMUX_MAX_BITRATE:
+            return False, f"비트레이트 {video_info.get('bit_rate')}"
+        return True, "H.264/AAC 호환"
+
+    def get_max_keyframe_interval(self, video_path: str) -> Optional[float]:
+        """키프레임 간 최대 간격 (초) - 패킷 플래그만 읽으므로 디코딩 없이 확인"""
+        try:
+            cmd = [
+                'ffprobe',
+                '-v', 'error',
+                '-select_streams', 'v:0',
+                '-show_entries', 'packet=pts_time,flags',
+                '-of', 'csv=p=0',
+                video_path
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if result.returncode != 0:
+                logger.error(f"Keyframe probe failed: {result.stderr}")
+                return None
+
+            keyframe_times = []
+            for line in result.stdout.splitlines():
+                pts_time, _, flags = line.partition(',')
+                if 'K' in flags and pts_time not in ('', 'N/A'):
+                    keyframe_times.append(float(pts_time))
+
+            if not keyframe_times:
+                return None
+
+            keyframe_times.sort()
+            gaps = [b - a for a, b in zip(keyframe_times, keyframe_times[1:])]
+            return max(gaps) if gaps else 0.0
+
+        except Exception as e:
+            logger.error(f"Error probing keyframes: {e}")
+            return None
+
+    def _get_codecs_string(self, video_info: Dict[str, Any]) -> str:
+        """원본 스트림 기준 HLS CODECS 값 (예: avc1.640028,mp4a.40.2)"""
+        video_codec = f"avc1.{self.H264_PROFILE_CODES[video_info['profile']]}{int(video_info['level']):02x}"
+        if not video_info.get('has_audio'):
+            return video_codec
+        audio_codec = 'mp4a.40.5' if video_info.get('audio_profile') == 'HE-AAC' else 'mp4a.40.2'
+        return f"{video_codec},{audio_codec}"
+
+    def remux_to_hls(self, video_path: str, video_id: int,
+                     video_info: Dict[str, Any]) -> Tuple[bool, Optional[str], str]:
+        """재인코딩 없이 스트림 복사로 HLS 생성 (원본 해상도 단일 화질)"""
+        try:
+            max_interval = self.get_max_keyframe_interval(video_path)
+            if max_interval is None or max_interval > self.REMUX_MAX_KEYFRAME_INTERVAL:
+                return False, None, f"키프레임 간격이 세그먼트 분할에 부적합 ({max_interval}초)"
+
+            hls_video_dir = self.video_hls_dir / str(video_id)
+            segments_dir = hls_video_dir / "segments"
+            segments_dir.mkdir(parents=True, exist_ok=True)
+
+            cmd = [
+                'ffmpeg',
+                '-i', video_path,
+                '-map', '0:v:0',
+                '-map', '0:a:0?',
+                '-c', 'copy',  # 재인코딩 없음
+                '-f', 'hls',
+                '-hls_time', str(self.HLS_SEGMENT_SECONDS),  # 키프레임 위치에서 분할
+                '-hls_list_size', '0',
+                '-hls_playlist_type', 'vod',
+                '-hls_segment_type', 'mpegts',
+                '-hls_segment_filename', str(segments_dir / "source_%03d.ts"),
+                '-hls_base_url', 'segments/',
+                '-y',
+                str(hls_video_dir / "source.m3u8")
+            ]
+
+            logger.info(f"Remuxing video {video_id} to HLS (stream copy)...")
+            returncode, stderr = self._run_ffmpeg(cmd, self.REMUX_TIMEOUT, 'remux', video_info.get('duration'))
+            if returncode != 0:
+                logger.error(f"Remux failed: {stderr}")
+                return False, None, "리먹스 실패"
+
+            master_playlist_path = hls_video_dir / "master.m3u8"
+            self._create_master_playlist(master_playlist_path, [{
+                'name': 'source',
+                'playlist': 'source.m3u8',
+                'width': video_info['width'],
+                'height': video_info['height'],
+                'bandwidth': video_info['bit_rate'],
+                'codecs': self._get_codecs_string(video_info)
+            }])
+
+            logger.info(f"HLS remux completed: {master_playlist_path}")
+            return True, str(master_playlist_path), "리먹스 완료"
+
+        except subprocess.TimeoutExpired:
+            logger.error("Remux timeout")
+            return False, None, "리먹스 시간 초과"
+
+        except Exception as e:
+            logger.error(f"Error during remux: {e}")
+            return False, None, f"리먹스 오류: {str(e)}"
+
+    def transcode_to_hls(self, video_path: str, video_id: int,
+                         video_info: Optional[Dict[str, Any]] = None) -> Tuple[bool, Optional[str], str]:
+        """HLS 변환 - H.264/AAC 원본은 리먹스, 그 외에는 ffmpeg 1회 실행으로 전체 사다리 트랜스코딩"""
         try:
             # HLS 출력 디렉토리
             hls_video_dir = self.video_hls_dir / str(video_id)
@@ -181,70 +741,74 @@ class VideoService:
             # 마스터 플레이리스트 경로
             master_playlist_path = hls_video_dir / "master.m3u8"
 
-            # 각 해상도별 트랜스코딩
-            variant_playlists = []
-
-            for variant_name, settings in self.HLS_VARIANTS.items():
-                variant_playlist = f"{variant_name}.m3u8"
-                variant_playlist_path = hls_video_dir / variant_playlist
-                segment_pattern = segments_dir / f"{variant_name}_%03d.ts"
-
-                cmd = [
-                    'ffmpeg',
-                    '-i', video_path,
-                    '-vf', f"scale=-2:{settings['height']}",  # 높이 고정, 가로 비율 유지
-                    '-c:v', 'libx264',  # H.264 코덱
-                    '-b:v', settings['bitrate'],  # 비디오 비트레이트
-                    '-c:a', 'aac',  # AAC 오디오
-                    '-b:a', settings['audio_bitrate'],  # 오디오 비트레이트
-                    '-hls_time', '6',  # 세그먼트 길이 (초)
-                    '-hls_list_size', '0',  # 모든 세그먼트 포함
-                    '-hls_segment_filename', str(segment_pattern),
-                    '-hls_segment_type', 'mpegts',  # 세그먼트 타입
-                    '-hls_base_url', 'segments/',  # 플레이리스트에서 세그먼트 경로 프리픽스
-                    '-f', 'hls',
-                    '-y',
-                    str(variant_playlist_path)
-                ]
+            if video_info is None:
+                video_info = self.get_video_info(video_path)
 
-                logger.info(f"Transcoding {variant_name}...")
-                result = subprocess.run(cmd, capture_output=True, timeout=600)
+            # 이미 H.264/AAC면 스트림 복사로 빠르게 처리, 실패 시 전체 트랜스코딩
+            remuxable, reason = self.can_remux(video_info)
+            if remuxable:
+                remux_success, remux_path, remux_message = self.remux_to_hls(video_path, video_id, video_info)
+                if remux_success:
+                    return True, remux_path, remux_message
+
+                logger.info(f"Remux not possible ({remux_message}) - falling back to transcode")
+                self._clear_hls_output(hls_video_dir)
+                segments_dir.mkdir(exist_ok=True)
+            else:
+                logger.info(f"Full transcode required: {reason}")
 
-                if result.returncode != 0:
-                    logger.error(f"Transcoding {variant_name} failed: {result.stderr.decode()}")
-                    return False, None, f"{variant_name} 트랜스코딩 실패"
+            variants = self._select_variants(video_info)
+            has_audio = video_info.get('has_audio', True) if video_info else True
 
-                # 마스터 플레이리스트에 추가할 정보
-                variant_playlists.append({
-                    'name': variant_name,
-                    'playlist': variant_playlist,
-                    'bandwidth': int(settings['bitrate'].replace('k', '000')),
-                    'resolution': f"?x{settings['height']}"  # 정확한 가로 해상도는 동적으로 결정됨
-                })
+            cmd = self._build_hls_command(video_path, hls_video_dir, variants, has_audio)
 
-            # 마스터 플레이리스트 생성
-            self._create_master_playlist(master_playlist_path, variant_playlists)
+            logger.info(f"Transcoding {', '.join(v['name'] for v in variants)} in a single pass...")
+            duration = video_info.get('duration') if video_info else None
+            returncode, stderr = self._run_ffmpeg(cmd, self.TRANSCODE_TIMEOUT, 'transcode', duration)
+
+            if returncode != 0:
+                logger.error(f"Transcoding failed: {stderr}")
+                return False, None, "트랜스코딩 실패"
+
+            # 마스터 플레이리스트 생성 (ffmpeg 기본 출력 대신 실제 해상도/코덱 명시)
+            self._create_master_playlist(master_playlist_path, variants, has_audio)
 
             logger.info(f"HLS transcoding completed: {master_playlist_path}")
             return True, str(master_playlist_path), "트랜스코딩 완료"
 
         except subprocess.TimeoutExpired:
             logger.error("Transcoding timeout")
-            return False, None, "트랜스코딩 시간 초과 (10분)"
+            return False, None, f"트랜스코딩 시간 초과 ({self.TRANSCODE_TIMEOUT // 60}분)"
 
         except Exception as e:
             logger.error(f"Error during transcoding: {e}")
             return False, None, f"트랜스코딩 오류: {str(e)}"
 
-    def _create_master_playlist(self, master_path: Path, variants: list):
-        """HLS 마스터 플레이리스트 생성"""
+    def _clear_hls_output(self, hls_video_dir: Path):
+        """실패한 시도의 플레이리스트/세그먼트 삭제"""
+        if hls_video_dir.exists():
+            shutil.rmtree(hls_video_dir)
+        hls_video_dir.mkdir(parents=True, exist_ok=True)
+
+    def _create_master_playlist(self, master_path: Path, variants: list, has_audio: bool = True):
+        """HLS 마스터 플레이리스트 생성 (BANDWIDTH, RESOLUTION, CODECS)"""
+        default_codecs = self.HLS_CODECS if has_audio else self.HLS_CODECS.split(',')[0]
+
         with open(master_path, 'w') as f:
             f.write("#EXTM3U\n")
             f.write("#EXT-X-VERSION:3\n\n")
 
             for variant in variants:
-                # RESOLUTION 제거 (BANDWIDTH만 사용 - 더 안정적)
-                f.write(f"#EXT-X-STREAM-INF:BANDWIDTH={variant['bandwidth']}\n")
+                # 최대 비트레이트(maxrate) 기준 BANDWIDTH, 평균은 AVERAGE-BANDWIDTH
+                attributes = [
+                    f"BANDWIDTH={int(variant['bandwidth'] * 1.07)}",
+                    f"AVERAGE-BANDWIDTH={variant['bandwidth']}",
+                ]
+                if variant.get('width'):
+                    attributes.append(f"RESOLUTION={variant['width']}x{variant['height']}")
+                attributes.append(f'CODECS="{variant.get("codecs", default_codecs)}"')
+
+                f.write(f"#EXT-X-STREAM-INF:{','.join(attributes)}\n")
                 f.write(f"{variant['playlist']}\n\n")
 
     def process_video_complete(self, uploaded_file, video_id: int) -> Dict[str, Any]:
@@ -272,33 +836,59 @@ class VideoService:
                 result['message'] = message
                 return result
 
-            result['original_path'] = original_path
+            return self.process_saved_video(original_path, video_id)
 
-            # 2-1. 저장된 파일 검증
+        except Exception as e:
+            logger.error(f"Error in complete video processing: {e}")
+            result['message'] = f"처리 중 오류 발생: {str(e)}"
+            return result
+
+    def process_saved_video(self, original_path: str, video_id: int) -> Dict[str, Any]:
+        """저장된 원본 동영상 처리 (검증 → 트랜스코딩 → 썸네일) - 백그라운드 워커에서 호출"""
+        result = {
+            'success': False,
+            'original_path': original_path,
+            'hls_path': None,
+            'thumbnail_path': None,
+            'duration': None,
+            'media_info': None,
+            'preview_vtt_path': None,
+            'message': ''
+        }
+
+        try:
+            # 1. 저장된 파일 검증
             is_valid, message = self.validate_video_file(original_path)
             if not is_valid:
                 result['message'] = message
                 return result
 
-            # 3. 동영상 정보 추출
+            # 2. 동영상 정보 추출
             video_info = self.get_video_info(original_path)
             if video_info:
                 result['duration'] = video_info['duration']
+                result['media_info'] = self.extract_media_info(video_info)
 
-            # 4. 썸네일 생성
-            thumb_success, thumbnail_path = self.generate_thumbnail(original_path, video_id)
-            if thumb_success:
-                result['thumbnail_path'] = thumbnail_path
+            # 3. 썸네일 단계 (대표 포스터 + 여러 크기 + 탐색 미리보기), 실패 시 5초 지점 단일 썸네일
+            preview = self.generate_preview_assets(original_path, video_id, video_info)
+            result['preview_vtt_path'] = preview['preview_vtt_path']
+            if preview['success']:
+                result['thumbnail_path'] = preview['thumbnail_path']
+            else:
+                self._report_progress('thumbnail')
+                thumb_success, thumbnail_path = self.generate_thumbnail(original_path, video_id)
+                if thumb_success:
+                    result['thumbnail_path'] = thumbnail_path
 
-            # 5. HLS 트랜스코딩
-            hls_success, hls_path, hls_message = self.transcode_to_hls(original_path, video_id)
+            # 4. HLS 트랜스코딩
+            hls_success, hls_path, hls_message = self.transcode_to_hls(original_path, video_id, video_info)
             if not hls_success:
                 result['message'] = hls_message
                 return result
 
             result['hls_path'] = hls_path
 
-            # 6. 원본 파일 삭제 (HLS 처리 완료 후 스토리지 절약)
+            # 5. 원본 파일 삭제 (HLS 처리 완료 후 스토리지 절약)
             try:
                 if original_path and os.path.exists(original_path):
                     os.remove(original_path)
@@ -313,7 +903,7 @@ class VideoService:
             return result
 
         except Exception as e:
-            logger.error(f"Error in complete video processing: {e}")
+            logger.error(f"Error processing saved video {video_id}: {e}")
             result['message'] = f"처리 중 오류 발생: {str(e)}"
             return result
 
@@ -339,5 +929,11 @@ class VideoService:
                 thumbnail_path.unlink()
                 logger.info(f"Deleted thumbnail: {thumbnail_path}")
 
+            # 포스터/스프라이트 디렉토리 삭제
+            assets_dir = self.thumbnail_dir / str(video_id)
+            if assets_dir.exists():
+                shutil.rmtree(assets_dir)
+                logger.info(f"Deleted preview assets: {assets_dir}")
+
         except Exception as e:
             logger.error(f"Error deleting video files: {e}")
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""동영상 트랜스코딩 백그라운드 워커
+
+videos 테이블의 status(pending → processing → completed/failed)를 작업 대기열로 사용합니다.
+업로드 페이지는 원본 저장 후 대기열에 등록만 하고, ffmpeg 처리는 이 워커가 별도 프로세스 풀에서 수행합니다.
+
+실행: python -m services.video_worker
+(앱 실행 시 자동 시작되며, 잠금 파일로 한 번에 하나의 워커만 동작합니다)
+"""
+import os
+import sys
+import time
+import signal
+import logging
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from config.settings import app_config, video_worker_config, VideoWorkerConfig
+from database.repositories import video_repo
+from services.video_service import VideoService
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class _ProgressReporter:
+    """ffmpeg 진행률을 videos 행에 기록 (DB 쓰기는 최소 간격으로 제한)"""
+
+    def __init__(self, video_id: int, min_interval: float):
+        self.video_id = video_id
+        self.min_interval = min_interval
+        self._last_stage = None
+        self._last_write = 0.0
+
+    def __call__(self, progress: Dict[str, Any]):
+        now = time.monotonic()
+        stage_changed = progress['stage'] != self._last_stage
+        finished = progress['percent'] is not None and progress['percent'] >= 100
+
+        if not stage_changed and not finished and now - self._last_write < self.min_interval:
+            return
+
+        self._last_stage = progress['stage']
+        self._last_write = now
+        video_repo.update_progress(
+            self.video_id,
+            progress['stage'],
+            progress['percent'],
+            progress['speed'],
+            progress['eta_seconds']
+        )
+
+
+def _process_job(video_id: int, original_path: str, ffmpeg_threads: int,
+                 progress_interval: float) -> Dict[str, Any]:
+    """워커 프로세스에서 실행되는 작업 (진행률만 DB에 기록하고 결과는 반환)"""
+    video_service = VideoService(
+        upload_dir=app_config.UPLOAD_DIR,
+        ffmpeg_threads=ffmpeg_threads,
+        progress_callback=_ProgressReporter(video_id, progress_interval)
+    )
+    return video_service.process_saved_video(original_path, video_id)
+
+
+def _acquire_instance_lock(lock_path: str):
+    """단일 워커 실행 보장 (이미 실행 중이면 None)"""
+    Path(lock_path).parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(lock_path, 'w')
+
+    if fcntl is None:
+        return lock_file
+
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    return lock_file
+
+
+class VideoWorker:
+    """동영상 작업 대기열 처리기"""
+
+    def __init__(self, config: VideoWorkerConfig = video_worker_config):
+        self.config = config
+        self._running = True
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 실행 중인 작업 → (작업 정보, 제출한 프로세스 풀)
+        self._futures: Dict[Future, Tuple[Dict[str, Any], ProcessPoolExecutor]] = {}
+
+    def stop(self, *_args):
+        """새 작업 수령 중지 (진행 중인 작업은 마무리)"""
+        logger.info("Video worker stopping...")
+        self._running = False
+
+    def retry_delay(self, attempts: int) -> int:
+        """재시도 대기 시간 (지수 백오프)"""
+        delay = self.config.RETRY_BASE_DELAY * (2 ** max(0, attempts - 1))
+        return min(delay, self.config.RETRY_MAX_DELAY)
+
+    def run(self):
+        """워커 메인 루프"""
+        lock_file = _acquire_instance_lock(self.config.LOCK_FILE)
+        if lock_file is None:
+            logger.info("Video worker already running - exiting")
+            return
+
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        requeued = video_repo.requeue_interrupted_jobs()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted video jobs")
+
+        logger.info(
+            f"Video worker started (jobs={self.config.MAX_CONCURRENT_JOBS}, "
+            f"ffmpeg threads/job={self.config.FFMPEG_THREADS})"
+        )
+
+        try:
+            while self._running or self._futures:
+                if self._running:
+                    self._fill_slots()
+
+                if not self._futures:
+                    time.sleep(self.config.POLL_INTERVAL)
+                    continue
+
+                done, _ = wait(self._futures, timeout=self.config.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job, executor = self._futures.pop(future)
+                    self._handle_result(future, job, executor)
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+            lock_file.close()
+            logger.info("Video worker stopped")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """ffmpeg 작업용 프로세스 풀 (spawn - 부모의 DB 연결/스레드를 물려받지 않음)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.MAX_CONCURRENT_JOBS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def _fill_slots(self):
+        """빈 슬롯만큼 대기열에서 작업을 가져와 실행"""
+        while len(self._futures) < self.config.MAX_CONCURRENT_JOBS:
+            job = video_repo.claim_next_job()
+            if not job:
+                return
+
+            original_path = job['original_path'] or str(
+                VideoService(upload_dir=app_config.UPLOAD_DIR).get_original_path(job['id'], job['original_filename'])
+            )
+
+            if not os.path.exists(original_path):
+                # 원본이 없으면 재시도해도 소용없음
+                logger.error(f"Video {job['id']}: original file not found ({original_path})")
+                video_repo.fail_job(job['id'], f"원본 파일을 찾을 수 없습니다: {original_path}")
+                continue
+
+            logger.info(f"Video {job['id']}: processing started (attempt {job['attempts']})")
+            executor = self._get_executor()
+            future = executor.submit(
+                _process_job, job['id'], original_path, self.config.FFMPEG_THREADS,
+                self.config.PROGRESS_INTERVAL
+            )
+            self._futures[future] = (job, executor)
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """깨진 프로세스 풀 정리 (아직 현재 풀인 경우에만 - 이미 새로 만든 풀은 유지)"""
+        if self._executor is not executor:
+            return
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Video worker process pool broken - recreating")
+
+    def _handle_result(self, future: Future, job: Dict[str, Any], executor: ProcessPoolExecutor):
+        """작업 결과를 DB에 반영 (실패 시 백오프 후 재시도)"""
+        video_id = job['id']
+
+        try:
+            result = future.result()
+        except BrokenProcessPool as e:
+            # 프로세스가 강제 종료된 경우 - 풀을 새로 만들고 재시도
+            # (같은 풀의 다른 작업도 차례로 여기로 오므로 제출한 풀이 현재 풀일 때만 정리)
+            self._discard_executor(executor)
+            result = {'success': False, 'message': f"워커 프로세스 비정상 종료: {e}"}
+        except Exception as e:
+            result = {'success': False, 'message': f"처리 중 오류 발생: {e}"}
+
+        if result['success']:
+            video_repo.update_processing_status(
+                video_id,
+                'completed',
+                result['hls_path'],
+                result['thumbnail_path'],
+                result['duration']
+            )
+            if result.get('media_info'):
+                video_repo.update_media_info(video_id, **result['media_info'])
+            video_repo.update_preview_vtt_path(video_id, result.get('preview_vtt_path'))
+            logger.info(f"Video {video_id}: processing completed")
+            return
+
+        if job['attempts'] < self.config.MAX_ATTEMPTS:
+            delay = self.retry_delay(job['attempts'])
+            video_repo.fail_job(video_id, result['message'], retry_delay=delay)
+            logger.warning(f"Video {video_id}: {result['message']} - retrying in {delay}s")
+        else:
+            video_repo.fail_job(video_id, result['message'])
+            logger.error(f"Video {video_id}: failed after {job['attempts']} attempts - {result['message']}")
+
+
+def start_worker_process() -> Optional[subprocess.Popen]:
+    """워커를 별도 프로세스로 실행 (이미 실행 중이면 새 프로세스가 잠금 확인 후 바로 종료)"""
+    if not video_worker_config.AUTOSTART:
+        return None
+
+    try:
+        return subprocess.Popen(
+            [sys.executable, '-m', 'services.video_worker'],
+            cwd=str(PROJECT_ROOT),
+            start_new_session=True
+        )
+    except OSError as e:
+        logger.error(f"Failed to start video worker: {e}")
+        return None
+
+
+def main():
+    """CLI 진입점"""
+    from database.migrations import init_complete_db
+
+    init_complete_db()
+    VideoWorker().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""공용 테스트 픽스처"""
+import sqlite3
+
+import bcrypt
+import pytest
+
+from config.settings import db_config, shared_cache_config
+from database.connection import db_manager
+from database.migrations import LATEST_SCHEMA_VERSION, get_schema_version, run_migrations
+
+
+@pytest.fixture
+def migrated_db(tmp_path, monkeypatch):
+    """마이그레이션을 모두 적용한 임시 DB로 db_manager 전환 (공유 디스크 캐시는 끔)"""
+    db_path = str(tmp_path / "futsal.db")
+
+    # 초기 관리자 계정 생성 시 bcrypt 비용을 낮춰 테스트 속도 유지
+    gensalt = bcrypt.gensalt
+    monkeypatch.setattr(bcrypt, 'gensalt', lambda rounds=4, prefix=b'2b': gensalt(4, prefix))
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        run_migrations(conn)
+        assert get_schema_version(conn) == LATEST_SCHEMA_VERSION
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(db_config, 'DB_PATH', db_path)
+    monkeypatch.setattr(db_manager, 'db_path', db_path)
+    monkeypatch.setattr(db_manager, '_pool', None)
+    monkeypatch.setattr(shared_cache_config, 'ENABLED', False)
+    yield db_path
+    db_manager.close_all_connections()
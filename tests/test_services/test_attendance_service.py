@@ -0,0 +1,235 @@
+"""출석 변경 (마감/정원 조건부 UPDATE) 테스트"""
+import threading
+from datetime import datetime
+
+import pytest
+
+from database.connection import db_manager
+from database.models import Field, Match
+from database.repositories import AttendanceRepository, attendance_repo, field_repo, match_repo, player_repo
+from services.attendance_service import AttendanceService, attendance_service
+
+NOW = datetime(2026, 10, 17, 12, 0)
+NOW_TEXT = NOW.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture
+def player_ids(migrated_db, monkeypatch):
+    """출석 변경 기준 시각 고정 + 활성 선수 ID 목록"""
+    monkeypatch.setattr(AttendanceService, '_now_kst', staticmethod(lambda: NOW))
+    ids = [player['id'] for player in player_repo.get_all_active()]
+    assert len(ids) >= 3
+    return ids
+
+
+def _create_match(match_date: str = '2026-10-20', match_time: str = '10:00', lock_minutes: int = 0,
+                  capacity=None) -> int:
+    """모든 활성 선수가 불참(absent)으로 등록된 경기"""
+    field_repo.create(Field(name='테스트 구장'))
+    field_id = db_manager.execute_query("SELECT MAX(id) AS id FROM fields", fetch_all=False)['id']
+    assert match_repo.create(Match(field_id=field_id, match_date=match_date, match_time=match_time,
+                                   attendance_lock_minutes=lock_minutes, attendance_capacity=capacity))
+    match_id = db_manager.execute_query("SELECT MAX(id) AS id FROM matches", fetch_all=False)['id']
+    assert attendance_repo.create_for_match(match_id)
+    return match_id
+
+
+def _status(match_id: int, player_id: int) -> str:
+    row = db_manager.execute_query("SELECT status FROM attendance WHERE match_id = ? AND player_id = ?",
+                                   (match_id, player_id), fetch_all=False)
+    return row['status']
+
+
+def test_last_seat_goes_to_one_of_two_concurrent_requests(player_ids):
+    """마지막 자리를 동시에 신청하면 한 명만 참석, 다른 요청은 'full'"""
+    match_id = _create_match(capacity=2)
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def request_seat(player_id):
+        barrier.wait()
+        results[player_id] = attendance_repo.update_status_checked(match_id, player_id, 'present', NOW_TEXT)
+
+    threads = [threading.Thread(target=request_seat, args=(player_id,)) for player_id in player_ids[1:3]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(result['reason'] or 'updated' for result in results.values()) == ['full', 'updated']
+    assert all(result['present_count'] == 2 and result['capacity'] == 2 for result in results.values())
+    assert [_status(match_id, player_id) for player_id in player_ids[1:3]].count('present') == 1
+
+
+def test_full_match_rejects_player_with_message(player_ids):
+    """정원이 찬 경기에 선수가 참석 신청하면 실패 메시지와 현재 인원 반환"""
+    match_id = _create_match(capacity=1)
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+
+    result = attendance_service.update_player_status(match_id, player_ids[1], 'present')
+
+    assert result == {'success': False, 'message': "참석 정원이 가득 찼습니다. (현재 1/1명)", 'present_count': 1}
+    assert _status(match_id, player_ids[1]) == 'absent'
+
+
+def test_admin_can_exceed_capacity(player_ids):
+    """관리자는 정원을 넘겨 참석 처리 가능"""
+    match_id = _create_match(capacity=1)
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+
+    result = attendance_service.update_player_status(match_id, player_ids[1], 'present', is_admin=True)
+
+    assert result['success']
+    assert result['present_count'] == 2
+
+
+def test_leaving_full_match_is_always_allowed(player_ids):
+    """정원이 차도 불참 변경과 이미 참석인 선수의 재요청은 허용"""
+    match_id = _create_match(capacity=1)
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'absent')['present_count'] == 0
+
+
+def test_past_match_is_locked(player_ids):
+    """마감 시간이 있는 지난 경기는 관리자도 변경 불가"""
+    match_id = _create_match(match_date='2026-10-16', lock_minutes=30)
+
+    player_result = attendance_service.update_player_status(match_id, player_ids[0], 'present')
+    admin_result = attendance_service.update_player_status(match_id, player_ids[0], 'present', is_admin=True)
+
+    assert player_result['message'] == admin_result['message'] == "출석 변경 가능 시간이 지났습니다."
+    assert not player_result['success'] and not admin_result['success']
+    assert attendance_service.is_attendance_locked(match_id, now=NOW)
+    assert _status(match_id, player_ids[0]) == 'absent'
+
+
+@pytest.mark.parametrize('lock_minutes, match_date, match_time, locked', [
+    (-1, '2026-12-01', '10:00', True),    # 즉시 마감
+    (0, '2026-10-01', '10:00', False),    # 제한 없음 (지난 경기도 변경 가능)
+    (30, '2026-10-17', '12:20', True),    # 마감 시간(11:50) 지남
+    (30, '2026-10-17', '12:40', False),   # 마감 시간(12:10) 전
+])
+def test_lock_minutes_matches_service_check(player_ids, lock_minutes, match_date, match_time, locked):
+    """UPDATE 조건절의 마감 판정이 is_attendance_locked와 같음"""
+    match_id = _create_match(match_date=match_date, match_time=match_time, lock_minutes=lock_minutes)
+
+    result = attendance_repo.update_status_checked(match_id, player_ids[0], 'present', NOW_TEXT)
+
+    assert attendance_service.is_attendance_locked(match_id, now=NOW) is locked
+    assert result['updated'] is not locked
+    assert result['reason'] == ('locked' if locked else None)
+
+
+def test_null_lock_minutes_means_no_lock(player_ids, monkeypatch):
+    """attendance_lock_minutes가 NULL이면 0(제한 없음)과 같게 처리"""
+    # 컬럼은 NOT NULL이라 저장할 수 없으므로 조건절은 같은 값의 행으로 확인
+    match = {'attendance_lock_minutes': None, 'match_date': '2026-10-01', 'match_time': '10:00'}
+    with db_manager.get_connection() as conn:
+        row = conn.execute(f"""
+            SELECT {AttendanceRepository.UNLOCKED_CONDITION} AS unlocked
+            FROM (SELECT NULL AS attendance_lock_minutes, '2026-10-01' AS match_date, '10:00' AS match_time) m
+        """, (NOW_TEXT,)).fetchone()
+
+    monkeypatch.setattr(attendance_service.match_repo, 'get_by_id', lambda match_id: match)
+
+    assert row['unlocked'] == 1
+    assert attendance_service.is_attendance_locked(1, now=NOW) is False
+
+
+def test_unknown_player_is_not_found(player_ids):
+    """출석 정보가 없는 선수는 'not_found'"""
+    match_id = _create_match(capacity=1)
+
+    result = attendance_repo.update_status_checked(match_id, max(player_ids) + 100, 'present', NOW_TEXT)
+    message = attendance_service.update_player_status(match_id, max(player_ids) + 100, 'present')['message']
+
+    assert result['updated'] is False
+    assert result['reason'] == 'not_found'
+    assert message == "출석 상태 변경에 실패했습니다."
+
+
+def test_bulk_applies_absences_before_presences(player_ids):
+    """일괄 변경은 불참 변경을 먼저 반영해 같은 요청의 참석 변경이 빈 자리를 사용"""
+    match_id = _create_match(capacity=1)
+    assert attendance_service.update_player_status(match_id, player_ids[0], 'present')['success']
+
+    # 요청 순서상 참석이 먼저여도 불참 변경으로 생긴 자리를 사용
+    result = attendance_service.update_player_statuses(match_id, {player_ids[1]: 'present',
+                                                                  player_ids[0]: 'absent'})
+
+    assert result['success']
+    assert sorted(result['updated']) == sorted(player_ids[:2])
+    assert result['present_count'] == 1
+    assert _status(match_id, player_ids[0]) == 'absent'
+    assert _status(match_id, player_ids[1]) == 'present'
+
+
+def test_bulk_reports_outcome_per_player(player_ids):
+    """선수별 결과 - 변경/그대로/출석 정보 없음/정원 초과"""
+    match_id = _create_match(capacity=1)
+    unknown_id = max(player_ids) + 100
+
+    result = attendance_repo.update_statuses_bulk(match_id, {
+        player_ids[0]: 'present',
+        player_ids[1]: 'absent',
+        player_ids[2]: 'present',
+        unknown_id: 'present',
+    }, NOW_TEXT)
+
+    assert result['outcomes'] == {
+        player_ids[0]: 'updated',
+        player_ids[1]: 'unchanged',
+        player_ids[2]: 'full',
+        unknown_id: 'not_found',
+    }
+    assert result['present_count'] == 1
+    assert result['capacity'] == 1
+    assert _status(match_id, player_ids[2]) == 'absent'
+
+
+def test_bulk_service_lists_failures(player_ids):
+    """일괄 변경 서비스는 실패한 선수만 사유와 함께 반환 (잘못된 상태값 포함)"""
+    match_id = _create_match(capacity=1)
+
+    result = attendance_service.update_player_statuses(match_id, {
+        player_ids[0]: 'present',
+        player_ids[1]: 'present',
+        player_ids[2]: 'maybe',
+    })
+
+    assert not result['success']
+    assert result['updated'] == [player_ids[0]]
+    assert result['failed'] == {
+        player_ids[1]: "참석 정원이 가득 찼습니다. (정원 1명)",
+        player_ids[2]: "잘못된 상태값입니다: maybe",
+    }
+    assert result['message'] == "1명 변경, 2명 실패"
+
+
+def test_bulk_allow_over_capacity(player_ids):
+    """정원 초과 허용 시 모든 참석 변경 반영"""
+    match_id = _create_match(capacity=1)
+
+    result = attendance_service.update_player_statuses(
+        match_id, {player_id: 'present' for player_id in player_ids[:3]}, is_admin=True)
+
+    assert result['success']
+    assert result['present_count'] == 3
+    assert all(_status(match_id, player_id) == 'present' for player_id in player_ids[:3])
+
+
+def test_bulk_on_locked_match_rejects_whole_batch(player_ids):
+    """마감된 경기는 일괄 변경 전체를 거절하고 아무것도 바꾸지 않음"""
+    match_id = _create_match(match_date='2026-10-16', lock_minutes=30)
+
+    result = attendance_service.update_player_statuses(
+        match_id, {player_ids[0]: 'present', player_ids[1]: 'pending'}, is_admin=True)
+
+    assert not result['success']
+    assert result['updated'] == []
+    assert set(result['failed'].values()) == {"출석 변경 가능 시간이 지났습니다."}
+    assert _status(match_id, player_ids[0]) == _status(match_id, player_ids[1]) == 'absent'
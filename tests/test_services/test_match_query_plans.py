@@ -0,0 +1,13 @@
+"""경기 핫 쿼리 실행 계획 회귀 테스트 - matches 전체 스캔으로 바뀌면 실패"""
+from database.repositories import match_repo
+
+
+def test_hot_match_queries_have_plans(migrated_db):
+    plans = match_repo.explain_hot_queries()
+
+    assert plans
+    assert all(plans.values()), plans
+
+
+def test_hot_match_queries_use_indexes(migrated_db):
+    assert match_repo.find_full_scans() == {}
@@ -0,0 +1,117 @@
+"""콘텐츠 해시 중복 제거 서비스 테스트"""
+import hashlib
+
+import pytest
+
+from database.models import Video
+from database.repositories import video_repo, media_blob_repo
+from services.media_blob_service import media_blob_service
+from services.video_service import VideoService, get_upload_web_url, get_video_web_urls
+
+CONTENT = b'\x00\x00\x00\x20ftypisom' + b'match-video' * 100
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def video_service(migrated_db, tmp_path):
+    return VideoService(upload_dir=str(tmp_path / "uploads"))
+
+
+def _create_owner_video(video_service: VideoService, status: str = 'completed') -> int:
+    """변환까지 끝난(또는 지정한 상태의) 원본 동영상 - 파일은 원본 동영상 ID 경로에 있음"""
+    video_id = video_repo.create(Video(title='원본', description='', original_filename='match.mp4',
+                                       file_size=len(CONTENT), status='pending'))
+    original_path = video_service.get_original_path(video_id, 'match.mp4')
+    original_path.write_bytes(CONTENT)
+    media_blob_repo.acquire(SHA256, 'video', str(original_path), len(CONTENT), owner_video_id=video_id)
+    video_repo.set_content_hash(video_id, SHA256)
+
+    if status == 'completed':
+        hls_path = video_service.video_hls_dir / str(video_id) / "master.m3u8"
+        thumbnail_path = video_service.thumbnail_dir / f"{video_id}.jpg"
+        vtt_path = video_service.thumbnail_dir / str(video_id) / "previews.vtt"
+        video_repo.update_processing_status(video_id, 'completed', str(hls_path), str(thumbnail_path), 60)
+        video_repo.update_preview_vtt_path(video_id, str(vtt_path))
+    else:
+        video_repo.update_processing_status(video_id, status)
+    return video_id
+
+
+def _upload_same_content(video_service: VideoService, tmp_path, title: str = '다시 올린 영상'):
+    temp_path = tmp_path / f"{title}.part"
+    temp_path.write_bytes(CONTENT)
+    return media_blob_service.ingest_video(video_service, str(temp_path), SHA256, len(CONTENT),
+                                           'again.mp4', title)
+
+
+def test_upload_web_url_outside_upload_dir(tmp_path):
+    assert get_upload_web_url(str(tmp_path / "uploads" / "thumbnails" / "1.jpg"),
+                              str(tmp_path / "uploads")) == "/futsal/uploads/thumbnails/1.jpg"
+    assert get_upload_web_url(str(tmp_path / "other" / "1.jpg"), str(tmp_path / "uploads")) is None
+    assert get_upload_web_url(None) is None
+
+
+def test_duplicate_resolves_to_owner_files(video_service, tmp_path):
+    owner_id = _create_owner_video(video_service)
+
+    result = _upload_same_content(video_service, tmp_path)
+
+    assert result['success'] and result['duplicate_of'] == owner_id
+    duplicate = video_repo.get_by_id(result['video_id'])
+    assert duplicate['id'] != owner_id
+
+    urls = get_video_web_urls(duplicate, str(video_service.upload_dir))
+    assert urls == {
+        'hls': f"/futsal/uploads/videos/hls/{owner_id}/master.m3u8",
+        'poster': f"/futsal/uploads/thumbnails/{owner_id}.jpg",
+        'preview_base': f"/futsal/uploads/thumbnails/{owner_id}/",
+    }
+
+
+def test_owner_deleted_before_duplicates_keeps_files(video_service, tmp_path):
+    owner_id = _create_owner_video(video_service)
+    duplicate_id = _upload_same_content(video_service, tmp_path)['video_id']
+
+    # 원본 동영상을 먼저 삭제 - 공유 파일은 원본 ID 경로에 있으므로 남겨야 함
+    assert media_blob_service.release_video(video_repo.get_by_id(owner_id)) == []
+    video_repo.delete(owner_id)
+    assert media_blob_repo.get(SHA256)['ref_count'] == 1
+
+    # 마지막 참조 - 중복 동영상과 원본 동영상 ID의 파일 모두 삭제
+    assert media_blob_service.release_video(video_repo.get_by_id(duplicate_id)) == [duplicate_id, owner_id]
+    assert media_blob_repo.get(SHA256) is None
+
+
+def test_duplicate_deleted_first_purges_only_its_own_id(video_service, tmp_path):
+    owner_id = _create_owner_video(video_service)
+    duplicate_id = _upload_same_content(video_service, tmp_path)['video_id']
+
+    assert media_blob_service.release_video(video_repo.get_by_id(duplicate_id)) == [duplicate_id]
+    assert media_blob_service.release_video(video_repo.get_by_id(owner_id)) == [owner_id]
+    assert media_blob_repo.get(SHA256) is None
+
+
+@pytest.mark.parametrize('status', ['pending', 'processing', 'failed'])
+def test_duplicate_of_unfinished_video_is_rejected(video_service, tmp_path, status):
+    owner_id = _create_owner_video(video_service, status=status)
+    temp_path = tmp_path / "again.part"
+
+    temp_path.write_bytes(CONTENT)
+    result = media_blob_service.ingest_video(video_service, str(temp_path), SHA256, len(CONTENT),
+                                             'again.mp4', '다시 올린 영상')
+
+    assert not result['success']
+    assert result['duplicate_of'] == owner_id
+    assert result['video_id'] is None
+    assert not temp_path.exists()
+    assert media_blob_repo.get(SHA256)['ref_count'] == 1
+    assert [video['id'] for video in video_repo.get_all()] == [owner_id]
+
+
+def test_photo_release_reports_last_reference(migrated_db):
+    photo = {'content_sha256': 'a' * 64, 'file_path': 'uploads/gallery/a.jpg'}
+    media_blob_service.register_photo(photo['content_sha256'], photo['file_path'], 10)
+    media_blob_service.register_photo(photo['content_sha256'], photo['file_path'], 10)
+
+    assert media_blob_service.release_photo(photo) is False
+    assert media_blob_service.release_photo(photo) is True
@@ -0,0 +1,201 @@
+"""이어올리기 업로드 서비스/엔드포인트 테스트"""
+import io
+import base64
+import threading
+
+import pytest
+from flask import Flask
+
+import api.uploads as uploads_api
+from database.repositories import video_upload_repo, video_repo
+from services.resumable_upload_service import ResumableUploadService
+
+VIDEO_BYTES = b'\x00\x00\x00\x20ftypisom\x00\x00\x02\x00isomiso2avc1mp41' + bytes(range(256)) * 40
+
+
+class InterruptedStream(io.BytesIO):
+    """limit 바이트를 보낸 뒤 연결이 끊기는 요청 본문"""
+
+    def __init__(self, data: bytes, limit: int):
+        super().__init__(data)
+        self.limit = limit
+
+    def read(self, size=-1):
+        if self.tell() >= self.limit:
+            raise ConnectionResetError("client disconnected")
+        return super().read(min(size, self.limit - self.tell()))
+
+
+@pytest.fixture
+def service(migrated_db, tmp_path):
+    return ResumableUploadService(upload_dir=str(tmp_path / "uploads"))
+
+
+@pytest.fixture
+def client(service, monkeypatch):
+    monkeypatch.setattr(uploads_api, 'resumable_upload_service', service)
+    app = Flask(__name__)
+    app.register_blueprint(uploads_api.uploads_bp)
+    return app.test_client()
+
+
+def _start_upload(service: ResumableUploadService, data: bytes = VIDEO_BYTES, title: str = '경기 영상') -> str:
+    upload_id = service.create_ticket(title)
+    assert service.create_upload(upload_id, 'match.mp4', len(data))['success']
+    return upload_id
+
+
+def _patch(client, upload_id: str, offset: int, body: bytes):
+    return client.patch(f"/uploads/{upload_id}", data=body, headers={
+        'Upload-Offset': str(offset),
+        'Content-Type': 'application/offset+octet-stream',
+    })
+
+
+def test_create_upload_returns_location(service, client):
+    """티켓으로 업로드 생성 시 201 + Location, 오프셋 0"""
+    upload_id = service.create_ticket('경기 영상')
+
+    response = client.post('/uploads', headers={
+        'Upload-Ticket': upload_id,
+        'Upload-Length': str(len(VIDEO_BYTES)),
+        'Upload-Metadata': 'filename ' + base64.b64encode(b'match.mp4').decode(),
+    })
+
+    assert response.status_code == 201
+    assert response.headers['Location'].endswith(f"/uploads/{upload_id}")
+    assert response.headers['Upload-Offset'] == '0'
+    assert response.headers['X-Upload-Status'] == 'uploading'
+
+
+def test_offset_mismatch_returns_409(service, client):
+    """서버 오프셋과 다른 위치의 조각은 409, 기록하지 않음"""
+    upload_id = _start_upload(service)
+    assert _patch(client, upload_id, 0, VIDEO_BYTES[:1000]).status_code == 204
+
+    response = _patch(client, upload_id, 500, VIDEO_BYTES[500:1500])
+
+    assert response.status_code == 409
+    assert response.headers['Upload-Offset'] == '1000'
+    assert service.get_part_path(upload_id).read_bytes() == VIDEO_BYTES[:1000]
+
+
+def test_retry_after_partial_write_resumes_from_server_offset(service):
+    """연결이 끊긴 조각은 받은 만큼 기록하고, 재전송은 그 위치부터 이어서 완료"""
+    upload_id = _start_upload(service)
+    chunk = VIDEO_BYTES[:4000]
+
+    result = service.append_chunk(upload_id, 0, InterruptedStream(chunk, 1500), len(chunk))
+    assert result['success']
+    assert result['upload']['upload_offset'] == 1500
+
+    offset = service.get_status(upload_id)['upload']['upload_offset']
+    rest = VIDEO_BYTES[offset:]
+    result = service.append_chunk(upload_id, offset, io.BytesIO(rest), len(rest))
+
+    assert result['success']
+    assert result['upload']['status'] == 'completed'
+    video = video_repo.get_by_id(result['upload']['video_id'])
+    with open(video_repo.get_by_id(video['id'])['original_path'], 'rb') as f:
+        assert f.read() == VIDEO_BYTES
+
+
+def test_stale_retry_does_not_truncate_written_data(service):
+    """먼저 끝난 요청 뒤에 같은 오프셋으로 온 재시도는 잠금 안 재확인에서 거절"""
+    upload_id = _start_upload(service)
+    chunk = VIDEO_BYTES[:2000]
+    assert service.append_chunk(upload_id, 0, io.BytesIO(chunk), len(chunk))['success']
+
+    # 잠금 전 확인은 통과했지만 그 사이 다른 요청이 오프셋을 옮긴 상황
+    stale_upload = dict(video_upload_repo.get_by_id(upload_id), upload_offset=0)
+    original_get = video_upload_repo.get_by_id
+    calls = []
+
+    def get_by_id(requested_id):
+        calls.append(requested_id)
+        return stale_upload if len(calls) == 1 else original_get(requested_id)
+
+    video_upload_repo.get_by_id = get_by_id
+    try:
+        result = service.append_chunk(upload_id, 0, io.BytesIO(VIDEO_BYTES[:100]), 100)
+    finally:
+        video_upload_repo.get_by_id = original_get
+
+    assert result['reason'] == 'conflict'
+    assert service.get_part_path(upload_id).read_bytes() == chunk
+    assert original_get(upload_id)['upload_offset'] == 2000
+
+
+def test_head_does_not_finalize(service, client):
+    """전체 수신 후에도 HEAD는 상태만 보고"""
+    upload_id = _start_upload(service)
+    # 마지막 조각 기록 후 완료 처리 전에 끊긴 상황
+    service.get_part_path(upload_id).write_bytes(VIDEO_BYTES)
+    assert video_upload_repo.advance_offset(upload_id, 0, len(VIDEO_BYTES), 1)
+
+    response = client.head(f"/uploads/{upload_id}")
+
+    assert response.status_code == 200
+    assert response.headers['Upload-Offset'] == str(len(VIDEO_BYTES))
+    assert response.headers['X-Upload-Status'] == 'uploading'
+    assert video_repo.get_all() == []
+
+
+def test_concurrent_finalize_registers_one_video(service):
+    """전체 수신 후 동시에 온 요청 중 완료 처리 선점에 성공한 하나만 등록"""
+    upload_id = _start_upload(service)
+    service.get_part_path(upload_id).write_bytes(VIDEO_BYTES)
+    assert video_upload_repo.advance_offset(upload_id, 0, len(VIDEO_BYTES), 1)
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def finalize():
+        barrier.wait()
+        results.append(service.append_chunk(upload_id, len(VIDEO_BYTES), io.BytesIO(b''), 0))
+
+    threads = [threading.Thread(target=finalize) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result['success'] for result in results)
+    assert {result['upload']['status'] for result in results} <= {'finalizing', 'completed'}
+    assert len(video_repo.get_all()) == 1
+    assert video_upload_repo.get_by_id(upload_id)['status'] == 'completed'
+
+
+def test_finalize_claim_is_exclusive(service):
+    """완료 처리 선점은 한 번만 성공 (중단된 경우에만 stale_minutes 후 재선점)"""
+    upload_id = _start_upload(service)
+    assert video_upload_repo.advance_offset(upload_id, 0, len(VIDEO_BYTES), 1)
+
+    assert video_upload_repo.claim_finalize(upload_id, 30) is True
+    assert video_upload_repo.claim_finalize(upload_id, 30) is False
+    assert video_upload_repo.claim_finalize(upload_id, 0) is True
+
+
+def test_header_rejection_at_offset_zero(service, client):
+    """첫 조각이 동영상 형식이 아니면 400, 조각 파일 비우고 오프셋 유지"""
+    upload_id = _start_upload(service)
+
+    response = _patch(client, upload_id, 0, b'%PDF-1.7' + b'\x00' * 2000)
+
+    assert response.status_code == 400
+    assert response.headers['Upload-Offset'] == '0'
+    assert service.get_part_path(upload_id).read_bytes() == b''
+    assert _patch(client, upload_id, 0, VIDEO_BYTES[:1000]).status_code == 204
+
+
+def test_duplicate_content_returns_422(service, client):
+    """이미 등록된 내용이면 409가 아닌 422 + 메시지 본문"""
+    first_id = _start_upload(service, title='첫 영상')
+    assert _patch(client, first_id, 0, VIDEO_BYTES).status_code == 204
+
+    second_id = _start_upload(service, title='다시 올린 영상')
+    response = _patch(client, second_id, 0, VIDEO_BYTES)
+
+    assert response.status_code == 422
+    assert '첫 영상' in response.get_data(as_text=True)
+    assert video_upload_repo.get_by_id(second_id)['status'] == 'expired'
@@ -0,0 +1,48 @@
+"""동영상 트랜스코딩 작업 대기열 수령 테스트"""
+import sqlite3
+
+from database.connection import db_manager
+from database.migrations import run_migrations
+from database.models import Video
+from database.repositories import video_repo
+
+
+def _create_pending_video(title: str) -> int:
+    """업로드 직후처럼 pending이지만 대기열 등록 전(next_attempt_at NULL)인 동영상"""
+    return video_repo.create(Video(title=title, description='', original_filename='match.mp4',
+                                  file_size=1024, status='pending'))
+
+
+def test_enqueued_video_is_claimed_once(migrated_db):
+    """대기열에 등록된 동영상은 한 번만 processing으로 수령"""
+    video_id = _create_pending_video('경기 영상')
+    assert video_repo.claim_next_job() is None
+
+    assert video_repo.enqueue_processing(video_id, '/uploads/videos/original/1.mp4')
+    job = video_repo.claim_next_job()
+
+    assert job['id'] == video_id
+    assert job['attempts'] == 1
+    assert video_repo.get_by_id(video_id)['status'] == 'processing'
+    assert video_repo.claim_next_job() is None
+
+
+def test_pending_videos_from_before_job_queue_are_backfilled(migrated_db):
+    """마이그레이션 6 이전 pending 동영상은 마이그레이션 17 적용 후 수령 가능"""
+    legacy_id = _create_pending_video('대기열 도입 전 영상')
+
+    # 마이그레이션 16까지 적용된 DB에서 업그레이드
+    conn = sqlite3.connect(migrated_db, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA user_version = 16")
+        assert run_migrations(conn) == 1
+    finally:
+        conn.close()
+    db_manager.close_all_connections()
+
+    job = video_repo.claim_next_job()
+
+    assert job['id'] == legacy_id
+    assert job['original_path'] is None
+    assert video_repo.claim_next_job() is None
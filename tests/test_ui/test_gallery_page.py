@@ -0,0 +1,46 @@
+"""갤러리 페이지 - 사라진 사진 파일 처리 테스트"""
+from streamlit.testing.v1 import AppTest
+
+from database.repositories import gallery_repo
+
+
+def _render_summary():
+    from ui.pages.gallery import GalleryPage
+    GalleryPage().render_gallery_summary()
+
+
+def _render_first_item():
+    from database.repositories import gallery_repo
+    from ui.pages.gallery import GalleryPage
+    GalleryPage()._render_photo_item(gallery_repo.get_page(1)[0])
+
+
+def _create_missing_photo(tmp_path) -> dict:
+    """DB에는 파일이 있다고 기록됐지만 디스크에서는 사라진 사진"""
+    assert gallery_repo.create('사라진 사진', '', str(tmp_path / "gone.jpg"))
+    photo = gallery_repo.get_page(1)[0]
+    assert photo['file_exists'] == 1
+    return photo
+
+
+def test_summary_marks_missing_photo(migrated_db, tmp_path):
+    """요약에서 st.image가 실패하면 '이미지 없음' 표시 후 없다고 기록"""
+    photo = _create_missing_photo(tmp_path)
+
+    at = AppTest.from_function(_render_summary).run()
+
+    assert not at.exception
+    assert not at.error
+    assert [warning.value for warning in at.warning] == ["이미지 없음"]
+    assert gallery_repo.get_by_id(photo['id'])['file_exists'] == 0
+
+
+def test_photo_item_marks_missing_photo(migrated_db, tmp_path):
+    """갤러리 목록에서 st.image가 실패하면 안내 표시 후 없다고 기록"""
+    photo = _create_missing_photo(tmp_path)
+
+    at = AppTest.from_function(_render_first_item).run()
+
+    assert not at.exception
+    assert [error.value for error in at.error] == ["사진 파일을 찾을 수 없습니다: 사라진 사진"]
+    assert gallery_repo.get_by_id(photo['id'])['file_exists'] == 0
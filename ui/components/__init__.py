@@ -1,9 +1,32 @@
-"""UI 컴포넌트 모듈"""
+"""UI 컴포넌트 모듈
+
+app.py가 사이드바용으로 ui.components.auth를 불러올 때 달력(streamlit_calendar) 등
+다른 컴포넌트까지 import하지 않도록 처음 접근할 때 import합니다. (PEP 562 모듈 __getattr__)
+"""
+import importlib
+
+# 공개 이름 → 하위 모듈
+_LAZY_ATTRIBUTES = {
+    'calendar_component': 'calendar',
+    'metrics_component': 'metrics',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-from .calendar import calendar_component
-from .metrics import metrics_component
 
 __all__ = [
     'calendar_component',
     'metrics_component'
-]
\ No newline at end of file
+]
@@ -1,6 +1,6 @@
 """인증 관련 UI 컴포넌트"""
 import streamlit as st
-from services.auth_service import auth_service
+from services.auth_service import auth_service, VerificationUnavailableError
 from utils.auth_utils import is_admin_logged_in, get_current_admin, logout_admin
 # from utils.session_utils import save_admin_session  # 파일 기반 세션 제거
 
@@ -20,7 +20,12 @@ def render_login_form():
 
         if login_button:
             if username and password:
-                admin_info = auth_service.login(username, password)
+                try:
+                    admin_info = auth_service.login(username, password)
+                except VerificationUnavailableError:
+                    st.sidebar.warning("로그인 요청이 많아 확인하지 못했습니다. 잠시 후 다시 시도해주세요.")
+                    return
+
                 if admin_info:
                     # 세션 상태 설정
                     st.session_state['is_admin'] = True
@@ -32,6 +37,9 @@ def render_login_form():
 
                     st.sidebar.success(f"환영합니다, {admin_info['name']}님!")
                     st.rerun()
+                elif auth_service.get_lockout_remaining(username):
+                    remaining = auth_service.get_lockout_remaining(username)
+                    st.sidebar.error(f"로그인 시도가 너무 많습니다. {remaining}초 후 다시 시도해주세요.")
                 else:
                     st.sidebar.error("로그인 정보가 올바르지 않습니다.")
             else:
@@ -104,6 +112,11 @@ def render_admin_dropdown():
                 st.session_state['admin_menu_expanded'] = False
                 st.rerun()
 
+            if st.button("🩺 시스템 진단", width="stretch", key="admin_diagnostics"):
+                st.session_state['current_page'] = 'diagnostics'
+                st.session_state['admin_menu_expanded'] = False
+                st.rerun()
+
             st.markdown("")  # 공간 추가
 
             if st.button("🚪 로그아웃", width="stretch", key="admin_logout"):
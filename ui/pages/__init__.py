@@ -1,18 +1,43 @@
-"""UI 페이지 모듈"""
-
-from .dashboard import dashboard_page
-from .schedule import schedule_page
-from .players import players_page
-from .statistics import statistics_page
-from .attendance import attendance_page
-from .news import news_page
-from .gallery import gallery_page
-from .finance import finance_page
-from . import admin_settings
-from . import video_upload
-from . import video_gallery
-from . import news_management
-from . import team_builder
+"""UI 페이지 모듈
+
+페이지 모듈은 처음 접근할 때 import합니다. (PEP 562 모듈 __getattr__, ui.pages.registry)
+`from ui.pages import statistics_page`처럼 쓰면 그 시점에 해당 모듈만 불러옵니다.
+"""
+from .registry import load_page_module
+
+# 공개 이름 → (하위 모듈, 모듈 속성 - None이면 모듈 자체)
+_LAZY_ATTRIBUTES = {
+    'dashboard_page': ('dashboard', 'dashboard_page'),
+    'schedule_page': ('schedule', 'schedule_page'),
+    'players_page': ('players', 'players_page'),
+    'statistics_page': ('statistics', 'statistics_page'),
+    'attendance_page': ('attendance', 'attendance_page'),
+    'news_page': ('news', 'news_page'),
+    'gallery_page': ('gallery', 'gallery_page'),
+    'finance_page': ('finance', 'finance_page'),
+    'admin_settings': ('admin_settings', None),
+    'video_upload': ('video_upload', None),
+    'video_gallery': ('video_gallery', None),
+    'news_management': ('news_management', None),
+    'team_builder': ('team_builder', None),
+    'diagnostics': ('diagnostics', None),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = load_page_module(module_name)
+    value = getattr(module, attribute) if attribute else module
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'dashboard_page',
@@ -27,5 +52,6 @@ __all__ = [
     'video_upload',
     'video_gallery',
     'news_management',
-    'team_builder'
-]
\ No newline at end of file
+    'team_builder',
+    'diagnostics'
+]
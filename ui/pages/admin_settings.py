@@ -1,7 +1,7 @@
 """관리자 설정 페이지"""
 import streamlit as st
 from utils.auth_utils import require_admin_access, get_current_admin
-from services.auth_service import auth_service
+from services.auth_service import auth_service, VerificationUnavailableError
 
 
 def render():
@@ -211,6 +211,8 @@ def render_change_password_form(current_admin):
                     st.info("보안을 위해 다시 로그인해주세요.")
                 else:
                     st.error("비밀번호 변경에 실패했습니다. 현재 비밀번호를 확인해주세요.")
+            except VerificationUnavailableError:
+                st.warning("요청이 많아 현재 비밀번호를 확인하지 못했습니다. 잠시 후 다시 시도해주세요.")
             except Exception as e:
                 st.error(f"오류가 발생했습니다: {str(e)}")
 
@@ -0,0 +1,228 @@
+"""시스템 진단 페이지 (관리자 전용)"""
+import json
+import streamlit as st
+from database.connection import db_manager
+from database.repositories import match_repo, video_repo
+from config.settings import video_worker_config
+from services.cache_metrics import cache_metrics
+from services.cache_warmup import cache_warmup
+from ui.pages.registry import get_import_report
+from utils.auth_utils import require_admin_access
+
+
+def render():
+    """시스템 진단 페이지 렌더링"""
+    require_admin_access()
+
+    st.header("🩺 시스템 진단")
+
+    render_database_section()
+    st.divider()
+    render_query_plan_section()
+    st.divider()
+    render_cache_section()
+    st.divider()
+    render_page_import_section()
+    st.divider()
+    render_video_queue_section()
+
+
+def render_database_section():
+    """데이터베이스 PRAGMA 및 커넥션 풀 상태"""
+    st.subheader("🗄️ 데이터베이스")
+    st.caption(f"DB 파일: `{db_manager.db_path}`")
+
+    try:
+        report = db_manager.get_pragma_report()
+    except Exception as e:
+        st.error(f"PRAGMA 정보를 불러오지 못했습니다: {e}")
+        return
+
+    not_applied = [row['pragma'] for row in report if not row['applied']]
+    if not_applied:
+        st.warning(f"설정과 다르게 동작 중인 PRAGMA: {', '.join(not_applied)}")
+    else:
+        st.success("모든 연결 PRAGMA가 설정대로 적용되어 있습니다.")
+
+    st.dataframe(
+        [
+            {
+                "PRAGMA": row['pragma'],
+                "설정값": str(row['configured']),
+                "실제값": str(row['active']),
+                "적용": "✅" if row['applied'] else "⚠️",
+            }
+            for row in report
+        ],
+        width="stretch",
+        hide_index=True
+    )
+
+    st.markdown("**커넥션 풀**")
+    stats = db_manager.get_pool_stats()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("열린 연결", f"{stats['open']}/{stats['max_size']}")
+    with col2:
+        st.metric("사용 중", f"{stats['in_use']}개")
+    with col3:
+        st.metric("재사용", f"{stats['reused']:,}회")
+    with col4:
+        st.metric("대기 시간 초과", f"{stats['timeouts']}회")
+
+    with st.expander("풀 상세 통계"):
+        st.json(stats)
+
+
+def render_query_plan_section():
+    """자주 호출되는 경기 쿼리의 실행 계획 점검"""
+    st.subheader("🔍 쿼리 실행 계획")
+
+    try:
+        plans = match_repo.explain_hot_queries()
+        full_scans = match_repo.find_full_scans()
+    except Exception as e:
+        st.error(f"실행 계획을 불러오지 못했습니다: {e}")
+        return
+
+    if full_scans:
+        st.warning(f"matches 테이블 전체 스캔 발생: {', '.join(full_scans.keys())}")
+    else:
+        st.success("경기 조회 쿼리가 모두 인덱스를 사용합니다.")
+
+    st.dataframe(
+        [
+            {
+                "쿼리": name,
+                "실행 계획": " → ".join(details),
+                "상태": "⚠️" if name in full_scans else "✅",
+            }
+            for name, details in plans.items()
+        ],
+        width="stretch",
+        hide_index=True
+    )
+
+
+def render_cache_section():
+    """캐시 적중률 및 재계산 비용 (이 프로세스 기준)"""
+    st.subheader("⚡ 캐시")
+
+    render_cache_warmup_status()
+
+    snapshot = cache_metrics.snapshot()
+    st.caption(f"프로세스 시작 후 {snapshot['uptime_seconds'] // 60:,}분 동안의 통계 · session: st.cache_data, shared: 공유 디스크 캐시")
+
+    if not snapshot['caches']:
+        st.info("아직 기록된 캐시 조회가 없습니다.")
+        return
+
+    st.dataframe(
+        [
+            {
+                "캐시": name,
+                "종류": stats['tier'],
+                "조회": stats['lookups'],
+                "적중률": f"{stats['hit_rate'] * 100:.1f}%" if stats['hit_rate'] is not None else "-",
+                "미스": stats['misses'],
+                "무효화": stats['invalidations'],
+                "제거/만료": stats['evictions'],
+                "평균 재계산 (ms)": stats['avg_recompute_ms'] if stats['avg_recompute_ms'] is not None else "-",
+                "최대 재계산 (ms)": round(stats['recompute_seconds_max'] * 1000, 2),
+                "평균 크기 (KB)": round(stats['avg_payload_bytes'] / 1024, 1) if stats['avg_payload_bytes'] is not None else "-",
+            }
+            for name, stats in snapshot['caches'].items()
+        ],
+        width="stretch",
+        hide_index=True
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "📥 통계 스냅샷 (JSON)",
+            data=json.dumps(snapshot, ensure_ascii=False, indent=2),
+            file_name="cache_metrics.json",
+            mime="application/json",
+            width="stretch"
+        )
+    with col2:
+        if st.button("🔄 통계 초기화", width="stretch", key="reset_cache_metrics"):
+            cache_metrics.reset()
+            st.rerun()
+
+
+def render_cache_warmup_status():
+    """시작 시 캐시 예열 준비 상태"""
+    state = cache_warmup.get_state()
+    failed = [task['name'] for task in state['tasks'] if task['error']]
+
+    if state['status'] == 'running':
+        st.info(f"⏳ 캐시 예열 중... ({len(state['tasks'])}개 완료)")
+    elif state['status'] == 'disabled':
+        st.caption("캐시 예열 비활성화 (CACHE_WARMUP_ENABLED=0)")
+    elif state['ready'] and failed:
+        st.warning(f"캐시 예열 완료 ({state.get('seconds', 0):.2f}초) - 실패: {', '.join(failed)}")
+    elif state['ready']:
+        st.success(f"✅ 캐시 예열 완료 ({state.get('seconds', 0):.2f}초, {state.get('finished_at')})")
+    else:
+        st.caption("캐시 예열이 아직 시작되지 않았습니다.")
+
+    if state['tasks']:
+        with st.expander("예열 작업별 소요 시간"):
+            st.dataframe(
+                [
+                    {
+                        "작업": task['name'],
+                        "소요 (ms)": round(task['seconds'] * 1000, 1),
+                        "오류": task['error'] or "",
+                    }
+                    for task in state['tasks']
+                ],
+                width="stretch",
+                hide_index=True
+            )
+
+
+def render_page_import_section():
+    """이 프로세스에서 불러온 페이지 모듈과 import 비용"""
+    st.subheader("📦 페이지 모듈")
+    st.caption("페이지 모듈은 처음 열 때 import됩니다. 공통 의존성 비용은 먼저 연 페이지에 포함됩니다. "
+               "(전체 비교: `python -m ui.pages.registry`)")
+
+    report = get_import_report()
+    st.dataframe(
+        [
+            {
+                "모듈": cost['module'],
+                "import (ms)": round(cost['seconds'] * 1000, 1),
+                "새로 로드된 모듈": cost['new_modules'],
+            }
+            for cost in report
+        ],
+        width="stretch",
+        hide_index=True
+    )
+
+
+def render_video_queue_section():
+    """동영상 트랜스코딩 대기열 상태"""
+    st.subheader("🎬 동영상 변환 대기열")
+    st.caption(
+        f"동시 작업 {video_worker_config.MAX_CONCURRENT_JOBS}개 · "
+        f"작업당 ffmpeg 스레드 {video_worker_config.FFMPEG_THREADS}개 · "
+        f"최대 시도 {video_worker_config.MAX_ATTEMPTS}회"
+    )
+
+    stats = video_repo.get_queue_stats()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("대기 중", f"{stats['pending']}개")
+    with col2:
+        st.metric("처리 중", f"{stats['processing']}개")
+    with col3:
+        st.metric("완료", f"{stats['completed']}개")
+    with col4:
+        st.metric("실패", f"{stats['failed']}개")
@@ -1,10 +1,16 @@
 """사진 갤러리 페이지"""
 import streamlit as st
+from streamlit.runtime.media_file_storage import MediaFileStorageError
 import os
 from services.match_service import match_service
 from database.repositories import gallery_repo
 from config.settings import app_config
-from utils.file_security import validate_upload_file, sanitize_input, is_safe_path
+from utils.file_security import save_upload_stream, sanitize_input, is_safe_path
+from services.media_blob_service import media_blob_service
+from services.image_service import image_derivative_service
+
+# 갤러리 한 페이지 사진 수
+PHOTOS_PER_PAGE = 12
 
 class GalleryPage:
     """사진 갤러리 페이지"""
@@ -31,12 +37,6 @@ class GalleryPage:
         st.subheader("🖼️ 팀 사진 갤러리")
 
         try:
-            photos = self.gallery_repo.get_all()
-
-            if not photos:
-                st.info("업로드된 사진이 없습니다.")
-                return
-
             # 검색 및 필터
             col1, col2 = st.columns([2, 1])
 
@@ -52,76 +52,75 @@ class GalleryPage:
                 ]
                 match_filter = st.selectbox("경기별 필터", match_filter_options)
 
-            # 필터링된 사진 목록
-            filtered_photos = photos
-
-            if search_term:
-                filtered_photos = [
-                    photo for photo in filtered_photos
-                    if search_term.lower() in photo['title'].lower() or
-                       search_term.lower() in photo['description'].lower()
-                ]
-
+            selected_match_id = None
             if match_filter != "전체":
                 # 선택된 경기의 match_id 찾기
-                selected_match_id = None
-                for i, match in enumerate(matches[:20]):
+                for match in matches[:20]:
                     match_display = f"{match['match_date']} vs {match.get('opponent', '팀내 경기')}"
                     if match_display == match_filter:
                         selected_match_id = match['id']
                         break
 
-                if selected_match_id:
-                    filtered_photos = [
-                        photo for photo in filtered_photos
-                        if photo.get('match_id') == selected_match_id
-                    ]
+            # 필터 변경 시 첫 페이지로
+            filter_key = (search_term.strip(), selected_match_id)
+            if st.session_state.get('gallery_filter') != filter_key:
+                st.session_state['gallery_filter'] = filter_key
+                st.session_state['gallery_page_cursors'] = [None]
+
+            # 필터/페이지 처리는 SQL에서 (페이지 크기만큼만 조회)
+            total_photos = self.gallery_repo.count(match_id=selected_match_id, search=search_term.strip())
 
-            st.write(f"**총 {len(filtered_photos)}장의 사진**")
+            if total_photos == 0:
+                if search_term or selected_match_id:
+                    st.info("검색 조건에 맞는 사진이 없습니다.")
+                else:
+                    st.info("업로드된 사진이 없습니다.")
+                return
+
+            st.write(f"**총 {total_photos}장의 사진**")
 
             # 사진 그리드 표시
-            if filtered_photos:
-                self._render_photo_grid(filtered_photos)
-            else:
-                st.info("검색 조건에 맞는 사진이 없습니다.")
+            self._render_photo_grid(total_photos, selected_match_id, search_term.strip())
 
         except Exception as e:
             st.error(f"갤러리를 불러오는 중 오류가 발생했습니다: {e}")
 
-    def _render_photo_grid(self, photos: list) -> None:
+    def _render_photo_grid(self, total_photos: int, match_id, search: str) -> None:
         """사진 그리드 렌더링"""
-        # 페이징
-        photos_per_page = 12
-        total_pages = (len(photos) - 1) // photos_per_page + 1
+        # 페이징 - 키셋 커서 스택 (cursors[n]은 n+1 페이지를 조회할 (upload_date, id))
+        total_pages = (total_photos - 1) // PHOTOS_PER_PAGE + 1
+
+        if 'gallery_page_cursors' not in st.session_state:
+            st.session_state['gallery_page_cursors'] = [None]
 
-        if 'gallery_page' not in st.session_state:
-            st.session_state['gallery_page'] = 1
+        cursors = st.session_state['gallery_page_cursors']
+        current_page = len(cursors)
+
+        current_photos = self.gallery_repo.get_page(
+            PHOTOS_PER_PAGE, after=cursors[-1], match_id=match_id, search=search
+        )
 
         # 페이지 네비게이션
         if total_pages > 1:
             col1, col2, col3 = st.columns([1, 2, 1])
 
             with col1:
-                if st.session_state['gallery_page'] > 1:
+                if current_page > 1:
                     if st.button("◀ 이전"):
-                        st.session_state['gallery_page'] -= 1
+                        cursors.pop()
                         st.rerun()
 
             with col2:
-                st.markdown(f"<h4 style='text-align: center;'>{st.session_state['gallery_page']} / {total_pages}</h4>",
+                st.markdown(f"<h4 style='text-align: center;'>{current_page} / {total_pages}</h4>",
                            unsafe_allow_html=True)
 
             with col3:
-                if st.session_state['gallery_page'] < total_pages:
+                if current_page < total_pages and current_photos:
                     if st.button("다음 ▶"):
-                        st.session_state['gallery_page'] += 1
+                        last_photo = current_photos[-1]
+                        cursors.append((last_photo['upload_date'], last_photo['id']))
                         st.rerun()
 
-        # 현재 페이지 사진 계산
-        start_idx = (st.session_state['gallery_page'] - 1) * photos_per_page
-        end_idx = start_idx + photos_per_page
-        current_photos = photos[start_idx:end_idx]
-
         # 2열 그리드로 사진 표시 (모바일 대응)
         for i in range(0, len(current_photos), 2):
             cols = st.columns(2)
@@ -130,12 +129,35 @@ class GalleryPage:
                     with col:
                         self._render_photo_item(current_photos[i + j])
 
+    def _photo_file_exists(self, photo: dict) -> bool:
+        """사진 파일 존재 여부 (DB 캐시 사용 - 없다고 기록된 사진만 파일시스템 재확인)"""
+        if photo.get('file_exists', 1):
+            return True
+
+        if os.path.exists(photo['file_path']):
+            self.gallery_repo.set_file_exists(photo['id'], True)
+            return True
+        return False
+
+    def _show_photo_image(self, photo: dict, size: str) -> bool:
+        """사진 파생 이미지 표시 (파일이 사라졌으면 없다고 기록하고 False)"""
+        try:
+            st.image(image_derivative_service.get_display_path(photo['file_path'], size), width="stretch")
+            return True
+        except (MediaFileStorageError, FileNotFoundError):
+            # st.image는 없는 파일 경로에 MediaFileStorageError를 냄 - 원본이 사라졌으면 다음부터는 확인 없이 안내만 표시
+            if not os.path.isfile(photo['file_path']):
+                self.gallery_repo.set_file_exists(photo['id'], False)
+            return False
+
     def _render_photo_item(self, photo: dict) -> None:
         """개별 사진 아이템 렌더링"""
         try:
-            if os.path.exists(photo['file_path']):
-                # 사진 표시
-                st.image(photo['file_path'], width="stretch")
+            if self._photo_file_exists(photo):
+                # 사진 표시 (원본 대신 썸네일 파생 이미지 중 가장 작은 파일)
+                if not self._show_photo_image(photo, 'thumb'):
+                    st.error(f"사진 파일을 찾을 수 없습니다: {photo['title']}")
+                    return
 
                 # 사진 정보
                 with st.expander(f"📷 {photo['title'][:20]}..."):
@@ -148,6 +170,11 @@ class GalleryPage:
                     st.write(f"**설명**: {safe_description}")
                     st.write(f"**업로드일**: {upload_date}")
 
+                    # 크게 보기 (중간 크기 파생 이미지 - 선택했을 때만 전송)
+                    if st.checkbox("🔍 크게 보기", key=f"photo_large_{photo['id']}"):
+                        if not self._show_photo_image(photo, 'medium'):
+                            st.warning("이미지 없음")
+
                     # 연관 경기 정보
                     if photo.get('match_id'):
                         try:
@@ -181,9 +208,10 @@ class GalleryPage:
                                         st.session_state[delete_key] = False
                                         return
 
-                                    # 파일 시스템에서 삭제
-                                    if os.path.exists(photo['file_path']):
+                                    # 파일 시스템에서 삭제 (같은 파일을 공유하는 사진이 남아 있으면 유지)
+                                    if media_blob_service.release_photo(photo) and os.path.exists(photo['file_path']):
                                         os.remove(photo['file_path'])
+                                        image_derivative_service.delete_derivatives(photo['file_path'])
 
                                     # 데이터베이스에서 삭제
                                     success = self.gallery_repo.delete(photo['id'])
@@ -261,36 +289,27 @@ class GalleryPage:
                         safe_title = sanitize_input(title)
                         safe_description = sanitize_input(description) if description else ""
 
-                        # 파일 데이터 읽기
-                        file_data = uploaded_file.read()
-
-                        # 파일 보안 검증
-                        validation_result = validate_upload_file(file_data, uploaded_file.name)
+                        # 파일 보안 검증 + 스트리밍 저장 (1MB 단위, 전체를 메모리에 복사하지 않음)
+                        # 저장하면서 계산한 SHA-256으로 DB 해시 인덱스를 먼저 조회해 같은 내용이면 저장하지 않음
+                        save_result = save_upload_stream(
+                            uploaded_file, uploaded_file.name, app_config.UPLOAD_DIR,
+                            is_known_hash=media_blob_service.is_known
+                        )
 
-                        if not validation_result['is_valid']:
-                            st.error(f"파일 업로드 실패: {validation_result['error_message']}")
+                        if not save_result['is_valid']:
+                            st.error(f"파일 업로드 실패: {save_result['error_message']}")
                             return
 
-                        safe_filename = validation_result['safe_filename']
-                        file_path = os.path.join(app_config.UPLOAD_DIR, safe_filename)
-
-                        # 경로 보안 검증
-                        if not is_safe_path(file_path, app_config.UPLOAD_DIR):
-                            st.error("잘못된 파일 경로입니다.")
-                            return
+                        file_path = save_result['file_path']
 
-                        # 파일이 이미 존재하는지 확인 (중복 방지)
-                        if os.path.exists(file_path):
-                            existing_photo = self.gallery_repo.get_by_file_path(file_path)
+                        # 동일한 내용의 파일이 이미 있으면 중복 확인
+                        if save_result['already_exists']:
+                            existing_photo = self.gallery_repo.get_by_content_hash(save_result['sha256']) \
+                                or self.gallery_repo.get_by_file_path(file_path)
                             if existing_photo:
                                 st.warning("이미 동일한 사진이 업로드되어 있습니다!")
                                 return
 
-                        # 파일 저장 (보안 권한으로)
-                        with open(file_path, "wb") as f:
-                            f.write(file_data)
-                        os.chmod(file_path, 0o644)  # 읽기 전용 권한 설정
-
                         # 연관 경기 ID 찾기
                         match_id = None
                         if selected_match != "연관 없음":
@@ -301,9 +320,14 @@ class GalleryPage:
                                     break
 
                         # 데이터베이스에 저장 (정화된 데이터 사용)
-                        success = self.gallery_repo.create(safe_title, safe_description, file_path, match_id)
+                        success = self.gallery_repo.create(
+                            safe_title, safe_description, file_path, match_id, save_result['sha256']
+                        )
 
                         if success:
+                            media_blob_service.register_photo(save_result['sha256'], file_path, save_result['file_size'])
+                            # 썸네일/중간 크기/WebP 생성은 스레드 풀에서 (준비 전에는 원본 표시)
+                            image_derivative_service.submit(file_path)
                             st.success("사진이 성공적으로 업로드되었습니다!")
                             st.rerun()
                         else:
@@ -317,7 +341,8 @@ class GalleryPage:
     def render_gallery_summary(self) -> None:
         """갤러리 요약 (대시보드용)"""
         try:
-            photos = self.gallery_repo.get_all()
+            # 최근 사진 4장 + 더 있는지 확인용 1장만 조회
+            photos = self.gallery_repo.get_page(5)
 
             if photos:
                 st.subheader("📸 최근 사진")
@@ -328,8 +353,7 @@ class GalleryPage:
 
                 for i, photo in enumerate(recent_photos):
                     with cols[i]:
-                        if os.path.exists(photo['file_path']):
-                            st.image(photo['file_path'], width="stretch")
+                        if self._photo_file_exists(photo) and self._show_photo_image(photo, 'thumb'):
                             # XSS 방지를 위한 안전한 출력
                             safe_title = sanitize_input(photo['title'])
                             display_title = safe_title[:15] + "..." if len(safe_title) > 15 else safe_title
@@ -352,27 +376,22 @@ class GalleryPage:
     def render_gallery_stats(self) -> None:
         """갤러리 통계"""
         try:
-            photos = self.gallery_repo.get_all()
+            # 이번 달 업로드된 사진 수까지 SQL 집계 한 번으로 조회
+            from datetime import datetime
+            current_month = datetime.now().strftime('%Y-%m')
+            stats = self.gallery_repo.get_stats(current_month)
 
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                st.metric("총 사진 수", f"{len(photos)}장")
+                st.metric("총 사진 수", f"{stats['total']}장")
 
             with col2:
-                # 이번 달 업로드된 사진 수
-                from datetime import datetime
-                current_month = datetime.now().strftime('%Y-%m')
-                this_month_photos = [
-                    photo for photo in photos
-                    if photo.get('upload_date', '').startswith(current_month)
-                ]
-                st.metric("이번 달 업로드", f"{len(this_month_photos)}장")
+                st.metric("이번 달 업로드", f"{stats['this_month']}장")
 
             with col3:
                 # 경기 연관 사진 수
-                match_photos = [photo for photo in photos if photo.get('match_id')]
-                st.metric("경기 관련 사진", f"{len(match_photos)}장")
+                st.metric("경기 관련 사진", f"{stats['match_linked']}장")
 
         except Exception as e:
             st.error(f"갤러리 통계를 불러오는 중 오류가 발생했습니다: {e}")
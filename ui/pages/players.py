@@ -224,35 +224,42 @@ class PlayersPage:
                     )
                     attendance_updates[player['id']] = status
 
+            # 정원 확인은 기본 적용 - 관리자가 명시적으로 선택한 경우에만 초과 허용
+            allow_over_capacity = st.checkbox(
+                "정원 초과 허용",
+                value=False,
+                key=f"attendance_over_capacity_{match_id}",
+                help="체크하면 참석 정원이 가득 찬 경기에도 참석으로 변경합니다."
+            )
+
             if st.form_submit_button("출석 현황 업데이트"):
                 try:
-                    # 각 선수의 상태 변경을 개별적으로 처리
-                    update_count = 0
-                    errors = []
-
-                    for player_id, new_status in attendance_updates.items():
-                        current_status = attendance_status.get(player_id, 'present')
-
-                        # 상태가 변경된 경우만 업데이트
-                        if new_status != current_status:
-                            from services.attendance_service import attendance_service
-                            success = attendance_service.update_player_status(match_id, player_id, new_status)
-                            if success:
-                                update_count += 1
-                            else:
-                                # 실패한 선수 찾기
-                                failed_player = next((p for p in players if p['id'] == player_id), None)
-                                errors.append(failed_player['name'] if failed_player else f"선수 ID {player_id}")
-
-                    # 결과 메시지
-                    if errors:
-                        st.warning(f"일부 업데이트 실패: {', '.join(errors)}")
-
-                    if update_count > 0:
-                        st.success(f"출석 현황이 업데이트되었습니다! ({update_count}명 변경)")
-                        st.rerun()
-                    elif not errors:
+                    # 상태가 변경된 선수만 한 번에 처리
+                    changed = {
+                        player_id: new_status
+                        for player_id, new_status in attendance_updates.items()
+                        if new_status != attendance_status.get(player_id, 'present')
+                    }
+
+                    if not changed:
                         st.info("변경된 출석 상태가 없습니다.")
+                    else:
+                        from services.attendance_service import attendance_service
+                        result = attendance_service.update_player_statuses(match_id, changed,
+                                                                        is_admin=allow_over_capacity)
+
+                        # 결과 메시지
+                        if result['failed']:
+                            player_names = {p['id']: p['name'] for p in players}
+                            errors = [
+                                f"{player_names.get(player_id, f'선수 ID {player_id}')} ({reason})"
+                                for player_id, reason in result['failed'].items()
+                            ]
+                            st.warning(f"일부 업데이트 실패: {', '.join(errors)}")
+
+                        if result['updated']:
+                            st.success(f"출석 현황이 업데이트되었습니다! ({len(result['updated'])}명 변경)")
+                            st.rerun()
 
                 except Exception as e:
                     st.error(f"업데이트 실패: {e}")
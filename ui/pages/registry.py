@@ -0,0 +1,122 @@
+"""페이지 레지스트리 - 페이지 모듈을 처음 사용할 때 import
+
+공개 방문자는 대시보드/출석/소식/갤러리만 보므로 통계(pandas/plotly), 동영상, 재정 등
+관리자 페이지 모듈은 해당 페이지를 열 때까지 불러오지 않습니다.
+처음 불러올 때 걸린 시간과 함께 새로 로드된 모듈 수를 기록합니다.
+
+실행: python -m ui.pages.registry  (모든 페이지 import 비용 보고)
+"""
+import sys
+import time
+import logging
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 페이지 키 → (ui.pages 하위 모듈, 렌더 함수 경로)
+PAGES: Dict[str, tuple] = {
+    'dashboard': ('dashboard', 'dashboard_page.render'),
+    'statistics': ('statistics', 'statistics_page.render'),
+    'attendance': ('attendance', 'attendance_page.render'),
+    'news': ('news', 'news_page.render'),
+    'gallery': ('gallery', 'gallery_page.render'),
+    'video_gallery': ('video_gallery', 'render_video_gallery_page'),
+    'schedule': ('schedule', 'schedule_page.render'),
+    'players': ('players', 'players_page.render'),
+    'finance': ('finance', 'finance_page.render'),
+    'news_management': ('news_management', 'news_management_page.render'),
+    'video_upload': ('video_upload', 'render_video_upload_page'),
+    'video_logs': ('video_logs', 'render_video_logs_page'),
+    'admin_settings': ('admin_settings', 'render'),
+    'team_builder': ('team_builder', 'render'),
+    'diagnostics': ('diagnostics', 'render'),
+}
+
+_modules: Dict[str, ModuleType] = {}
+_import_costs: Dict[str, Dict[str, Any]] = {}
+_lock = threading.RLock()
+
+
+def load_page_module(module_name: str) -> ModuleType:
+    """ui.pages 하위 모듈 import (최초 1회만 import하고 비용 기록)"""
+    module = _modules.get(module_name)
+    if module is not None:
+        return module
+
+    with _lock:
+        module = _modules.get(module_name)
+        if module is not None:
+            return module
+
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        module = importlib.import_module(f"ui.pages.{module_name}")
+        seconds = time.perf_counter() - started
+
+        _import_costs[module_name] = {
+            'module': module_name,
+            'seconds': round(seconds, 4),
+            'new_modules': len(sys.modules) - modules_before,
+            'loaded_at': time.time(),
+        }
+        _modules[module_name] = module
+
+    logger.info(f"Page module loaded: {module_name} ({seconds * 1000:.0f}ms, "
+                f"{_import_costs[module_name]['new_modules']} new modules)")
+    return module
+
+
+def get_page_renderer(page: str) -> Optional[Callable[[], None]]:
+    """페이지 키에 해당하는 렌더 함수 (등록되지 않은 페이지면 None)"""
+    spec = PAGES.get(page)
+    if spec is None:
+        return None
+
+    module_name, render_path = spec
+    target: Any = load_page_module(module_name)
+    for attribute in render_path.split('.'):
+        target = getattr(target, attribute)
+    return target
+
+
+def render_page(page: str) -> bool:
+    """페이지 렌더링 (등록되지 않은 페이지면 False)"""
+    renderer = get_page_renderer(page)
+    if renderer is None:
+        return False
+    renderer()
+    return True
+
+
+def get_import_report() -> List[Dict[str, Any]]:
+    """이 프로세스에서 불러온 페이지 모듈별 import 비용 (오래 걸린 순)"""
+    with _lock:
+        return sorted((dict(cost) for cost in _import_costs.values()), key=lambda cost: -cost['seconds'])
+
+
+def main():
+    """CLI 진입점 - 새 프로세스에서 모든 페이지를 import하며 비용 보고"""
+    logging.basicConfig(level=logging.WARNING)
+
+    started = time.perf_counter()
+    failed = {}
+    for module_name, _ in PAGES.values():
+        try:
+            load_page_module(module_name)
+        except ImportError as e:
+            failed[module_name] = str(e)
+    total = time.perf_counter() - started
+
+    print(f"{'page module':<20}{'ms':>10}{'new modules':>14}")
+    for cost in get_import_report():
+        print(f"{cost['module']:<20}{cost['seconds'] * 1000:>10.1f}{cost['new_modules']:>14}")
+    for module_name, error in failed.items():
+        print(f"{module_name:<20}{'failed':>10}  {error}")
+    print(f"{'total':<20}{total * 1000:>10.1f}{len(sys.modules):>14}")
+
+
+if __name__ == "__main__":
+    main()
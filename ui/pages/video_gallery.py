@@ -1,6 +1,7 @@
 """동영상 갤러리 페이지 (공개)"""
 import streamlit as st
 from database.repositories import video_repo
+from services.video_service import get_upload_web_url, get_video_web_urls
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,6 +63,13 @@ RESPONSIVE_CSS = """
 </style>
 """
 
+# 4열 기준 카드 예상 너비 (px)와 화면비 정보가 없을 때의 기본값
+ESTIMATED_COLUMN_WIDTH = 280
+DEFAULT_ASPECT_RATIO = 16 / 9
+
+# 페이지당 동영상 수 (한 페이지에 마운트되는 플레이어는 최대 1개)
+VIDEOS_PER_PAGE = 12
+
 def render_video_gallery_page():
     """동영상 갤러리 페이지 렌더링"""
 
@@ -72,36 +80,22 @@ def render_video_gallery_page():
         st.title("🎬 동영상 갤러리")
 
     with col2:
-        # 경기 일정 필터 드롭다운
-        from database.repositories import match_repo
-
-        # 영상이 있는 경기만 가져오기
-        all_videos = video_repo.get_completed_videos()
-        match_ids_with_videos = set(v['match_id'] for v in all_videos if v.get('match_id'))
-        has_unlinked_videos = any(v.get('match_id') is None for v in all_videos)
-
-        # 드롭다운 옵션 생성 (전체 + 영상 있는 경기만)
+        # 경기 일정 필터 드롭다운 (영상이 있는 경기만 - 쿼리 1회)
         filter_options = ["전체 영상"]
         match_dict = {}
 
-        for match_id in match_ids_with_videos:
-            match = match_repo.get_by_id(match_id)
-            if match:
-                match_date = match['match_date'].split()[0] if ' ' in match['match_date'] else match['match_date']
-                field_name = match.get('field_name', '미정')
-                match_label = f"{match_date} vs {match['opponent']} @{field_name}"
-                filter_options.append(match_label)
-                match_dict[match_label] = match['id']
+        for match in video_repo.get_matches_with_videos():
+            match_date = match['match_date'].split()[0] if ' ' in match['match_date'] else match['match_date']
+            field_name = match.get('field_name') or '미정'
+            match_label = f"{match_date} vs {match['opponent']} @{field_name}"
+            filter_options.append(match_label)
+            match_dict[match_label] = match['id']
 
         # 경기 연결 안 된 영상이 있으면 옵션 추가
-        if has_unlinked_videos:
+        if video_repo.count_completed_videos(unlinked_only=True) > 0:
             filter_options.append("정보 없음")
             match_dict["정보 없음"] = None
 
-        # 날짜순 정렬 (최신순, "전체 영상"과 "정보 없음"은 고정 위치)
-        sorted_matches = sorted([opt for opt in filter_options if opt not in ["전체 영상", "정보 없음"]], reverse=True)
-        filter_options = ["전체 영상"] + sorted_matches + (["정보 없음"] if has_unlinked_videos else [])
-
         # 세션 상태 초기화
         if 'video_filter' not in st.session_state:
             st.session_state['video_filter'] = "전체 영상"
@@ -117,95 +111,91 @@ def render_video_gallery_page():
         # 필터 변경 시 페이지 리셋
         if selected_filter != st.session_state.get('video_filter'):
             st.session_state['video_filter'] = selected_filter
-            st.session_state['video_page'] = 1
+            st.session_state['video_page_cursors'] = [None]
+            st.session_state['selected_video_id'] = None
 
     st.write("")  # 공백
 
     # CSS 적용
     st.markdown(RESPONSIVE_CSS, unsafe_allow_html=True)
 
-    # 동영상 목록 조회 (필터 적용)
-    if st.session_state['video_filter'] == "전체 영상":
-        videos = video_repo.get_completed_videos()
-    elif st.session_state['video_filter'] == "정보 없음":
-        # 경기 연결 안 된 영상만 필터링
-        videos = [v for v in video_repo.get_completed_videos() if v.get('match_id') is None]
-    else:
-        # 선택된 경기의 ID로 필터링
-        selected_match_id = match_dict[st.session_state['video_filter']]
-        videos = video_repo.get_videos_by_match(selected_match_id)
+    # 필터 조건
+    selected_match_id = None
+    unlinked_only = False
+    if st.session_state['video_filter'] == "정보 없음":
+        unlinked_only = True
+    elif st.session_state['video_filter'] != "전체 영상":
+        selected_match_id = match_dict.get(st.session_state['video_filter'])
 
-    if not videos:
+    total_videos = video_repo.count_completed_videos(match_id=selected_match_id, unlinked_only=unlinked_only)
+    if total_videos == 0:
         st.info("아직 업로드된 동영상이 없습니다.")
         return
 
-    # 페이징 설정 (12개씩)
-    videos_per_page = 12
-    total_pages = (len(videos) - 1) // videos_per_page + 1
+    total_pages = (total_videos - 1) // VIDEOS_PER_PAGE + 1
 
-    if 'video_page' not in st.session_state:
-        st.session_state['video_page'] = 1
+    # 키셋 페이지네이션 커서 스택 - cursors[n]은 n+1 페이지를 조회할 (created_at, id)
+    if 'video_page_cursors' not in st.session_state:
+        st.session_state['video_page_cursors'] = [None]
 
-    # 선택된 비디오 ID 추적 (인라인 확장용)
+    # 선택된 비디오 ID 추적 (클릭한 카드만 플레이어 마운트)
     if 'selected_video_id' not in st.session_state:
         st.session_state['selected_video_id'] = None
 
+    current_videos = video_repo.get_completed_videos(
+        limit=VIDEOS_PER_PAGE,
+        after=st.session_state['video_page_cursors'][-1],
+        match_id=selected_match_id,
+        unlinked_only=unlinked_only
+    )
+
     # 페이지 네비게이션
-    if total_pages > 1:
-        col1, col2, col3 = st.columns([1, 2, 1])
-
-        with col1:
-            if st.session_state['video_page'] > 1:
-                if st.button("◀ 이전"):
-                    st.session_state['video_page'] -= 1
-                    st.rerun()
-
-        with col2:
-            st.markdown(f"<h4 style='text-align: center;'>{st.session_state['video_page']} / {total_pages}</h4>",
-                       unsafe_allow_html=True)
-
-        with col3:
-            if st.session_state['video_page'] < total_pages:
-                if st.button("다음 ▶"):
-                    st.session_state['video_page'] += 1
-                    st.rerun()
-
-    # 현재 페이지 동영상 계산
-    start_idx = (st.session_state['video_page'] - 1) * videos_per_page
-    end_idx = start_idx + videos_per_page
-    current_videos = videos[start_idx:end_idx]
-
-    # 그리드 레이아웃으로 썸네일 표시 (인라인 확장 방식)
+    render_page_navigation(current_videos, total_pages, "top")
+
+    # 그리드 레이아웃으로 포스터 표시 (클릭 시 인라인 재생)
     render_video_grid_inline(current_videos)
 
     # 하단 페이지 네비게이션
     if total_pages > 1:
         st.divider()
-        col1, col2, col3 = st.columns([1, 2, 1])
+        render_page_navigation(current_videos, total_pages, "bottom")
+
+
+def render_page_navigation(current_videos: list, total_pages: int, position: str):
+    """이전/다음 페이지 이동 (커서 스택 push/pop)"""
+    if total_pages <= 1:
+        return
+
+    cursors = st.session_state['video_page_cursors']
+    current_page = len(cursors)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
 
-        with col1:
-            if st.session_state['video_page'] > 1:
-                if st.button("◀ 이전", key="prev_bottom"):
-                    st.session_state['video_page'] -= 1
-                    st.rerun()
+    with col1:
+        if current_page > 1:
+            if st.button("◀ 이전", key=f"prev_{position}"):
+                cursors.pop()
+                st.session_state['selected_video_id'] = None
+                st.rerun()
 
-        with col2:
-            st.markdown(f"<h4 style='text-align: center;'>{st.session_state['video_page']} / {total_pages}</h4>",
-                       unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"<h4 style='text-align: center;'>{current_page} / {total_pages}</h4>",
+                   unsafe_allow_html=True)
 
-        with col3:
-            if st.session_state['video_page'] < total_pages:
-                if st.button("다음 ▶", key="next_bottom"):
-                    st.session_state['video_page'] += 1
-                    st.rerun()
+    with col3:
+        if current_page < total_pages and current_videos:
+            if st.button("다음 ▶", key=f"next_{position}"):
+                last_video = current_videos[-1]
+                cursors.append((last_video['created_at'], last_video['id']))
+                st.session_state['selected_video_id'] = None
+                st.rerun()
 
 
 def render_video_grid_inline(videos: list):
-    """비디오 그리드 렌더링 (항상 플레이어 표시)"""
+    """비디오 그리드 렌더링 (포스터 우선, 선택한 영상만 플레이어 표시)"""
     cols_per_row = 4
 
     for i in range(0, len(videos), cols_per_row):
-        # 플레이어 그리드 표시
         cols = st.columns(cols_per_row)
         for j in range(cols_per_row):
             if i + j < len(videos):
@@ -214,26 +204,20 @@ def render_video_grid_inline(videos: list):
 
 
 def render_video_player_card(video: dict):
-    """비디오 플레이어 카드 렌더링 (항상 플레이어 표시)"""
-    import os
-    from PIL import Image
-
-    # 썸네일 크기로 플레이어 높이 계산
-    thumbnail_path = video.get('thumbnail_path', f"uploads/thumbnails/{video['id']}.jpg")
-    player_height = 500  # 기본 높이
-
-    if os.path.exists(thumbnail_path):
-        try:
-            with Image.open(thumbnail_path) as img:
-                width, height = img.size
-                aspect_ratio = height / width
-                estimated_column_width = 280  # 4열 기준 예상 너비
-                player_height = int(estimated_column_width * aspect_ratio)
-        except Exception as e:
-            pass
-
-    # 플레이어 렌더링 (autoplay 제거, 수동 재생)
-    render_simple_player(video['hls_path'], video['thumbnail_path'], video['id'], player_height)
+    """비디오 카드 렌더링 - 포스터 이미지만 표시하고 재생 클릭 시 HLS 플레이어 마운트"""
+    # DB에 저장된 화면비(가로/세로)로 플레이어 높이 계산 - 썸네일 이미지를 열지 않음
+    aspect_ratio = video.get('aspect_ratio') or DEFAULT_ASPECT_RATIO
+    player_height = int(ESTIMATED_COLUMN_WIDTH / aspect_ratio)
+
+    if st.session_state.get('selected_video_id') == video['id']:
+        # 플레이어 렌더링 (autoplay 제거, 수동 재생)
+        render_simple_player(video['hls_path'], video['thumbnail_path'], video['id'], player_height,
+                             preview_vtt_path=video.get('preview_vtt_path'))
+    else:
+        render_poster(video, aspect_ratio)
+        if st.button("▶ 재생", key=f"play_video_{video['id']}", width="stretch"):
+            st.session_state['selected_video_id'] = video['id']
+            st.rerun()
 
     # 제목
     st.markdown(f"**{video['title'][:30]}{'...' if len(video['title']) > 30 else ''}**")
@@ -269,15 +253,37 @@ def render_video_player_card(video: dict):
     st.divider()
 
 
-def render_simple_player(hls_path: str, poster_path: str = None, video_id: int = None, height: int = 500):
-    """간단한 HLS 플레이어 렌더링 (autoplay 없음)"""
+def render_poster(video: dict, aspect_ratio: float):
+    """포스터 이미지 (브라우저가 썸네일 1장만 로드, 플레이어 스크립트 없음)"""
+    # 저장된 경로 기준 (중복 제거된 동영상은 원본 동영상 ID의 썸네일을 공유)
+    web_poster_path = get_upload_web_url(video.get('thumbnail_path'))
+    if web_poster_path:
+        st.markdown(
+            f"<img src='{web_poster_path}' loading='lazy' alt='' "
+            f"style='width: 100%; aspect-ratio: {aspect_ratio:.4f}; object-fit: cover; border-radius: 8px;' />",
+            unsafe_allow_html=True
+        )
+    else:
+        st.markdown(
+            f"<div style='width: 100%; aspect-ratio: {aspect_ratio:.4f}; background: #222; border-radius: 8px;'></div>",
+            unsafe_allow_html=True
+        )
+
+
+def render_simple_player(hls_path: str, poster_path: str = None, video_id: int = None, height: int = 500,
+                         preview_vtt_path: str = None):
+    """간단한 HLS 플레이어 렌더링 (autoplay 없음, 스프라이트가 있으면 탐색 바 미리보기 표시)"""
 
     # 고유 플레이어 ID
     player_id = f"video-player-{video_id}" if video_id else "video-player"
 
-    # Nginx를 통한 HLS 경로 (웹 접근 가능)
-    web_hls_path = f"/futsal/uploads/videos/hls/{video_id}/master.m3u8"
-    web_poster_path = f"/futsal/uploads/thumbnails/{video_id}.jpg" if poster_path else ""
+    # Nginx를 통한 웹 경로 - 저장된 경로 기준 (중복 제거된 동영상은 원본 동영상 ID의 파일을 공유)
+    web_urls = get_video_web_urls(
+        {'hls_path': hls_path, 'thumbnail_path': poster_path, 'preview_vtt_path': preview_vtt_path}
+    )
+    web_hls_path = web_urls['hls'] or ""
+    web_poster_path = web_urls['poster'] or ""
+    web_preview_base = web_urls['preview_base'] or ""
 
     # video.js 기반 HLS 플레이어 (상세 로깅 포함)
     player_html = f"""
@@ -298,6 +304,15 @@ def render_simple_player(hls_path: str, poster_path: str = None, video_id: int =
                 width: 100% !important;
                 height: 100% !important;
             }}
+            .seek-preview {{
+                display: none;
+                position: absolute;
+                bottom: 100%;
+                margin-bottom: 8px;
+                border: 1px solid #fff;
+                background-repeat: no-repeat;
+                pointer-events: none;
+            }}
         </style>
     </head>
     <body>
@@ -401,6 +416,54 @@ def render_simple_player(hls_path: str, poster_path: str = None, video_id: int =
                 }});
             }}
 
+            // 탐색 바 미리보기 (스프라이트 시트 WebVTT: "sprite_001.jpg#xywh=x,y,w,h")
+            var previewBase = '{web_preview_base}';
+            if (previewBase) {{
+                fetch(previewBase + 'previews.vtt').then(function(response) {{
+                    return response.ok ? response.text() : '';
+                }}).then(function(text) {{
+                    var cues = [];
+                    var pattern = /([\\d:.]+) --> ([\\d:.]+)\\s+(\\S+)#xywh=(\\d+),(\\d+),(\\d+),(\\d+)/g;
+                    var match;
+                    function toSeconds(value) {{
+                        return value.split(':').reduce(function(total, part) {{
+                            return total * 60 + parseFloat(part);
+                        }}, 0);
+                    }}
+                    while ((match = pattern.exec(text)) !== null) {{
+                        cues.push({{
+                            start: toSeconds(match[1]), end: toSeconds(match[2]), image: match[3],
+                            x: +match[4], y: +match[5], w: +match[6], h: +match[7]
+                        }});
+                    }}
+                    if (!cues.length) return;
+
+                    var progress = player.controlBar.progressControl;
+                    var preview = document.createElement('div');
+                    preview.className = 'seek-preview';
+                    progress.el().appendChild(preview);
+
+                    progress.on('mousemove', function(event) {{
+                        var rect = progress.el().getBoundingClientRect();
+                        var ratio = Math.min(Math.max((event.clientX - rect.left) / rect.width, 0), 1);
+                        var time = ratio * player.duration();
+                        var cue = cues.find(function(c) {{ return time >= c.start && time < c.end; }}) || cues[cues.length - 1];
+
+                        preview.style.width = cue.w + 'px';
+                        preview.style.height = cue.h + 'px';
+                        preview.style.backgroundImage = 'url(' + previewBase + cue.image + ')';
+                        preview.style.backgroundPosition = '-' + cue.x + 'px -' + cue.y + 'px';
+                        preview.style.left = Math.min(Math.max(event.clientX - rect.left - cue.w / 2, 0), rect.width - cue.w) + 'px';
+                        preview.style.display = 'block';
+                    }});
+                    progress.on('mouseleave', function() {{
+                        preview.style.display = 'none';
+                    }});
+                }}).catch(function(err) {{
+                    logToConsole('warn', 'preview_error', 'Seek preview unavailable', {{ message: String(err) }});
+                }});
+            }}
+
             // 페이지 언로드 시 (사용자가 페이지 떠날 때)
             window.addEventListener('beforeunload', function() {{
                 logToConsole('info', 'page_unload', 'User leaving page', {{
@@ -423,9 +486,9 @@ def render_inline_hls_player(hls_path: str, poster_path: str = None, video_id: i
     # 고유 플레이어 ID
     player_id = f"video-player-{video_id}" if video_id else "video-player"
 
-    # Nginx를 통한 HLS 경로 (웹 접근 가능)
-    web_hls_path = f"/futsal/uploads/videos/hls/{video_id}/master.m3u8"
-    web_poster_path = f"/futsal/uploads/thumbnails/{video_id}.jpg" if poster_path else ""
+    # Nginx를 통한 웹 경로 - 저장된 경로 기준 (중복 제거된 동영상은 원본 동영상 ID의 파일을 공유)
+    web_hls_path = get_upload_web_url(hls_path) or ""
+    web_poster_path = get_upload_web_url(poster_path) or ""
 
     # video.js 기반 HLS 플레이어 (썸네일과 정확히 동일한 크기)
     player_html = f"""
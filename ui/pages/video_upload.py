@@ -1,10 +1,12 @@
 """동영상 업로드 페이지 (관리자 전용)"""
 import streamlit as st
-from pathlib import Path
+from datetime import datetime
 from services.video_service import VideoService
+from services.resumable_upload_service import resumable_upload_service
+from services.media_blob_service import media_blob_service
 from database.repositories import video_repo, match_repo
-from database.models import Video
 from utils.auth_utils import require_admin_access
+from config.settings import video_worker_config, upload_api_config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +17,7 @@ def render_video_upload_page():
     require_admin_access()
 
     st.title("🎥 동영상 업로드")
-    st.write("경기 영상을 업로드하면 자동으로 HLS 스트리밍으로 변환됩니다.")
+    st.write("경기 영상을 업로드하면 백그라운드에서 자동으로 HLS 스트리밍으로 변환됩니다.")
 
     # 비디오 서비스 초기화
     video_service = VideoService()
@@ -31,19 +33,7 @@ def render_video_upload_page():
         description = st.text_area("설명", placeholder="동영상에 대한 설명을 입력하세요")
 
         # 경기 선택 (선택사항)
-        matches = match_repo.get_all()
-        match_options = ["선택 안함"] + [
-            f"{m['match_date']} {m['match_time']} - {m['opponent'] or '팀내 경기'} @ {m.get('field_name', '미정')}"
-            for m in matches
-        ]
-        match_ids = [None] + [m['id'] for m in matches]
-
-        selected_match_idx = st.selectbox(
-            "연결할 경기 (선택사항)",
-            range(len(match_options)),
-            format_func=lambda x: match_options[x]
-        )
-        selected_match_id = match_ids[selected_match_idx]
+        selected_match_id = select_match("video_upload_match")
 
         # 파일 업로드
         uploaded_file = st.file_uploader(
@@ -71,6 +61,10 @@ def render_video_upload_page():
                     selected_match_id
                 )
 
+    # 대용량 이어올리기
+    st.divider()
+    render_resumable_upload_section()
+
     # 구분선
     st.divider()
 
@@ -78,100 +72,275 @@ def render_video_upload_page():
     render_uploaded_videos_list()
 
 
-def process_video_upload(video_service: VideoService, uploaded_file, title: str,
-                        description: str, match_id: int = None):
-    """동영상 업로드 및 자동 처리"""
+def select_match(key: str):
+    """연결할 경기 선택 (선택 안함이면 None)"""
+    matches = match_repo.get_all()
+    match_options = ["선택 안함"] + [
+        f"{m['match_date']} {m['match_time']} - {m['opponent'] or '팀내 경기'} @ {m.get('field_name', '미정')}"
+        for m in matches
+    ]
+    match_ids = [None] + [m['id'] for m in matches]
+
+    selected_match_idx = st.selectbox(
+        "연결할 경기 (선택사항)",
+        range(len(match_options)),
+        format_func=lambda x: match_options[x],
+        key=key
+    )
+    return match_ids[selected_match_idx]
 
-    # 진행 상태 표시
-    progress_bar = st.progress(0)
-    status_text = st.empty()
 
-    try:
-        # 1단계: 메타데이터 생성
-        status_text.text("📝 동영상 메타데이터 생성 중...")
-        progress_bar.progress(10)
+def render_resumable_upload_section():
+    """대용량 이어올리기 - 티켓 발급 후 브라우저가 API로 조각 전송"""
+    st.subheader("📦 대용량 이어올리기")
+    st.caption(
+        "1~2GB 경기 영상이나 모바일 네트워크처럼 연결이 자주 끊기는 환경에서 사용하세요. "
+        "전송이 끊겨도 같은 파일을 다시 선택하면 이어서 올립니다."
+    )
 
-        admin_id = st.session_state.get('admin_id')
+    upload_id = st.session_state.get('resumable_upload_id')
 
-        video = Video(
-            title=title,
-            description=description,
-            original_filename=uploaded_file.name,
-            file_size=uploaded_file.size,
-            status='pending',
-            match_id=match_id,
-            uploaded_by=admin_id
-        )
+    if not upload_id:
+        with st.form("resumable_upload_form"):
+            title = st.text_input("제목*", placeholder="예: 2024년 봄 리그 결승전", key="resumable_title")
+            description = st.text_area("설명", placeholder="동영상에 대한 설명을 입력하세요", key="resumable_description")
+            match_id = select_match("resumable_upload_match")
 
-        video_id = video_repo.create(video)
+            if st.form_submit_button("📨 업로드 준비", width="stretch"):
+                if not title:
+                    st.error("제목을 입력해주세요.")
+                    return
 
-        if not video_id:
-            st.error("❌ 동영상 메타데이터 생성 실패")
-            return
+                upload_id = resumable_upload_service.create_ticket(
+                    title, description, match_id, st.session_state.get('admin_id')
+                )
+                if not upload_id:
+                    st.error("❌ 업로드 티켓 발급 실패")
+                    return
 
-        progress_bar.progress(20)
+                st.session_state['resumable_upload_id'] = upload_id
+                st.rerun()
+        return
 
-        # 2단계: 상태를 processing으로 변경
-        status_text.text("⚙️ 동영상 처리 시작...")
-        video_repo.update_processing_status(video_id, 'processing')
-        progress_bar.progress(30)
+    render_resumable_uploader(upload_id)
+
+    if st.button("🆕 새 업로드 준비", key="reset_resumable_upload"):
+        del st.session_state['resumable_upload_id']
+        st.rerun()
+
+
+def render_resumable_uploader(upload_id: str):
+    """브라우저 업로더 (파일 선택 → 조각 전송, 실패 시 서버 오프셋 확인 후 재개)"""
+    api_url = f"{upload_api_config.URL_PREFIX}/uploads"
+
+    uploader_html = f"""
+    <div style="font-family: sans-serif; font-size: 14px;">
+        <input type="file" id="file" accept=".mp4,.mov,.avi,.mkv,.webm,.m4v" />
+        <div style="margin-top: 10px; background: #eee; border-radius: 4px; height: 12px;">
+            <div id="bar" style="width: 0%; height: 100%; background: #1f77b4; border-radius: 4px;"></div>
+        </div>
+        <div id="status" style="margin-top: 8px; color: #444;">파일을 선택하면 업로드가 시작됩니다.</div>
+    </div>
+    <script>
+        var API_URL = '{api_url}';
+        var TICKET = '{upload_id}';
+        var CHUNK_SIZE = {upload_api_config.CLIENT_CHUNK_SIZE};
+        var MAX_RETRIES = 20;
+        var FINALIZE_POLL_MS = 2000;
+
+        var bar = document.getElementById('bar');
+        var statusText = document.getElementById('status');
+
+        function setStatus(message) {{
+            statusText.textContent = message;
+        }}
+
+        function formatMB(bytes) {{
+            return (bytes / (1024 * 1024)).toFixed(1) + 'MB';
+        }}
+
+        function sleep(ms) {{
+            return new Promise(function(resolve) {{ setTimeout(resolve, ms); }});
+        }}
+
+        async function failMessage(response) {{
+            return response.status + ' ' + (await response.text());
+        }}
+
+        // 업로드 생성 (같은 티켓+파일로 다시 요청하면 서버가 받은 위치를 알려줌)
+        async function createUpload(file) {{
+            var response = await fetch(API_URL, {{
+                method: 'POST',
+                headers: {{
+                    'Tus-Resumable': '1.0.0',
+                    'Upload-Ticket': TICKET,
+                    'Upload-Length': String(file.size),
+                    'Upload-Metadata': 'filename ' + btoa(unescape(encodeURIComponent(file.name)))
+                }}
+            }});
+            if (!response.ok) throw {{ fatal: true, message: await failMessage(response) }};
+            return {{
+                url: response.headers.get('Location'),
+                offset: parseInt(response.headers.get('Upload-Offset'), 10)
+            }};
+        }}
+
+        async function fetchOffset(url) {{
+            var response = await fetch(url, {{ method: 'HEAD', cache: 'no-store' }});
+            if (!response.ok) throw {{ fatal: response.status !== 502 && response.status !== 503, message: 'HEAD ' + response.status }};
+            return parseInt(response.headers.get('Upload-Offset'), 10);
+        }}
+
+        async function upload(file) {{
+            var session = await createUpload(file);
+            var offset = session.offset;
+            var retries = 0;
+            var started = Date.now();
+            var startOffset = offset;
+
+            // 전체를 보낸 뒤에는 빈 PATCH로 완료 처리(다른 요청이 등록 중이면 진행 상태)를 확인
+            while (true) {{
+                var end = Math.min(offset + CHUNK_SIZE, file.size);
+                try {{
+                    var response = await fetch(session.url, {{
+                        method: 'PATCH',
+                        headers: {{
+                            'Tus-Resumable': '1.0.0',
+                            'Upload-Offset': String(offset),
+                            'Content-Type': 'application/offset+octet-stream'
+                        }},
+                        body: file.slice(offset, end)
+                    }});
+
+                    if (response.status === 409) {{
+                        // 서버 위치와 어긋남 - 서버 기준으로 다시 맞춤
+                        offset = await fetchOffset(session.url);
+                        continue;
+                    }}
+                    if (!response.ok) {{
+                        throw {{ fatal: response.status < 500, message: await failMessage(response) }};
+                    }}
+
+                    offset = parseInt(response.headers.get('Upload-Offset'), 10);
+                    retries = 0;
+
+                    var percent = offset / file.size * 100;
+                    var speed = (offset - startOffset) / Math.max((Date.now() - started) / 1000, 0.001);
+                    bar.style.width = percent.toFixed(1) + '%';
+                    setStatus('업로드 중... ' + formatMB(offset) + ' / ' + formatMB(file.size) +
+                              ' (' + percent.toFixed(1) + '%, ' + formatMB(speed) + '/s)');
+
+                    if (offset >= file.size) {{
+                        var videoId = response.headers.get('X-Video-Id');
+                        if (videoId) return videoId;
+                        setStatus('전송 완료 - 서버에서 동영상을 등록하는 중입니다...');
+                        await sleep(FINALIZE_POLL_MS);
+                    }}
+                }} catch (error) {{
+                    if (error && error.fatal) throw error;
+                    if (++retries > MAX_RETRIES) throw {{ fatal: true, message: '네트워크 재시도 횟수 초과' }};
+
+                    // 네트워크 끊김 - 대기 후 서버가 받은 위치부터 재개
+                    var delay = Math.min(1000 * Math.pow(2, retries - 1), 30000);
+                    setStatus('연결이 끊겼습니다. ' + (delay / 1000) + '초 후 이어서 전송합니다... (' + retries + '/' + MAX_RETRIES + ')');
+                    await sleep(delay);
+                    try {{
+                        offset = await fetchOffset(session.url);
+                    }} catch (headError) {{
+                        if (headError && headError.fatal) throw headError;
+                    }}
+                }}
+            }}
+        }}
+
+        document.getElementById('file').addEventListener('change', function(event) {{
+            var file = event.target.files[0];
+            if (!file) return;
+
+            event.target.disabled = true;
+            upload(file).then(function(videoId) {{
+                bar.style.width = '100%';
+                setStatus('✅ 업로드 완료! (동영상 #' + videoId + ') 변환이 시작되면 아래 목록에서 진행률을 확인할 수 있습니다.');
+            }}).catch(function(error) {{
+                event.target.disabled = false;
+                setStatus('❌ 업로드 실패: ' + (error && error.message ? error.message : error) +
+                          ' - 같은 파일을 다시 선택하면 이어서 올립니다.');
+            }});
+        }});
+    </script>
+    """
+
+    st.components.v1.html(uploader_html, height=110, scrolling=False)
 
-        # 3단계: 완전 자동 처리 (업로드 → 트랜스코딩 → 썸네일)
-        status_text.text("🎬 동영상 자동 처리 중 (업로드 → HLS 변환 → 썸네일 생성)...")
-        status_text.caption("⚠️ 이 작업은 동영상 길이에 따라 수 분이 소요될 수 있습니다.")
 
-        result = video_service.process_video_complete(uploaded_file, video_id)
+def process_video_upload(video_service: VideoService, uploaded_file, title: str,
+                        description: str, match_id: int = None):
+    """동영상 업로드 및 변환 대기열 등록 (같은 내용의 동영상이 이미 변환되어 있으면 공유)"""
 
-        progress_bar.progress(90)
+    # 진행 상태 표시
+    progress_bar = st.progress(0)
+    status_text = st.empty()
 
-        # 4단계: 결과 처리
-        if result['success']:
-            # DB 업데이트
-            logger.info(f"Updating video {video_id} status to completed")
-            logger.info(f"HLS path: {result['hls_path']}")
-            logger.info(f"Thumbnail path: {result['thumbnail_path']}")
-            logger.info(f"Duration: {result['duration']}")
+    try:
+        # 1단계: 업로드 파일 검증
+        status_text.text("🔍 업로드 파일 검증 중...")
+        progress_bar.progress(10)
 
-            update_success = video_repo.update_processing_status(
-                video_id,
-                'completed',
-                result['hls_path'],
-                result['thumbnail_path'],
-                result['duration']
-            )
+        is_valid, message = video_service.validate_uploaded_file(uploaded_file.name, uploaded_file.size)
+        if not is_valid:
+            st.error(f"❌ {message}")
+            return
 
-            logger.info(f"DB update result: {update_success}")
+        # 2단계: 임시 파일로 스트리밍 저장 (SHA-256 계산)
+        status_text.text("💾 원본 동영상 저장 중...")
+        progress_bar.progress(20)
 
-            progress_bar.progress(100)
-            status_text.text("✅ 동영상 처리 완료!")
+        receive_result = video_service.receive_upload(uploaded_file)
+        if not receive_result['is_valid']:
+            st.error(f"❌ 동영상 저장 실패: {receive_result['error_message']}")
+            return
 
-            st.success(f"""
-            ✅ **동영상 업로드 및 처리 완료!**
+        progress_bar.progress(80)
+
+        # 3단계: 중복 확인 후 등록 (새 동영상은 변환 대기열에 추가 - HLS 변환/썸네일은 백그라운드 워커가 처리)
+        status_text.text("📥 변환 대기열에 등록 중...")
+        ingest_result = media_blob_service.ingest_video(
+            video_service,
+            receive_result['temp_path'],
+            receive_result['sha256'],
+            receive_result['file_size'],
+            uploaded_file.name,
+            title,
+            description,
+            match_id,
+            st.session_state.get('admin_id')
+        )
+
+        if not ingest_result['success']:
+            progress_bar.empty()
+            status_text.empty()
+            if ingest_result['duplicate_of']:
+                st.warning(f"⚠️ {ingest_result['message']}")
+            else:
+                st.error(f"❌ {ingest_result['message']}")
+            return
 
-            - 📁 원본 저장: {result['original_path']}
-            - 🎥 HLS 변환: {result['hls_path']}
-            - 🖼️ 썸네일: {result['thumbnail_path']}
-            - ⏱️ 재생시간: {result['duration']}초
-            - 🔄 DB 업데이트: {'성공' if update_success else '실패'}
+        progress_bar.progress(100)
+        status_text.text("✅ 업로드 완료!")
 
-            동영상이 갤러리에 공개되었습니다.
-            """)
+        if ingest_result['duplicate_of']:
+            st.success(f"✅ **동영상 등록 완료!**\n\n{ingest_result['message']}")
+            return
 
-            # 페이지 새로고침
-            st.rerun()
+        st.success("""
+        ✅ **동영상 업로드 완료!**
 
-        else:
-            # 실패 처리
-            video_repo.update_processing_status(video_id, 'failed')
-            st.error(f"❌ 동영상 처리 실패: {result['message']}")
+        HLS 변환과 썸네일 생성은 백그라운드에서 진행됩니다.
+        창을 닫아도 처리는 계속되며, 완료되면 갤러리에 자동으로 공개됩니다.
+        """)
 
     except Exception as e:
         logger.error(f"Error in video upload process: {e}")
-
-        # 에러 발생 시 상태를 failed로 업데이트 (video_id가 있는 경우만)
-        if 'video_id' in locals() and video_id:
-            video_repo.update_processing_status(video_id, 'failed')
-
         st.error(f"❌ 동영상 업로드 중 오류 발생: {str(e)}")
 
 
@@ -206,6 +375,10 @@ def render_uploaded_videos_list():
     # 동영상 목록 조회
     videos = video_repo.get_all(status_filter=filter_value)
 
+    if any(video['status'] == 'processing' for video in videos):
+        if st.button("🔄 진행률 새로고침", key="refresh_video_progress"):
+            st.rerun()
+
     if not videos:
         st.info("업로드된 동영상이 없습니다.")
         return
@@ -262,6 +435,14 @@ def render_video_view_mode(video: dict):
 
         st.write(f"**상태:** {status_icons.get(video['status'])} {status_names.get(video['status'])}")
 
+        if video['status'] == 'processing':
+            render_processing_progress(video)
+
+        if video.get('attempts'):
+            st.caption(f"처리 시도: {video['attempts']}회")
+        if video['status'] in ['pending', 'failed'] and video.get('last_error'):
+            st.caption(f"마지막 오류: {video['last_error']}")
+
         # 수정 버튼
         if st.button("✏️ 수정", key=f"edit_video_{video['id']}", width="stretch"):
             st.session_state[f"edit_mode_{video['id']}"] = True
@@ -277,6 +458,35 @@ def render_video_view_mode(video: dict):
             delete_video(video['id'])
 
 
+def render_processing_progress(video: dict):
+    """트랜스코딩 진행률/속도/남은 시간 표시"""
+    stage_names = {
+        'remux': '리먹스',
+        'transcode': 'HLS 변환',
+        'thumbnail': '썸네일 생성'
+    }
+    stage = stage_names.get(video.get('progress_stage'), '준비 중')
+    percent = video.get('progress_percent')
+
+    details = [stage]
+    if percent is not None:
+        details.append(f"{percent:.0f}%")
+    if video.get('progress_speed'):
+        details.append(f"{video['progress_speed']:.1f}x")
+    if video.get('progress_eta_seconds') is not None:
+        minutes, seconds = divmod(video['progress_eta_seconds'], 60)
+        details.append(f"남은 시간 {minutes}분 {seconds}초")
+
+    st.progress(min(int(percent or 0), 100), text=" · ".join(details))
+
+    # 진행률 갱신이 오래 멈춰 있으면 작업 멈춤 의심
+    if video.get('progress_updated_at'):
+        updated_at = datetime.strptime(video['progress_updated_at'], '%Y-%m-%d %H:%M:%S')
+        stalled_seconds = int((datetime.utcnow() - updated_at).total_seconds())
+        if stalled_seconds >= video_worker_config.STALL_WARNING_SECONDS:
+            st.warning(f"⚠️ {stalled_seconds // 60}분 {stalled_seconds % 60}초 동안 진행률 갱신 없음")
+
+
 def render_video_edit_mode(video: dict):
     """동영상 수정 모드"""
     with st.form(f"edit_form_{video['id']}"):
@@ -360,7 +570,7 @@ def retry_video_processing(video_id: int):
 
         # 원본 파일 경로 확인
         video_service = VideoService()
-        original_path = video_service.video_original_dir / f"{video_id}{Path(video['original_filename']).suffix.lower()}"
+        original_path = video_service.get_original_path(video_id, video['original_filename'])
 
         logger.info(f"Checking original file: {original_path}")
         logger.info(f"File exists: {original_path.exists()}")
@@ -393,6 +603,8 @@ def retry_video_processing(video_id: int):
                 str(thumbnail_path_obj),
                 duration
             )
+            if video_info:
+                video_repo.update_media_info(video_id, **video_service.extract_media_info(video_info))
 
             if update_success:
                 st.success("✅ DB 업데이트 완료!")
@@ -401,36 +613,12 @@ def retry_video_processing(video_id: int):
                 st.error("❌ DB 업데이트 실패")
             return
 
-        # 파일이 없으면 재처리
-        video_repo.update_processing_status(video_id, 'processing')
-
-        # 진행 상태 표시
-        with st.spinner("🎬 동영상 재처리 중..."):
-            # 동영상 정보 추출
-            video_info = video_service.get_video_info(str(original_path))
-            duration = video_info['duration'] if video_info else None
-
-            # 썸네일 생성
-            thumb_success, thumbnail_path = video_service.generate_thumbnail(str(original_path), video_id)
-
-            # HLS 트랜스코딩
-            hls_success, hls_path, hls_message = video_service.transcode_to_hls(str(original_path), video_id)
-
-            if hls_success:
-                # 성공 처리
-                video_repo.update_processing_status(
-                    video_id,
-                    'completed',
-                    hls_path,
-                    thumbnail_path,
-                    duration
-                )
-                st.success("✅ 동영상 재처리 완료!")
-                st.rerun()
-            else:
-                # 실패 처리
-                video_repo.update_processing_status(video_id, 'failed')
-                st.error(f"❌ 재처리 실패: {hls_message}")
+        # 처리된 파일이 없으면 대기열에 다시 등록
+        if video_repo.enqueue_processing(video_id, str(original_path)):
+            st.success("✅ 재처리 대기열에 등록되었습니다. 백그라운드에서 처리됩니다.")
+            st.rerun()
+        else:
+            st.error("❌ 재처리 대기열 등록 실패")
 
     except Exception as e:
         logger.error(f"Error retrying video processing: {e}")
@@ -441,9 +629,15 @@ def retry_video_processing(video_id: int):
 def delete_video(video_id: int):
     """동영상 삭제"""
     try:
-        # 파일 삭제
+        video = video_repo.get_by_id(video_id)
+        if not video:
+            st.error("동영상을 찾을 수 없습니다.")
+            return
+
+        # 파일 삭제 (다른 동영상과 공유 중인 HLS/썸네일은 마지막 참조가 사라질 때만 삭제)
         video_service = VideoService()
-        video_service.delete_video_files(video_id)
+        for purge_video_id in media_blob_service.release_video(video):
+            video_service.delete_video_files(purge_video_id)
 
         # DB 삭제
         if video_repo.delete(video_id):
@@ -3,27 +3,104 @@
 Service 계층은 Streamlit 의존성 없이 순수 비즈니스 로직을 유지하고,
 UI 계층에서 필요한 경우에만 캐싱을 적용합니다.
 
+캐시 키에 의존 테이블 버전(database.table_versions - DB 트리거로 증가)이 포함되므로
+어느 프로세스(업로드 API, 동영상 워커, 다른 Streamlit 프로세스)에서든 해당 테이블에
+쓰기가 커밋되면 다음 조회는 바로 새 데이터를 가져옵니다.
+
 TTL (Time To Live):
-- 선수/구장 데이터: 5분 (자주 변경되지 않음)
-- 경기 데이터: 1분 (상대적으로 자주 변경됨)
-- 정적 옵션: 10분 (거의 변경되지 않음)
+- 테이블 버전으로 무효화되는 데이터: 1시간
+- 현재 시각에 따라 결과가 바뀌는 데이터 (다음 경기, 이번 달 경기 수): 5분
+- 정적 옵션: 1시간
 """
+import time
+import logging
+import sqlite3
+import functools
+import threading
+from collections import OrderedDict
 import streamlit as st
 from typing import List, Dict, Any, Optional
 from datetime import date
 
+from database.table_versions import table_versions
+from services.cache_metrics import cache_metrics, payload_size
 from services.player_service import player_service
 from services.field_service import field_service
 from services.match_service import match_service
 from services.attendance_service import attendance_service
 from services.news_service import news_service
+from services.finance_service import finance_service
+
+logger = logging.getLogger(__name__)
+
+
+def cache_by_tables(*tables: str, ttl: int = 3600):
+    """의존 테이블 버전을 키에 포함하는 st.cache_data 데코레이터
+
+    버전을 읽을 수 없으면 캐시를 거치지 않고 바로 조회합니다.
+    조회마다 적중/미스, 재계산 시간, 결과 크기, 버전 변경(무효화),
+    TTL 만료/clear로 인한 재계산(제거)을 cache_metrics에 기록합니다.
+
+    Args:
+        tables: 결과가 의존하는 테이블 이름 (migrations.VERSIONED_TABLES에 등록된 테이블)
+        ttl: 캐시 유지 시간 (초)
+    """
+    def decorator(func):
+        name = func.__name__
+        state = threading.local()
+        # 이미 계산한 적 있는 키 (같은 키를 다시 계산하면 만료/제거된 것)
+        computed_keys = OrderedDict()
+        last_versions = {'value': None}
+
+        def versioned(versions, *args, **kwargs):
+            state.missed = True
+            started = time.perf_counter()
+            value = func(*args, **kwargs)
+            cache_metrics.record_miss(name, 'session', time.perf_counter() - started, payload_size(value))
+
+            key = repr((versions, args, sorted(kwargs.items())))
+            if key in computed_keys:
+                cache_metrics.record_eviction(name, 'session')
+            computed_keys[key] = True
+            computed_keys.move_to_end(key)
+            while len(computed_keys) > 1024:
+                computed_keys.popitem(last=False)
+            return value
+
+        # st.cache_data는 함수 이름/소스로 캐시를 구분하므로 래퍼마다 고유 이름 부여
+        versioned.__name__ = func.__name__
+        versioned.__qualname__ = f"{func.__qualname__}.versioned"
+        cached = st.cache_data(ttl=ttl)(versioned)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                versions = tuple(table_versions.get(*tables).values())
+            except sqlite3.Error as e:
+                logger.warning(f"Table version lookup failed for {name}: {e}")
+                return func(*args, **kwargs)
+
+            if last_versions['value'] is not None and last_versions['value'] != versions:
+                cache_metrics.record_invalidation(name, 'session')
+            last_versions['value'] = versions
+
+            state.missed = False
+            value = cached(versions, *args, **kwargs)
+            if not state.missed:
+                cache_metrics.record_hit(name, 'session')
+            return value
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorator
 
 
 # ============================================================================
 # Player Service 캐싱
 # ============================================================================
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@cache_by_tables('players')
 def get_all_players_cached() -> List[Dict[str, Any]]:
     """활성 선수 목록 조회 (캐시됨)
 
@@ -33,7 +110,7 @@ def get_all_players_cached() -> List[Dict[str, Any]]:
     return player_service.get_all_players()
 
 
-@st.cache_data(ttl=300)
+@cache_by_tables('players', 'player_stats')
 def get_player_stats_cached(player_id: int) -> Dict[str, Any]:
     """선수 통계 조회 (캐시됨)
 
@@ -46,7 +123,7 @@ def get_player_stats_cached(player_id: int) -> Dict[str, Any]:
     return player_service.get_player_stats(player_id)
 
 
-@st.cache_data(ttl=300)
+@cache_by_tables('players')
 def get_total_players_count_cached() -> int:
     """총 선수 수 조회 (캐시됨)
 
@@ -60,7 +137,7 @@ def get_total_players_count_cached() -> int:
 # Field Service 캐싱
 # ============================================================================
 
-@st.cache_data(ttl=300)  # 5분 캐시
+@cache_by_tables('fields')
 def get_available_fields_cached() -> List[Dict[str, Any]]:
     """사용 가능한 구장 목록 조회 (캐시됨)
 
@@ -74,7 +151,7 @@ def get_available_fields_cached() -> List[Dict[str, Any]]:
 # Match Service 캐싱
 # ============================================================================
 
-@st.cache_data(ttl=60)  # 1분 캐시 (경기 데이터는 자주 변경될 수 있음)
+@cache_by_tables('matches', 'fields', ttl=300)  # 현재 시각 기준이므로 5분
 def get_next_match_cached() -> Optional[Dict[str, Any]]:
     """다음 경기 조회 (캐시됨)
 
@@ -84,7 +161,7 @@ def get_next_match_cached() -> Optional[Dict[str, Any]]:
     return match_service.get_next_match()
 
 
-@st.cache_data(ttl=60)
+@cache_by_tables('matches', 'fields')
 def get_monthly_matches_cached(year: int, month: int) -> List[Dict[str, Any]]:
     """월별 경기 목록 조회 (캐시됨)
 
@@ -98,7 +175,7 @@ def get_monthly_matches_cached(year: int, month: int) -> List[Dict[str, Any]]:
     return match_service.get_monthly_matches(year, month)
 
 
-@st.cache_data(ttl=60)
+@cache_by_tables('matches', 'fields')
 def get_recent_matches_cached(limit: int = 5) -> List[Dict[str, Any]]:
     """최근 경기 조회 (캐시됨)
 
@@ -111,7 +188,7 @@ def get_recent_matches_cached(limit: int = 5) -> List[Dict[str, Any]]:
     return match_service.get_recent_matches(limit)
 
 
-@st.cache_data(ttl=60)
+@cache_by_tables('matches', 'fields')
 def get_matches_in_range_cached(start_date: date, end_date: date) -> List[Dict[str, Any]]:
     """날짜 범위로 경기 조회 (캐시됨) - 달력용
 
@@ -125,7 +202,7 @@ def get_matches_in_range_cached(start_date: date, end_date: date) -> List[Dict[s
     return match_service.get_matches_in_range(start_date, end_date)
 
 
-@st.cache_data(ttl=60)
+@cache_by_tables('matches', ttl=300)  # 현재 월 기준이므로 5분
 def get_monthly_match_count_cached() -> int:
     """이번 달 경기 수 조회 (캐시됨)
 
@@ -139,7 +216,7 @@ def get_monthly_match_count_cached() -> int:
 # Attendance Service 캐싱
 # ============================================================================
 
-@st.cache_data(ttl=600)  # 10분 캐시 (정적 데이터)
+@cache_by_tables(ttl=3600)  # 1시간 캐시 (정적 데이터)
 def get_attendance_status_options_cached() -> List[tuple]:
     """출석 상태 선택 옵션 조회 (캐시됨)
 
@@ -153,7 +230,7 @@ def get_attendance_status_options_cached() -> List[tuple]:
 # News Service 캐싱
 # ============================================================================
 
-@st.cache_data(ttl=120)  # 2분 캐시 (뉴스는 비교적 자주 변경될 수 있음)
+@cache_by_tables('news')
 def get_recent_news_cached(limit: int = 5) -> List[Dict[str, Any]]:
     """최근 뉴스 조회 (캐시됨)
 
@@ -173,33 +250,25 @@ def get_recent_news_cached(limit: int = 5) -> List[Dict[str, Any]]:
 def clear_player_cache():
     """선수 관련 캐시 무효화
 
-    사용 시점:
-    - 선수 추가/수정/삭제 후
+    쓰기 커밋 시 테이블 버전으로 자동 무효화되므로 DB 파일을 직접 교체한 경우 등에만 필요합니다.
     """
     get_all_players_cached.clear()
     get_total_players_count_cached.clear()
-    # 특정 선수 통계는 자동으로 TTL에 의해 만료됨
+    get_player_stats_cached.clear()
 
 
 def clear_field_cache():
-    """구장 관련 캐시 무효화
-
-    사용 시점:
-    - 구장 추가/수정 후
-    """
+    """구장 관련 캐시 무효화 (DB 파일을 직접 교체한 경우)"""
     get_available_fields_cached.clear()
 
 
 def clear_match_cache():
-    """경기 관련 캐시 무효화
-
-    사용 시점:
-    - 경기 추가/수정/삭제 후
-    """
+    """경기 관련 캐시 무효화 (DB 파일을 직접 교체한 경우)"""
     get_next_match_cached.clear()
     get_monthly_matches_cached.clear()
     get_recent_matches_cached.clear()
     get_matches_in_range_cached.clear()
+    get_monthly_match_count_cached.clear()
 
 
 def clear_all_cache():
@@ -210,3 +279,32 @@ def clear_all_cache():
     - 디버깅 목적
     """
     st.cache_data.clear()
+
+
+# ============================================================================
+# 시작 시 캐시 예열
+# ============================================================================
+
+def get_warmup_tasks() -> List[tuple]:
+    """프로세스 시작 시 미리 계산할 대시보드/공개 페이지 데이터
+
+    Returns:
+        [(작업 이름, 함수), ...] - services.cache_warmup에서 순서대로 실행
+    """
+    today = date.today()
+    return [
+        # 대시보드
+        ('next_match', get_next_match_cached),
+        ('monthly_match_count', get_monthly_match_count_cached),
+        ('total_players_count', get_total_players_count_cached),
+        ('recent_news', lambda: get_recent_news_cached(3)),
+        ('monthly_matches', lambda: get_monthly_matches_cached(today.year, today.month)),
+        ('recent_matches', get_recent_matches_cached),
+        # 출석/일정 페이지
+        ('all_players', get_all_players_cached),
+        ('available_fields', get_available_fields_cached),
+        # 공유 디스크 캐시 (통계/재정 집계)
+        ('leaderboard', player_service.get_leaderboard_data),
+        ('team_average_stats', player_service.get_team_average_stats),
+        ('financial_summary', finance_service.get_financial_summary),
+    ]
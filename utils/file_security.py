@@ -3,8 +3,9 @@ import os
 import re
 import hashlib
 import mimetypes
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, BinaryIO, Callable
 from config.settings import app_config
+from utils.file_streaming import stream_to_temp_file
 
 
 class FileSecurityValidator:
@@ -72,6 +73,86 @@ class FileSecurityValidator:
 
         return result
 
+    @staticmethod
+    def save_upload_stream(source: BinaryIO, filename: str, dest_dir: str,
+                           is_known_hash: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """파일 업로드 검증 + 스트리밍 저장 (파일 전체를 메모리에 올리지 않음)
+
+        파일명/확장자를 먼저 검사한 뒤 1MB 단위로 디스크에 기록하면서
+        크기 제한, 매직 바이트, SHA-256을 함께 확인합니다.
+        is_known_hash가 주어지면 최종 경로로 옮기기 전에 해시로 중복 여부를 확인합니다.
+
+        Returns:
+            Dict: {
+                'is_valid': bool,
+                'error_message': str,
+                'safe_filename': str,
+                'file_extension': str,
+                'file_path': str,
+                'sha256': str,
+                'file_size': int,
+                'already_exists': bool   # 같은 내용의 파일이 이미 있으면 True (새로 쓰지 않음)
+            }
+        """
+        result = {
+            'is_valid': False,
+            'error_message': '',
+            'safe_filename': '',
+            'file_extension': '',
+            'file_path': '',
+            'sha256': '',
+            'file_size': 0,
+            'already_exists': False
+        }
+
+        filename_check = FileSecurityValidator._validate_filename(filename)
+        if not filename_check['is_valid']:
+            result['error_message'] = filename_check['error_message']
+            return result
+
+        extension_check = FileSecurityValidator._validate_file_extension(filename)
+        if not extension_check['is_valid']:
+            result['error_message'] = extension_check['error_message']
+            return result
+
+        file_extension = extension_check['file_extension']
+
+        def header_validator(header: bytes) -> bool:
+            return FileSecurityValidator._validate_file_content(header, file_extension)['is_valid']
+
+        stream_result = stream_to_temp_file(source, dest_dir, app_config.MAX_FILE_SIZE, header_validator)
+        if not stream_result['is_valid']:
+            result['error_message'] = stream_result['error_message']
+            return result
+
+        temp_path = stream_result['temp_path']
+        safe_filename = f"{stream_result['sha256'][:16]}.{file_extension}"
+        file_path = os.path.join(dest_dir, safe_filename)
+
+        if not FileSecurityValidator.validate_file_path(file_path, dest_dir):
+            os.remove(temp_path)
+            result['error_message'] = '잘못된 파일 경로입니다.'
+            return result
+
+        already_exists = (is_known_hash is not None and is_known_hash(stream_result['sha256'])) \
+            or os.path.exists(file_path)
+        if already_exists:
+            os.remove(temp_path)
+            result['already_exists'] = True
+        else:
+            os.replace(temp_path, file_path)
+            os.chmod(file_path, 0o644)  # 읽기 전용 권한 설정
+
+        result.update({
+            'is_valid': True,
+            'safe_filename': safe_filename,
+            'file_extension': file_extension,
+            'file_path': file_path,
+            'sha256': stream_result['sha256'],
+            'file_size': stream_result['file_size']
+        })
+        return result
+
     @staticmethod
     def _validate_file_size(file_data: bytes) -> Dict[str, Any]:
         """파일 크기 검증"""
@@ -261,6 +342,14 @@ def validate_upload_file(file_data: bytes, filename: str) -> Dict[str, Any]:
     return FileSecurityValidator.validate_file_upload(file_data, filename)
 
 
+def save_upload_stream(source: BinaryIO, filename: str, dest_dir: str = None,
+                       is_known_hash: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+    """파일 업로드 검증 + 스트리밍 저장 (편의 함수)"""
+    if dest_dir is None:
+        dest_dir = app_config.UPLOAD_DIR
+    return FileSecurityValidator.save_upload_stream(source, filename, dest_dir, is_known_hash)
+
+
 def sanitize_input(text: str) -> str:
     """입력 텍스트 정화 (편의 함수)"""
     return FileSecurityValidator.sanitize_text_input(text)
@@ -0,0 +1,127 @@
+"""업로드 파일 스트리밍 저장 유틸리티
+
+파일 전체를 메모리에 올리지 않고 고정 크기 버퍼로 나누어 디스크에 기록합니다.
+기록하면서 SHA-256을 계산하고, 첫 청크에서 매직 바이트를 검사하며,
+검증이 끝난 파일만 임시 파일 → 최종 경로로 이동합니다.
+"""
+import os
+import hashlib
+import logging
+import tempfile
+from typing import Optional, Dict, Any, Callable, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# 읽기/쓰기 버퍼 크기 (업로드당 메모리 사용량 상한)
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 매직 바이트 검사에 사용하는 헤더 길이
+HEADER_SIZE = 32
+
+
+def stream_to_temp_file(source: BinaryIO, dest_dir: str, max_size: int,
+                        header_validator: Optional[Callable[[bytes], bool]] = None,
+                        chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """파일 객체를 dest_dir 안의 임시 파일로 스트리밍 저장
+
+    Args:
+        source: read(n)을 지원하는 파일 객체 (Streamlit UploadedFile, 요청 스트림 등)
+        dest_dir: 임시 파일을 만들 디렉토리 (최종 경로와 같은 파일시스템이어야 rename이 원자적)
+        max_size: 허용 최대 크기 (bytes) - 초과하는 순간 중단
+        header_validator: 첫 HEADER_SIZE 바이트를 받아 형식이 맞으면 True를 반환하는 함수
+
+    Returns:
+        Dict: {
+            'is_valid': bool,
+            'error_message': str,
+            'temp_path': str,     # 성공 시 임시 파일 경로 (호출자가 이동/삭제)
+            'sha256': str,
+            'file_size': int
+        }
+    """
+    result = {
+        'is_valid': False,
+        'error_message': '',
+        'temp_path': None,
+        'sha256': '',
+        'file_size': 0
+    }
+
+    os.makedirs(dest_dir, exist_ok=True)
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    hasher = hashlib.sha256()
+    file_size = 0
+    header_checked = header_validator is None
+
+    fd, temp_path = tempfile.mkstemp(dir=dest_dir, prefix='.upload-', suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+
+                if not header_checked:
+                    # 업로드 첫 청크에서 매직 바이트 확인 (1MB 버퍼라 헤더는 항상 첫 청크에 포함)
+                    if not header_validator(chunk[:HEADER_SIZE]):
+                        result['error_message'] = '파일 내용이 확장자와 일치하지 않습니다.'
+                        return result
+                    header_checked = True
+
+                file_size += len(chunk)
+                if file_size > max_size:
+                    max_mb = max_size / (1024 * 1024)
+                    result['error_message'] = f'파일 크기가 너무 큽니다. 최대 {max_mb:.0f}MB까지 가능합니다.'
+                    return result
+
+                hasher.update(chunk)
+                f.write(chunk)
+
+        if file_size == 0:
+            result['error_message'] = '빈 파일은 업로드할 수 없습니다.'
+            return result
+
+        result.update({
+            'is_valid': True,
+            'temp_path': temp_path,
+            'sha256': hasher.hexdigest(),
+            'file_size': file_size
+        })
+        return result
+
+    except OSError as e:
+        logger.error(f"Error streaming upload to disk: {e}")
+        result['error_message'] = f'파일 저장 중 오류가 발생했습니다: {e}'
+        return result
+
+    finally:
+        if not result['is_valid'] and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def stream_to_file(source: BinaryIO, dest_path: str, max_size: int,
+                   header_validator: Optional[Callable[[bytes], bool]] = None,
+                   chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """파일 객체를 dest_path로 스트리밍 저장 (검증 성공 시에만 최종 경로에 나타남)"""
+    result = stream_to_temp_file(
+        source, os.path.dirname(dest_path) or '.', max_size, header_validator, chunk_size
+    )
+    if not result['is_valid']:
+        return result
+
+    os.replace(result['temp_path'], dest_path)
+    result['path'] = dest_path
+    result['temp_path'] = None
+    return result
+
+
+def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """저장된 파일의 SHA-256 (고정 크기 버퍼로 순차 읽기)"""
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
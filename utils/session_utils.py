@@ -1,20 +1,15 @@
-"""세션 지속성 유틸리티"""
+"""세션 지속성 유틸리티 (admin_sessions 테이블 기반)"""
 import streamlit as st
-import json
 import hashlib
-import os
+import logging
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
+from database.repositories import admin_session_repo
 
-SESSION_DIR = "/tmp/futsal_sessions"
-SESSION_TIMEOUT_HOURS = 1  # 1시간으로 단축
-
+logger = logging.getLogger(__name__)
 
-def _get_session_file_path(session_id: str) -> str:
-    """세션 파일 경로 반환"""
-    os.makedirs(SESSION_DIR, exist_ok=True)
-    return os.path.join(SESSION_DIR, f"session_{session_id}.json")
+SESSION_TIMEOUT_HOURS = 1  # 1시간으로 단축
 
 
 def _generate_session_id() -> str:
@@ -53,33 +48,13 @@ def _generate_session_id() -> str:
     return hashlib.md5(fallback_id.encode()).hexdigest()
 
 
-def _is_session_expired(session_data: dict) -> bool:
-    """세션 만료 여부 확인"""
-    try:
-        expire_time = datetime.fromisoformat(session_data.get('expire_time', ''))
-        return datetime.now() > expire_time
-    except (ValueError, TypeError):
-        return True
-
-
 def save_admin_session(admin_data: dict):
-    """관리자 세션을 파일에 저장"""
+    """관리자 세션을 DB에 저장"""
     try:
         session_id = _generate_session_id()
-        expire_time = (datetime.now() + timedelta(hours=SESSION_TIMEOUT_HOURS)).isoformat()
-
-        session_data = {
-            'admin_id': admin_data['id'],
-            'admin_username': admin_data['username'],
-            'admin_name': admin_data['name'],
-            'admin_role': admin_data.get('role', 'admin'),
-            'expire_time': expire_time,
-            'created_at': datetime.now().isoformat()
-        }
-
-        session_file = _get_session_file_path(session_id)
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
+        if not admin_session_repo.create(session_id, admin_data, SESSION_TIMEOUT_HOURS):
+            st.error("세션 저장 실패")
+            return
 
         # 세션 ID를 Streamlit 세션에 저장
         st.session_state['_session_id'] = session_id
@@ -89,43 +64,14 @@ def save_admin_session(admin_data: dict):
 
 
 def load_admin_session() -> Optional[Dict[str, Any]]:
-    """파일에서 관리자 세션 로드"""
+    """DB에서 관리자 세션 로드 (세션 ID PK 조회 - 만료된 세션은 조회되지 않음)"""
     try:
-        session_id = st.session_state.get('_session_id')
-        if not session_id:
-            # Try to find existing session files first
-            if os.path.exists(SESSION_DIR):
-                for filename in os.listdir(SESSION_DIR):
-                    if filename.startswith('session_') and filename.endswith('.json'):
-                        file_path = os.path.join(SESSION_DIR, filename)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                session_data = json.load(f)
-                            if not _is_session_expired(session_data):
-                                # Found valid session, extract ID from filename
-                                session_id = filename.replace('session_', '').replace('.json', '')
-                                st.session_state['_session_id'] = session_id
-                                break
-                        except (json.JSONDecodeError, FileNotFoundError):
-                            continue
-
-            # If no valid session found, return None (don't create new ID here)
-            if not session_id:
-                return None
-
-        session_file = _get_session_file_path(session_id)
-
-        if not os.path.exists(session_file):
-            return None
-
-        with open(session_file, 'r', encoding='utf-8') as f:
-            session_data = json.load(f)
-
-        # 세션 만료 체크
-        if _is_session_expired(session_data):
-            os.remove(session_file)
+        session_id = st.session_state.get('_session_id') or _generate_session_id()
+        session_data = admin_session_repo.get_valid(session_id)
+        if not session_data:
             return None
 
+        st.session_state['_session_id'] = session_id
         return session_data
 
     except Exception as e:
@@ -134,13 +80,11 @@ def load_admin_session() -> Optional[Dict[str, Any]]:
 
 
 def clear_admin_session():
-    """관리자 세션 파일 삭제"""
+    """관리자 세션 삭제"""
     try:
         session_id = st.session_state.get('_session_id')
         if session_id:
-            session_file = _get_session_file_path(session_id)
-            if os.path.exists(session_file):
-                os.remove(session_file)
+            admin_session_repo.delete(session_id)
 
         # Streamlit 세션 상태 정리
         admin_keys = [
@@ -180,7 +124,7 @@ def restore_admin_session():
         st.session_state['last_activity'] = datetime.now().isoformat()
         return True
 
-    # 파일에서 세션 데이터 로드
+    # DB에서 세션 데이터 로드
     session_data = load_admin_session()
 
     if session_data and all(key in session_data for key in ['admin_id', 'admin_username', 'admin_name']):
@@ -193,13 +137,7 @@ def restore_admin_session():
         st.session_state['admin_menu_expanded'] = False
         st.session_state['last_activity'] = datetime.now().isoformat()
 
-        # Log successful session restoration
-        try:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"Session restored for admin: {session_data['admin_username']}")
-        except:
-            pass
+        logger.info(f"Session restored for admin: {session_data['admin_username']}")
 
         return True
 
@@ -207,29 +145,12 @@ def restore_admin_session():
 
 
 def cleanup_expired_sessions():
-    """만료된 세션 파일들 정리"""
+    """만료된 세션 정리 (expires_at 인덱스 범위 삭제 - 만료된 행만 탐색)"""
     try:
-        if not os.path.exists(SESSION_DIR):
-            return
-
-        current_time = datetime.now()
-        for filename in os.listdir(SESSION_DIR):
-            if filename.startswith('session_') and filename.endswith('.json'):
-                file_path = os.path.join(SESSION_DIR, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        session_data = json.load(f)
-
-                    if _is_session_expired(session_data):
-                        os.remove(file_path)
-
-                except (json.JSONDecodeError, FileNotFoundError):
-                    # 손상된 파일 삭제
-                    try:
-                        os.remove(file_path)
-                    except:
-                        pass
+        deleted = admin_session_repo.delete_expired()
+        if deleted:
+            logger.info(f"Expired admin sessions removed: {deleted}")
 
     except Exception:
         # 정리 작업 실패 시 조용히 넘어감
-        pass
\ No newline at end of file
+        pass